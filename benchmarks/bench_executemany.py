@@ -0,0 +1,76 @@
+# benchmarks/bench_executemany.py
+"""
+Insert de tabela existente em SQLite (sem rede: sobra o custo Python de preparar o lote).
+  to_sql             -> DataFrame.to_sql (reflexão, dict por linha, NaN convertido linha a linha)
+  executemany antes  -> text() + astype(object).where() + dict por linha
+  executemany direto -> INSERT posicional em cache + tuplas montadas por coluna (strategy padrão)
+Também mede só a conversão DataFrame -> parâmetros do driver (com datas em datetime64).
+Os inserts usam as datas como texto: o caminho "antes" entregava pandas.Timestamp ao
+driver, que o sqlite3 não aceita.
+Uso: python benchmarks/bench_executemany.py [linhas] [chunksize]
+"""
+import os
+import sys
+import tempfile
+import time
+import pandas as pd
+from sqlalchemy import text
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from lcr_dataengineering_sql.infra.bulk_load import _fq, _q, _rows, bulk_insert  # noqa: E402
+from lcr_dataengineering_sql.infra.engine_registry import get_engine  # noqa: E402
+from lcr_dataengineering_sql.infra.sqlalchemy_db import SqlAlchemyDb  # noqa: E402
+
+SEED = os.path.join(os.path.dirname(__file__), "..", "data", "raw", "hr_mock.csv")
+DATES = ["DateofHire", "DateofTermination", "LastPerformanceReview_Date"]
+
+def _frame(rows: int, dates: bool = False) -> pd.DataFrame:
+    seed = pd.read_csv(SEED, encoding="utf-8-sig", parse_dates=DATES if dates else None, date_format="%m/%d/%Y")
+    df = pd.concat([seed] * (rows // len(seed) + 1), ignore_index=True).iloc[:rows]
+    return df.reset_index(drop=True)
+
+def _rows_before(df: pd.DataFrame) -> list[tuple]:
+    return list(df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+
+def _executemany_before(conn, df, schema, table, chunksize):
+    names = [f"p{i}" for i in range(len(df.columns))]
+    sql = text(f"INSERT INTO {_fq(conn, schema, table)} ({', '.join(_q(conn, str(c)) for c in df.columns)}) "
+               f"VALUES ({', '.join(':' + n for n in names)})")
+    for i in range(0, len(df), chunksize):
+        conn.execute(sql, [dict(zip(names, row)) for row in _rows_before(df.iloc[i:i + chunksize])])
+    return len(df)
+
+def main(rows: int = 200_000, chunksize: int = 10_000) -> None:
+    df = _frame(rows)
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    db = SqlAlchemyDb(lambda: get_engine(url))
+    db.create_table_from_df(df, "main", "t")
+
+    def _run(fn) -> float:
+        db.execute("DELETE FROM t")
+        t0 = time.perf_counter()
+        with db.engine.begin() as conn:
+            fn(conn)
+        elapsed = time.perf_counter() - t0
+        assert db.query_all("SELECT COUNT(*) AS n FROM t")[0]["n"] == rows
+        return elapsed
+
+    results = {
+        "to_sql": _run(lambda c: bulk_insert(c, df, "main", "t", chunksize, strategy="to_sql")),
+        "executemany antes (dict por linha)": _run(lambda c: _executemany_before(c, df, "main", "t", chunksize)),
+        "executemany direto": _run(lambda c: bulk_insert(c, df, "main", "t", chunksize, strategy="executemany")),
+    }
+    base = results["to_sql"]
+    print(f"{rows:,} linhas x {len(df.columns)} colunas, chunksize={chunksize}")
+    for name, sec in results.items():
+        print(f"{name:<36} {rows / sec:12,.0f} linhas/s  ({base / sec:4.1f}x to_sql)")
+
+    typed = _frame(rows, dates=True)
+    for name, fn in (("conversão antes (astype/where)", _rows_before), ("conversão direta (por coluna)", _rows)):
+        t0 = time.perf_counter()
+        fn(typed)
+        print(f"{name:<36} {rows / (time.perf_counter() - t0):12,.0f} linhas/s")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 200_000, int(args[1]) if len(args) > 1 else 10_000)
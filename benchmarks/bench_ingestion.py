@@ -0,0 +1,241 @@
+# benchmarks/bench_ingestion.py
+"""
+Benchmark de ingestão ponta a ponta (create_and_load_csv: perfil + CREATE + carga)
+com versões escaladas do data/raw/hr_mock.csv (mesmas colunas, EmpID único).
+
+Varre tamanho x chunksize x strategy x writers; cada caso roda num processo novo
+(pico de RSS isolado, sem engine/pool aquecido do caso anterior) e grava em JSON:
+linhas/s, MB/s, pico de RSS e os tempos por estágio do LoadResult.
+
+Uso:
+  python benchmarks/bench_ingestion.py --rows 10000,100000 --chunksize 10000,100000 \\
+      --strategy auto,executemany --writers 1,2 [--url postgresql+psycopg2://...] \\
+      [--out benchmarks/results/x.json] [--baseline benchmarks/baseline.json] [--tolerance 0.15]
+  --save-baseline grava o resultado como baseline. Com --baseline, sai com código 1 se
+  algum caso ficar mais lento (linhas/s) ou mais pesado (RSS) que a tolerância.
+URLs extras também vêm de BENCH_PG_URL / BENCH_MYSQL_URL (ex.: container local).
+"""
+from __future__ import annotations
+import argparse
+import datetime as dt
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+SRC = os.path.join(ROOT, "src")
+SEED = os.path.join(ROOT, "data", "raw", "hr_mock.csv")
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".data")
+TABLE = "bench_hr_mock"
+KEY = ["backend", "rows", "chunksize", "strategy", "writers"]
+
+# ------------------- dados escalados -------------------
+
+def synthesize(rows: int, out_dir: str = DATA_DIR) -> str:
+    """hr_mock.csv repetido até `rows` linhas (EmpID deslocado a cada volta). Fica em cache no disco."""
+    import pandas as pd
+    path = os.path.join(out_dir, f"hr_mock_{rows}.csv")
+    if os.path.exists(path):
+        return path
+    os.makedirs(out_dir, exist_ok=True)
+    seed = pd.read_csv(SEED, encoding="utf-8-sig", dtype=str, keep_default_na=False)
+    base = seed["EmpID"].astype(int)
+    span = int(base.max()) - int(base.min()) + 1
+    tmp = path + ".tmp"
+    written, turn = 0, 0
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        while written < rows:
+            # blocos de ~100k linhas: 10M linhas sem segurar tudo na memória
+            reps = max(1, min(100_000 // len(seed), -(-(rows - written) // len(seed))))
+            block = pd.concat([seed] * reps, ignore_index=True).iloc[: rows - written]
+            offsets = (turn + block.index // len(seed)) * span
+            block["EmpID"] = (pd.concat([base] * reps, ignore_index=True).iloc[: len(block)] + offsets).astype(str)
+            block.to_csv(f, index=False, header=written == 0)
+            written += len(block)
+            turn += reps
+    os.replace(tmp, path)
+    return path
+
+# ------------------- um caso (processo filho) -------------------
+
+class _StrategyDb:
+    """Força a strategy do insert_df (load_csv não expõe o parâmetro)."""
+    def __init__(self, db, strategy: str):
+        self._db, self._strategy = db, strategy
+
+    def __getattr__(self, name):
+        return getattr(self._db, name)
+
+    def insert_df(self, df, schema, table, chunksize=10000, strategy="auto"):
+        return self._db.insert_df(df, schema, table, chunksize=chunksize, strategy=self._strategy)
+
+    def transaction(self):
+        from contextlib import contextmanager
+
+        @contextmanager
+        def _tx():
+            with self._db.transaction() as tx:
+                yield _StrategyDb(tx, self._strategy)
+        return _tx()
+
+def _default_schema(url: str) -> str:
+    from sqlalchemy.engine import make_url
+    u = make_url(url)
+    return {"sqlite": "main", "postgresql": "public", "mssql": "dbo"}.get(u.get_backend_name(), u.database or "")
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3  # macOS em bytes, Linux em KiB
+
+def run_case(case: dict) -> dict:
+    sys.path.insert(0, SRC)
+    from lcr_dataengineering_sql.infra.engine_registry import get_engine
+    from lcr_dataengineering_sql.infra.sqlalchemy_db import SqlAlchemyDb
+    from lcr_dataengineering_sql.features.repo import Repo
+    url = case["url"]
+    db = SqlAlchemyDb(lambda: get_engine(url))
+    schema = case.get("schema") or _default_schema(url)
+    db.execute(f"DROP TABLE IF EXISTS {db.fqtn(schema, TABLE)}")
+    db.invalidate_metadata(schema, TABLE)
+    repo = Repo(_StrategyDb(db, case["strategy"]))
+    t0 = time.perf_counter()
+    res = repo.create_and_load_csv(case["csv"], schema, TABLE, chunksize=case["chunksize"],
+                                   writers=case["writers"])
+    wall = time.perf_counter() - t0
+    count = db.query_all(f"SELECT COUNT(*) AS n FROM {db.fqtn(schema, TABLE)}")[0]["n"]
+    db.execute(f"DROP TABLE IF EXISTS {db.fqtn(schema, TABLE)}")
+    return {
+        "rows_loaded": int(count),
+        "wall_seconds": wall,
+        "rows_per_second": res.rows / wall if wall else 0.0,
+        "mb_per_second": res.bytes_read / 1e6 / wall if wall else 0.0,
+        "peak_rss_mb": _peak_rss_mb(),
+        "stages": {"parse_seconds": res.parse_seconds, "write_seconds": res.write_seconds,
+                   "parser_blocked_seconds": res.parser_blocked_seconds,
+                   "writers_idle_seconds": res.writers_idle_seconds, "pipeline_wall_seconds": res.wall_seconds,
+                   "chunks": res.chunks},
+        "chunk_sizes": res.chunk_report.sizes if res.chunk_report else None,
+    }
+
+def _spawn(case: dict) -> dict:
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", json.dumps(case)],
+                         capture_output=True, text=True)
+    if out.returncode != 0:
+        return {"error": (out.stderr.strip().splitlines() or ["?"])[-1]}
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+# ------------------- baseline -------------------
+
+def _key(r: dict) -> tuple:
+    return tuple(r[k] for k in KEY)
+
+def compare(results: list[dict], baseline: dict, tolerance: float) -> list[str]:
+    """Casos que pioraram mais que `tolerance` (fração) em linhas/s ou pico de RSS."""
+    base = {_key(r): r for r in baseline.get("results", []) if "error" not in r}
+    problems = []
+    for r in results:
+        b = base.get(_key(r))
+        if b is None:
+            continue
+        if "error" in r:
+            problems.append(f"{_key(r)}: erro ({r['error']})")
+            continue
+        if r["rows_per_second"] < b["rows_per_second"] * (1 - tolerance):
+            problems.append(f"{_key(r)}: {r['rows_per_second']:,.0f} linhas/s vs baseline {b['rows_per_second']:,.0f}")
+        if r["peak_rss_mb"] > b["peak_rss_mb"] * (1 + tolerance):
+            problems.append(f"{_key(r)}: RSS {r['peak_rss_mb']:.0f} MB vs baseline {b['peak_rss_mb']:.0f} MB")
+    return problems
+
+# ------------------- main -------------------
+
+def _ints(s: str) -> list[int]:
+    return [int(float(x)) for x in s.split(",") if x]
+
+def _sizes(s: str) -> list:
+    # chunksize aceita "auto" (AIMD) junto dos tamanhos fixos
+    return [x if x == "auto" else int(float(x)) for x in s.split(",") if x]
+
+def _meta() -> dict:
+    import pandas as pd
+    import sqlalchemy
+    try:
+        commit = subprocess.run(["git", "-C", ROOT, "rev-parse", "--short", "HEAD"],
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    return {"timestamp": dt.datetime.now().isoformat(timespec="seconds"), "commit": commit,
+            "python": platform.python_version(), "platform": platform.platform(),
+            "pandas": pd.__version__, "sqlalchemy": sqlalchemy.__version__, "cpus": os.cpu_count()}
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark de ingestão (hr_mock escalado)")
+    ap.add_argument("--rows", default="10000,100000")
+    ap.add_argument("--chunksize", default="10000,100000,auto")
+    ap.add_argument("--strategy", default="auto")
+    ap.add_argument("--writers", default="1,2")
+    ap.add_argument("--url", action="append", help="URL SQLAlchemy (repetível); padrão: SQLite temporário")
+    ap.add_argument("--schema", default="")
+    ap.add_argument("--out", default="")
+    ap.add_argument("--baseline", default="")
+    ap.add_argument("--save-baseline", default="")
+    ap.add_argument("--tolerance", type=float, default=0.15)
+    ap.add_argument("--case", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.case:
+        print(json.dumps(run_case(json.loads(args.case))))
+        return 0
+
+    urls = list(args.url or [])
+    urls += [u for u in (os.getenv("BENCH_PG_URL"), os.getenv("BENCH_MYSQL_URL")) if u]
+    if not urls:
+        urls = [f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"]
+
+    results = []
+    for rows in _ints(args.rows):
+        csv = synthesize(rows)
+        for url in urls:
+            backend = url.split(":", 1)[0].split("+", 1)[0]
+            for chunksize in _sizes(args.chunksize):
+                for strategy in args.strategy.split(","):
+                    for writers in _ints(args.writers):
+                        if backend == "sqlite" and writers > 1:
+                            continue  # SQLite serializa escrita: paralelismo só mede contenção de lock
+                        case = {"backend": backend, "rows": rows, "chunksize": chunksize,
+                                "strategy": strategy, "writers": writers}
+                        r = {**case, **_spawn({**case, "url": url, "csv": csv, "schema": args.schema})}
+                        results.append(r)
+                        if "error" in r:
+                            print(f"{backend:10s} {rows:>10,} chunk={chunksize!s:<8} {strategy:12s} w={writers}"
+                                  f"  ERRO: {r['error']}")
+                        else:
+                            print(f"{backend:10s} {rows:>10,} chunk={chunksize!s:<8} {strategy:12s} w={writers}"
+                                  f"  {r['rows_per_second']:>12,.0f} linhas/s  {r['peak_rss_mb']:7.0f} MB"
+                                  f"  parse {r['stages']['parse_seconds']:.2f}s"
+                                  f"  escrita {r['stages']['write_seconds']:.2f}s")
+
+    report = {"meta": _meta(), "results": results}
+    out = args.out or os.path.join(os.path.dirname(os.path.abspath(__file__)), "results",
+                                   f"ingestion_{dt.datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    for path in filter(None, [out, args.save_baseline]):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    print(f"resultado: {out}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            problems = compare(results, json.load(f), args.tolerance)
+        for p in problems:
+            print(f"REGRESSÃO {p}")
+        if problems:
+            return 1
+    return 1 if any("error" in r for r in results) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+# benchmarks/bench_parallel_parse.py
+"""
+Só o parse (sem banco): pd.read_csv(chunksize=...) serial contra utils.csv_ranges.parallel_frames
+com N processos, sobre o hr_mock escalado do bench_ingestion. Confere que o total de linhas
+é o mesmo do serial em todos os casos.
+Uso: python benchmarks/bench_parallel_parse.py [--rows 2000000] [--processes 1,2,4,8] [--range-mb 16]
+"""
+import argparse
+import os
+import sys
+import time
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, os.path.dirname(__file__))
+from bench_ingestion import synthesize  # noqa: E402
+from lcr_dataengineering_sql.utils.csv_ranges import parallel_frames  # noqa: E402
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark de parse paralelo por faixas de bytes")
+    ap.add_argument("--rows", type=int, default=2_000_000)
+    ap.add_argument("--processes", default="1,2,4,8")
+    ap.add_argument("--range-mb", type=float, default=16)
+    args = ap.parse_args()
+
+    path = synthesize(args.rows)
+    mb = os.path.getsize(path) / 1e6
+    t0 = time.perf_counter()
+    with pd.read_csv(path, chunksize=100_000, low_memory=False) as it:
+        serial = sum(len(df) for df in it)
+    base = time.perf_counter() - t0
+    print(f"{mb:,.0f} MB, {os.cpu_count()} CPUs")
+    print(f"{'serial (chunksize)':<20} {mb / base:8.1f} MB/s  {serial:,} linhas")
+    for p in (int(x) for x in args.processes.split(",") if x):
+        t0 = time.perf_counter()
+        rows = sum(len(df) for _, df in parallel_frames(path, p, range_bytes=int(args.range_mb * (1 << 20)),
+                                                        low_memory=False))
+        elapsed = time.perf_counter() - t0
+        assert rows == serial, (rows, serial)
+        print(f"{f'{p} processos':<20} {mb / elapsed:8.1f} MB/s  ({base / elapsed:4.1f}x serial)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
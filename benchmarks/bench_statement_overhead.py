@@ -0,0 +1,56 @@
+# benchmarks/bench_statement_overhead.py
+"""
+Custo por chamada de execute/query_all em SQLite (sem rede: sobra só o overhead Python).
+  antes  -> create_engine + text() a cada statement (provider antigo)
+  depois -> SqlAlchemyDb com engine do registry, TextClause em cache e dialect resolvido uma vez
+Uso: python benchmarks/bench_statement_overhead.py [N]
+"""
+import os
+import sys
+import tempfile
+import time
+from sqlalchemy import create_engine, text
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from lcr_dataengineering_sql.infra.engine_registry import get_engine  # noqa: E402
+from lcr_dataengineering_sql.infra.sqlalchemy_db import SqlAlchemyDb, _quote, _text  # noqa: E402
+
+SQL = "SELECT id, nome FROM t WHERE id = :id"
+
+def _per_call_us(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    return (time.perf_counter() - t0) / n * 1e6
+
+def main(n: int = 2000) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    url = f"sqlite:///{path}"
+    db = SqlAlchemyDb(lambda: get_engine(url))
+    db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, nome TEXT)")
+    db.execute("INSERT INTO t (id, nome) VALUES (1, 'a')")
+    dialect = db.dialect
+
+    def before_query(i):
+        eng = create_engine(url, future=True)
+        with eng.connect() as conn:
+            conn.execute(text(SQL), {"id": 1}).mappings().all()
+        eng.dispose()
+
+    def after_query(i):
+        db.query_all(SQL, {"id": 1})
+
+    results = {
+        "query_all antes (engine novo + text())": _per_call_us(before_query, max(n // 10, 1)),
+        "query_all depois (registry + cache)": _per_call_us(after_query, n),
+        "text() por chamada": _per_call_us(lambda i: text(SQL), n * 10),
+        "_text() em cache": _per_call_us(lambda i: _text(SQL), n * 10),
+        "quote via provider (antes)": _per_call_us(
+            lambda i: create_engine(url).dialect.identifier_preparer.quote("MOCHRD_EMPID"), max(n // 10, 1)),
+        "quote via dialect resolvido (depois)": _per_call_us(lambda i: _quote(dialect, "MOCHRD_EMPID"), n * 10),
+    }
+    for name, us in results.items():
+        print(f"{name:<42} {us:10.2f} us/chamada")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
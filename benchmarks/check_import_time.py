@@ -0,0 +1,48 @@
+# benchmarks/check_import_time.py
+"""
+Orçamento de import para CLIs curtas (ex.: só um ping): importar os containers
+não pode puxar pandas/pyarrow nem passar do tempo limite (python -X importtime,
+processo novo a cada medição; vale a melhor de N rodadas).
+Uso: python benchmarks/check_import_time.py [budget_ms] [rodadas]
+Sai com código 1 se estourar o orçamento (dá para usar num CI).
+"""
+import os
+import subprocess
+import sys
+
+MODULES = ["lcr_dataengineering_sql.container", "lcr_dataengineering_sql.container_multi",
+           "lcr_dataengineering_sql.infra.sqlalchemy_db", "lcr_dataengineering_sql.core.ports"]
+FORBIDDEN = ["pandas", "pyarrow", "numpy"]
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+def _measure(module: str) -> tuple[float, set[str]]:
+    env = dict(os.environ, PYTHONPATH=SRC + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                         env=env, capture_output=True, text=True, check=True).stderr
+    total_us, loaded = 0, set()
+    for line in out.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        loaded.add(name.split(".")[0])
+        if name == module:
+            total_us = int(cumulative)
+    return total_us / 1000, loaded
+
+def main(budget_ms: float = 600.0, runs: int = 3) -> int:
+    failed = False
+    for module in MODULES:
+        results = [_measure(module) for _ in range(runs)]
+        best_ms = min(ms for ms, _ in results)
+        heavy = sorted(set(FORBIDDEN) & results[0][1])
+        status = "ok"
+        if heavy or best_ms > budget_ms:
+            status, failed = "FALHOU", True
+        print(f"{module:45s} {best_ms:8.1f} ms (orçamento {budget_ms:.0f} ms)"
+              f"  pesados: {', '.join(heavy) or '-'}  [{status}]")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    sys.exit(main(float(args[0]) if args else 600.0, int(args[1]) if len(args) > 1 else 3))
@@ -1,21 +1,38 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import os
-import dotenv
 
-dotenv.load_dotenv()
+@lru_cache(maxsize=None)
+def load_env() -> None:
+    """Carrega o .env uma única vez, no primeiro uso (não no import)."""
+    import dotenv
+    dotenv.load_dotenv()
+
+def _env(key: str, default: str):
+    # default_factory: lido quando o config é instanciado, já com o .env carregado
+    def _get() -> str:
+        load_env()
+        return os.getenv(key, default)
+    return field(default_factory=_get)
+
+def _env_int(key: str, default: str):
+    return field(default_factory=lambda: int(_env(key, default).default_factory()))
+
+def _env_bool(key: str, default: str):
+    return field(default_factory=lambda: _env(key, default).default_factory().lower() in ("yes", "true", "1"))
 
 @dataclass
 class DbConfig:
-    server: str = os.getenv("MSSQL_SERVER", "localhost")
-    port: str = os.getenv("MSSQL_PORT", "1433")
-    database: str = os.getenv("MSSQL_DATABASE", "master")
-    username: str = os.getenv("MSSQL_USERNAME", "")
-    password: str = os.getenv("MSSQL_PASSWORD", "")
-    trusted: str = os.getenv("MSSQL_TRUSTED_CONNECTION", "no").lower()  # "yes" ou "no"
+    server: str = _env("MSSQL_SERVER", "localhost")
+    port: str = _env("MSSQL_PORT", "1433")
+    database: str = _env("MSSQL_DATABASE", "master")
+    username: str = _env("MSSQL_USERNAME", "")
+    password: str = _env("MSSQL_PASSWORD", "")
+    trusted: str = _env("MSSQL_TRUSTED_CONNECTION", "no")  # "yes" ou "no"
 
     def sqlalchemy_url(self) -> str:
         driver = "ODBC Driver 18 for SQL Server"
-        if self.trusted in ("yes", "true", "1"):
+        if self.trusted.lower() in ("yes", "true", "1"):
             # Windows Authentication:
             return (
                 f"mssql+pyodbc://@{self.server},{self.port}/{self.database}"
@@ -31,3 +48,22 @@ class DbConfig:
                 f"?driver={driver.replace(' ', '+')}"
                 f"&TrustServerCertificate=yes"
             )
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Parâmetros do pool de conexões (compartilhado por todos os engines do registry)."""
+    size: int = _env_int("DB_POOL_SIZE", "5")
+    max_overflow: int = _env_int("DB_POOL_MAX_OVERFLOW", "10")
+    recycle: int = _env_int("DB_POOL_RECYCLE", "1800")       # segundos; -1 desliga
+    timeout: int = _env_int("DB_POOL_TIMEOUT", "30")         # espera por conexão livre
+    pre_ping: bool = _env_bool("DB_POOL_PRE_PING", "yes")
+    warm_up: int = _env_int("DB_POOL_WARM_UP", "0")          # conexões abertas na criação
+
+@dataclass(frozen=True)
+class ChunkConfig:
+    """Limites do chunksize="auto" (lote inicial e ajuste online)."""
+    memory_mb: int = _env_int("DB_CHUNK_MEMORY_MB", "64")      # teto de memória dos lotes em voo
+    target_ms: int = _env_int("DB_CHUNK_TARGET_MS", "2000")     # latência alvo por lote
+    cells: int = _env_int("DB_CHUNK_CELLS", "200000")           # lote inicial em células (linhas x colunas)
+    min_rows: int = _env_int("DB_CHUNK_MIN_ROWS", "100")
+    max_rows: int = _env_int("DB_CHUNK_MAX_ROWS", "500000")
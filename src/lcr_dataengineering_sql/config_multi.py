@@ -1,13 +1,11 @@
 from __future__ import annotations
 import os
-from dotenv import load_dotenv
-
-# carrega .env assim que o módulo é importado
-load_dotenv()
+from .config import load_env
 
 ENV_PREFIX = "DB_URL__"
 
 def get_url(alias: str) -> str:
+    load_env()  # .env carregado no primeiro uso, não no import
     key = f"{ENV_PREFIX}{alias.upper()}"
     url = os.getenv(key)
     if not url:
@@ -19,4 +17,5 @@ def get_url(alias: str) -> str:
     return url
 
 def list_aliases() -> list[str]:
+    load_env()
     return [k.removeprefix(ENV_PREFIX) for k in os.environ.keys() if k.startswith(ENV_PREFIX)]
@@ -1,36 +1,109 @@
 # src/lcr_dataengineering_sql/container_multi.py
 from __future__ import annotations
-from typing import Callable, Dict
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Mapping
+from .config import PoolConfig
 from .config_multi import get_url, list_aliases
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
 
 def _engine_kwargs_for_url(url: str) -> dict:
     # Só MSSQL+pyodbc suporta fast_executemany no create_engine
     if url.lower().startswith("mssql+pyodbc://"):
         return {"fast_executemany": True}
+    # LOAD DATA LOCAL INFILE (bulk load) precisa ser liberado no cliente
+    if url.lower().startswith(("mysql+pymysql://", "mysql+mysqldb://")):
+        return {"connect_args": {"local_infile": True}}
     return {}
 
-def _engine_provider_from_url(url: str) -> Callable[[], Engine]:
-    eng: Engine | None = None
+def _engine_provider_from_url(url: str, pool: PoolConfig | None = None,
+                              alias: str = "default") -> Callable[[], Engine]:
+    # engines vêm do registry do processo: mesma URL => mesmo pool, mesmo com container.py
+    from .infra.engine_registry import get_engine
+    from .infra.instrumentation import maybe_instrument
+    kwargs = _engine_kwargs_for_url(url)
     def _provider() -> Engine:
-        nonlocal eng
-        if eng is None:
-            kwargs = _engine_kwargs_for_url(url)
-            eng = create_engine(url, pool_pre_ping=True, future=True, **kwargs)
-        return eng
+        return maybe_instrument(get_engine(url, pool=pool, **kwargs), alias)
     return _provider
 
-def build_db_router(aliases: list[str] | None = None) -> Dict[str, object]:
+def build_db_router(aliases: list[str] | None = None,
+                    pool: PoolConfig | None = None) -> Dict[str, object]:
     aliases = aliases or list_aliases()
+    pool = pool or PoolConfig()
     router = {}
     for alias in aliases:
         url = get_url(alias)
-        provider = _engine_provider_from_url(url)
+        provider = _engine_provider_from_url(url, pool, alias)
+        if pool.warm_up:
+            provider()  # cria o engine já na subida, com o pool aquecido
         router[alias] = provider
     # embrulha providers em SqlAlchemyDb
     from .infra.sqlalchemy_db import SqlAlchemyDb
     return {alias: SqlAlchemyDb(provider) for alias, provider in router.items()}
 
+# driver síncrono -> equivalente asyncio do SQLAlchemy
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "mssql": "mssql+aioodbc",
+}
+
+def _async_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    backend = scheme.split("+", 1)[0].lower()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"Sem driver async conhecido para '{scheme}'.")
+    return f"{_ASYNC_DRIVERS[backend]}{sep}{rest}"
+
+def build_async_db_router(aliases: list[str] | None = None,
+                          pool: PoolConfig | None = None) -> Dict[str, object]:
+    """
+    Mesmo router, com AsyncSqlAlchemyDb. Usa DB_ASYNC_URL__<ALIAS> se existir;
+    senão troca o driver da URL síncrona pelo equivalente async.
+    """
+    import os
+    from .infra.async_sqlalchemy_db import AsyncSqlAlchemyDb
+    from .infra.engine_registry import get_async_engine
+    from .infra.instrumentation import maybe_instrument
+    aliases = aliases or list_aliases()
+    router = {}
+    for alias in aliases:
+        url = os.getenv(f"DB_ASYNC_URL__{alias.upper()}") or _async_url(get_url(alias))
+        kwargs = {"fast_executemany": True} if url.lower().startswith("mssql+aioodbc://") else {}
+        router[alias] = AsyncSqlAlchemyDb(
+            lambda url=url, kwargs=kwargs, alias=alias: maybe_instrument(get_async_engine(url, pool=pool, **kwargs), alias))
+    return router
+
+class _LazyRouter(Mapping[str, object]):
+    """
+    Router montado no primeiro acesso (não no import): importar o container
+    não lê .env, não importa o SQLAlchemy nem cria engines.
+    """
+    def __init__(self, build: Callable[[], Dict[str, object]]):
+        self._build = build
+        self._router: Dict[str, object] | None = None
+        self._lock = threading.Lock()
+
+    def _get(self) -> Dict[str, object]:
+        if self._router is None:
+            with self._lock:
+                if self._router is None:
+                    self._router = self._build()
+        return self._router
+
+    def __getitem__(self, alias: str) -> object:
+        return self._get()[alias]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get())
+
+    def __len__(self) -> int:
+        return len(self._get())
+
+    def __repr__(self) -> str:
+        state = "não montado" if self._router is None else ", ".join(self._router)
+        return f"<db_router ({state})>"
+
 # router padrão
-db_router = build_db_router()
+db_router = _LazyRouter(build_db_router)
@@ -1,26 +1,121 @@
 from __future__ import annotations
-from typing import Protocol, Mapping, Any, Iterator
-import pandas as pd
-from contextlib import AbstractContextManager
+from typing import Protocol, Mapping, Any, Iterator, AsyncIterator, TYPE_CHECKING
+if TYPE_CHECKING:  # só para anotações: importar o port não carrega o pandas
+    import pandas as pd
+    from ..features.checkpoint import Checkpoint
+from contextlib import AbstractContextManager, AbstractAsyncContextManager
 
 class Db(Protocol):
     # Execuções básicas
     def execute(self, sql: str, params: Mapping[str, Any] | None = None) -> int: ...
     def query_all(self, sql: str, params: Mapping[str, Any] | None = None) -> list[dict]: ...
-    def query_iter(self, sql: str, params: Mapping[str, Any] | None = None) -> Iterator[dict]: ...
+    def query_iter(self, sql: str, params: Mapping[str, Any] | None = None,
+                   fetch_size: int = 1000) -> Iterator[dict]: ...
+    def query_batches(self, sql: str, params: Mapping[str, Any] | None = None,
+                      fetch_size: int = 10000, as_frame: bool = False,
+                      keep_empty: bool = False) -> Iterator[list[dict] | pd.DataFrame]: ...
+
+    # Resultado colunar (sem um dict por linha)
+    def query_df(self, sql: str, params: Mapping[str, Any] | None = None,
+                 dtype: Mapping[str, Any] | None = None,
+                 chunksize: int | None = None) -> pd.DataFrame | Iterator[pd.DataFrame]: ...
+    def query_arrow(self, sql: str, params: Mapping[str, Any] | None = None,
+                    schema: Any = None, fetch_size: int = 100_000) -> Any: ...
+
+    # SELECT em tabela/view com o LIMIT do dialect
+    def select_table(self, schema: str, table: str, columns: list[str] | None = None,
+                     where: str | None = None, order_by: str | None = None, limit: int | None = None,
+                     params: Mapping[str, Any] | None = None,
+                     as_frame: bool = False) -> list[dict] | pd.DataFrame: ...
+
+    # Página por keyset (seek): custo igual para a 1a e a N-ésima página
+    def seek_page(self, schema: str, table: str, key_columns: list[str], page_size: int,
+                  after: list | tuple | None = None, columns: list[str] | None = None,
+                  where: str | None = None, params: Mapping[str, Any] | None = None,
+                  as_frame: bool = False) -> list[dict] | pd.DataFrame: ...
+
+    # Identificadores quotados no dialect do banco
+    def quote(self, ident: str) -> str: ...
+    def fqtn(self, schema: str, table: str) -> str: ...
 
     # Schema / Tabela / View / Procedure
     def create_schema(self, schema: str, if_not_exists: bool = True) -> None: ...
     def truncate_table(self, schema: str, table: str) -> None: ...
     def drop_table(self, schema: str, table: str, if_exists: bool = True) -> None: ...
     def table_exists(self, schema: str, table: str) -> bool: ...
+    def view_exists(self, schema: str, view: str) -> bool: ...
+    def get_columns(self, schema: str, table: str) -> list[dict]: ...
+    def get_pk(self, schema: str, table: str) -> list[str]: ...
+    def invalidate_metadata(self, schema: str | None = None, name: str | None = None) -> None: ...
     def create_view(self, schema: str, view: str, select_sql: str, or_replace: bool = True) -> None: ...
     def drop_view(self, schema: str, view: str, if_exists: bool = True) -> None: ...
     def create_procedure(self, schema: str, proc: str, definition_sql: str, or_alter: bool = True) -> None: ...
-    def exec_procedure(self, schema: str, proc: str, params: Mapping[str, Any] | None = None) -> list[dict]: ...
+    def exec_procedure(self, schema: str, proc: str, params: Mapping[str, Any] | None = None,
+                       as_frame: bool = False) -> list[dict] | pd.DataFrame: ...
 
     # Criação/ingestão de dados
     def create_table_from_query(self, create_table_sql: str) -> None: ...
     def create_table_from_df(self, df: pd.DataFrame, schema: str, table: str,
                              pk: list[str] | None = None, if_not_exists: bool = True) -> bool: ...
-    def insert_df(self, df: pd.DataFrame, schema: str, table: str, chunksize: int = 10000) -> int: ...
+    def create_table_from_columns(self, schema: str, table: str, columns: list[dict],
+                                  pk: list[str] | None = None, if_not_exists: bool = True) -> bool: ...
+    def insert_df(self, df: pd.DataFrame, schema: str, table: str, chunksize: int | str = 10000,
+                  strategy: str = "auto") -> int: ...
+    # (inseridas, atualizadas) via staging + MERGE / ON CONFLICT / ON DUPLICATE KEY
+    def upsert_df(self, df: pd.DataFrame, schema: str, table: str, key_columns: list[str],
+                  chunksize: int | str = 10000, strategy: str = "auto") -> tuple[int, int]: ...
+
+    # Transação: as operações do Db devolvido compartilham uma conexão/commit
+    def transaction(self) -> AbstractContextManager["Db"]: ...
+
+class AsyncDb(Protocol):
+    """Mesmo contrato do Db para asyncio (não bloqueia o event loop)."""
+    async def execute(self, sql: str, params: Mapping[str, Any] | None = None) -> int: ...
+    async def query_all(self, sql: str, params: Mapping[str, Any] | None = None) -> list[dict]: ...
+    def query_iter(self, sql: str, params: Mapping[str, Any] | None = None,
+                   fetch_size: int = 1000) -> AsyncIterator[dict]: ...
+    def query_batches(self, sql: str, params: Mapping[str, Any] | None = None,
+                      fetch_size: int = 10000, as_frame: bool = False) -> AsyncIterator[list[dict] | pd.DataFrame]: ...
+    async def query_df(self, sql: str, params: Mapping[str, Any] | None = None,
+                       dtype: Mapping[str, Any] | None = None) -> pd.DataFrame: ...
+
+    def quote(self, ident: str) -> str: ...
+    def fqtn(self, schema: str, table: str) -> str: ...
+    async def select_table(self, schema: str, table: str, columns: list[str] | None = None,
+                           where: str | None = None, order_by: str | None = None, limit: int | None = None,
+                           params: Mapping[str, Any] | None = None,
+                           as_frame: bool = False) -> list[dict] | pd.DataFrame: ...
+    async def seek_page(self, schema: str, table: str, key_columns: list[str], page_size: int,
+                        after: list | tuple | None = None, columns: list[str] | None = None,
+                        where: str | None = None, params: Mapping[str, Any] | None = None,
+                        as_frame: bool = False) -> list[dict] | pd.DataFrame: ...
+
+    async def create_schema(self, schema: str, if_not_exists: bool = True) -> None: ...
+    async def truncate_table(self, schema: str, table: str) -> None: ...
+    async def drop_table(self, schema: str, table: str, if_exists: bool = True) -> None: ...
+    async def table_exists(self, schema: str, table: str) -> bool: ...
+    async def create_view(self, schema: str, view: str, select_sql: str, or_replace: bool = True) -> None: ...
+    async def drop_view(self, schema: str, view: str, if_exists: bool = True) -> None: ...
+    async def create_procedure(self, schema: str, proc: str, definition_sql: str, or_alter: bool = True) -> None: ...
+    async def exec_procedure(self, schema: str, proc: str, params: Mapping[str, Any] | None = None,
+                             as_frame: bool = False) -> list[dict] | pd.DataFrame: ...
+
+    async def create_table_from_query(self, create_table_sql: str) -> None: ...
+    async def create_table_from_df(self, df: pd.DataFrame, schema: str, table: str,
+                                   pk: list[str] | None = None, if_not_exists: bool = True) -> bool: ...
+    async def insert_df(self, df: pd.DataFrame, schema: str, table: str, chunksize: int | str = 10000,
+                        strategy: str = "auto") -> int: ...
+    async def upsert_df(self, df: pd.DataFrame, schema: str, table: str, key_columns: list[str],
+                        chunksize: int | str = 10000, strategy: str = "auto") -> tuple[int, int]: ...
+
+    def transaction(self) -> AbstractAsyncContextManager["AsyncDb"]: ...
+
+class LoadManifest(Protocol):
+    """Progresso de cargas retomáveis: um registro por chunk commitado."""
+    # True: save() roda na transação do chunk (dado e progresso no mesmo commit)
+    in_transaction: bool
+
+    def ensure(self) -> None: ...
+    def last(self, name: str) -> Checkpoint | None: ...
+    def save(self, db: Db | None, cp: Checkpoint) -> None: ...
+    def reset(self, name: str) -> None: ...
@@ -1,12 +1,22 @@
-from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
-from .config import DbConfig
+from .config import DbConfig, PoolConfig
+from .infra.engine_registry import get_engine, registry
+from .infra.instrumentation import maybe_instrument
+
+_cached: tuple[int, Engine] | None = None   # (geração do registry, engine sem instrumentação)
 
 def default_engine_provider() -> Engine:
-    cfg = DbConfig()
-    return create_engine(
-        cfg.sqlalchemy_url(),
-        pool_pre_ping=True,
-        future=True,
-        fast_executemany=True,  # bom para inserts em lote com pyodbc
-    )
\ No newline at end of file
+    # chamado a cada operação: DbConfig/PoolConfig e a chave do registry só na primeira vez
+    # (e de novo depois de um dispose_all, que troca a geração do registry)
+    global _cached
+    cached = _cached
+    if cached is None or cached[0] != registry.generation:
+        generation = registry.generation
+        cfg = DbConfig()
+        cached = _cached = (generation, get_engine(
+            cfg.sqlalchemy_url(),
+            pool=PoolConfig(),
+            fast_executemany=True,  # bom para inserts em lote com pyodbc
+        ))
+    # a cada chamada: enable() depois do primeiro uso também instrumenta (idempotente)
+    return maybe_instrument(cached[1], "default")
@@ -0,0 +1,185 @@
+from __future__ import annotations
+import asyncio
+import time
+from typing import AsyncIterator, Iterable, Iterator, Mapping, Any
+import pandas as pd
+from ..infra.instrumentation import instrument_methods
+from ..core.ports import AsyncDb
+from ..utils.naming import column_renamer, rename_df_columns
+from ..utils import parquet as pq_utils
+from ..utils.scalars import to_python_scalar
+from .pipeline import UpsertResult
+
+def _next_or_none(it: Iterator[pd.DataFrame]) -> pd.DataFrame | None:
+    return next(it, None)
+
+@instrument_methods
+class AsyncRepo:
+    """Mesma fachada do Repo para asyncio; parse de arquivos roda em thread, fora do event loop."""
+    def __init__(self, db: AsyncDb):
+        self.db = db
+
+    async def _insert_frames(self, frames: Iterator[pd.DataFrame], schema: str, table: str,
+                             chunksize: int, column_prefix: str | None = None) -> int:
+        # parse do próximo chunk (thread) sobrepõe a escrita do atual (async)
+        total = 0
+        rename = column_renamer(column_prefix) if column_prefix else None
+        pending = asyncio.ensure_future(asyncio.to_thread(_next_or_none, frames))
+        while True:
+            df = await pending
+            if df is None:
+                return total
+            pending = asyncio.ensure_future(asyncio.to_thread(_next_or_none, frames))
+            if not len(df):
+                continue
+            if rename:
+                df = rename(df)
+            try:
+                total += await self.db.insert_df(df, schema=schema, table=table, chunksize=chunksize)
+            except BaseException:
+                await asyncio.gather(pending, return_exceptions=True)
+                raise
+
+    # ------------------- Schema / Tabelas -------------------
+
+    async def ensure_schema(self, schema: str) -> None:
+        await self.db.create_schema(schema, if_not_exists=True)
+
+    async def create_table_raw(self, create_table_sql: str) -> None:
+        await self.db.create_table_from_query(create_table_sql)
+
+    async def create_table_from_csv(self, csv_path: str, schema: str, table: str,
+                                    pk: list[str] | None = None, sep=",", encoding="utf-8",
+                                    decimal=".", parse_dates: list[str] | None = None,
+                                    sample_rows: int = 100000, chunksize: int = 100000) -> bool:
+        # passada única, como no Repo: o primeiro chunk cria a tabela e é inserido
+        # abrir o reader já abre o arquivo e inicia o parser C: também fora do event loop
+        it = await asyncio.to_thread(pd.read_csv, csv_path, sep=sep, encoding=encoding, decimal=decimal,
+                                     parse_dates=parse_dates, chunksize=chunksize, low_memory=False)
+        with it:
+            try:
+                df0 = await asyncio.to_thread(it.get_chunk, sample_rows)
+            except StopIteration:
+                df0 = await asyncio.to_thread(pd.read_csv, csv_path, sep=sep, encoding=encoding, nrows=0)
+            created = await self.db.create_table_from_df(df0, schema=schema, table=table, pk=pk, if_not_exists=True)
+            if len(df0):
+                await self.db.insert_df(df0, schema=schema, table=table, chunksize=chunksize)
+            del df0
+            await self._insert_frames(it, schema, table, chunksize)
+        return created
+
+    async def create_table_from_parquet(self, parquet_path: str, schema: str, table: str,
+                                        pk: list[str] | None = None, columns: list[str] | None = None) -> bool:
+        df = await asyncio.to_thread(pq_utils.empty_frame, parquet_path, columns)
+        return await self.db.create_table_from_df(df, schema=schema, table=table, pk=pk, if_not_exists=True)
+
+    async def insert_csv(self, csv_path: str, schema: str, table: str,
+                         sep=",", encoding="utf-8", decimal=".", parse_dates: list[str] | None = None,
+                         chunksize: int = 100000) -> int:
+        it = await asyncio.to_thread(pd.read_csv, csv_path, sep=sep, encoding=encoding, decimal=decimal,
+                                     parse_dates=parse_dates, chunksize=chunksize, low_memory=False)
+        with it:
+            return await self._insert_frames(it, schema, table, chunksize)
+
+    async def insert_parquet(self, parquet_path: str, schema: str, table: str, chunksize: int = 100000,
+                             columns: list[str] | None = None) -> int:
+        frames = pq_utils.iter_frames(parquet_path, columns=columns, batch_size=chunksize)
+        return await self._insert_frames(frames, schema, table, chunksize)
+
+    async def upsert_df(self, df: pd.DataFrame, schema: str, table: str, key_columns: list[str],
+                        chunksize: int = 100000) -> UpsertResult:
+        t0 = time.perf_counter()
+        ins, upd = await self.db.upsert_df(df, schema, table, key_columns, chunksize=chunksize)
+        return UpsertResult(rows=len(df), inserted=ins, updated=upd, chunks=1 if len(df) else 0,
+                            wall_seconds=time.perf_counter() - t0)
+
+    async def truncate_table(self, schema: str, table: str) -> None:
+        await self.db.truncate_table(schema, table)
+
+    async def drop_table(self, schema: str, table: str, if_exists: bool = True) -> None:
+        await self.db.drop_table(schema, table, if_exists=if_exists)
+
+    async def delete_where(self, schema: str, table: str, where: str,
+                           params: Mapping[str, Any] | None = None) -> int:
+        sql = f"DELETE FROM {self.db.fqtn(schema, table)} WHERE {where}"
+        return await self.db.execute(sql, params or {})
+
+    # ------------------- Selects -------------------
+
+    async def _select(self, sql: str, params: Mapping[str, Any] | None, as_frame: bool):
+        return await (self.db.query_df(sql, params) if as_frame else self.db.query_all(sql, params))
+
+    async def select_raw(self, sql: str, params: Mapping[str, Any] | None = None,
+                         as_frame: bool = False) -> list[dict] | pd.DataFrame:
+        return await self._select(sql, params, as_frame)
+
+    async def select_top(self, schema: str, table: str, n: int = 10,
+                         columns: Iterable[str] | str = "*",
+                         where: str | None = None, order_by: str | None = None,
+                         as_frame: bool = False) -> list[dict] | pd.DataFrame:
+        cols = None if columns == "*" else list(columns)
+        return await self.db.select_table(schema, table, columns=cols, where=where, order_by=order_by,
+                                          limit=n, as_frame=as_frame)
+
+    async def paginate(self, schema: str, table: str, key_columns: list[str], page_size: int = 10_000,
+                       where: str | None = None, params: Mapping[str, Any] | None = None,
+                       columns: list[str] | None = None,
+                       as_frame: bool = False) -> AsyncIterator[list[dict] | pd.DataFrame]:
+        """Mesma paginação por keyset do Repo.paginate."""
+        keys = list(key_columns)
+        if columns:
+            columns = list(columns) + [k for k in keys if k not in columns]
+        after = None
+        while True:
+            page = await self.db.seek_page(schema, table, keys, page_size, after=after, columns=columns,
+                                           where=where, params=params, as_frame=as_frame)
+            if not len(page):
+                return
+            last = page.iloc[-1] if as_frame else page[-1]
+            after = [to_python_scalar(last[k]) for k in keys]
+            yield page
+            if len(page) < page_size:
+                return
+
+    async def count(self, schema: str, table: str) -> int:
+        row = (await self.db.query_all(f"SELECT COUNT(*) AS cnt FROM {self.db.fqtn(schema, table)}"))[0]
+        return int(row["cnt"])
+
+    # ------------------- Views -------------------
+
+    async def create_view(self, schema: str, view: str, select_sql: str, or_replace: bool = True) -> None:
+        await self.db.create_view(schema, view, select_sql, or_replace=or_replace)
+
+    async def drop_view(self, schema: str, view: str, if_exists: bool = True) -> None:
+        await self.db.drop_view(schema, view, if_exists=if_exists)
+
+    async def select_view(self, schema: str, view: str, n: int | None = None,
+                          as_frame: bool = False) -> list[dict] | pd.DataFrame:
+        return await self.db.select_table(schema, view, limit=n or None, as_frame=as_frame)
+
+    # ------------------- Procedures -------------------
+
+    async def create_procedure(self, schema: str, proc: str, definition_sql: str, or_alter: bool = True) -> None:
+        await self.db.create_procedure(schema, proc, definition_sql, or_alter=or_alter)
+
+    async def exec_procedure(self, schema: str, proc: str, params: Mapping[str, Any] | None = None,
+                             as_frame: bool = False) -> list[dict] | pd.DataFrame:
+        return await self.db.exec_procedure(schema, proc, params or {}, as_frame=as_frame)
+
+    async def create_table_from_csv_with_prefix(self, csv_path: str, schema: str, table: str,
+                                                column_prefix: str, pk: list[str] | None = None,
+                                                sep=",", encoding="utf-8", decimal=".",
+                                                parse_dates: list[str] | None = None,
+                                                sample_rows: int = 100_000) -> bool:
+        df0 = await asyncio.to_thread(pd.read_csv, csv_path, sep=sep, encoding=encoding, decimal=decimal,
+                                      parse_dates=parse_dates, nrows=sample_rows, low_memory=False)
+        df0_db = rename_df_columns(df0, prefix=column_prefix)
+        return await self.db.create_table_from_df(df0_db, schema=schema, table=table, pk=pk, if_not_exists=True)
+
+    async def insert_csv_with_prefix(self, csv_path: str, schema: str, table: str, column_prefix: str,
+                                     sep=",", encoding="utf-8", decimal=".",
+                                     parse_dates: list[str] | None = None, chunksize: int = 100_000) -> int:
+        it = await asyncio.to_thread(pd.read_csv, csv_path, sep=sep, encoding=encoding, decimal=decimal,
+                                     parse_dates=parse_dates, chunksize=chunksize, low_memory=False)
+        with it:
+            return await self._insert_frames(it, schema, table, chunksize, column_prefix=column_prefix)
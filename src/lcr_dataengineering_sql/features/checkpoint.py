@@ -0,0 +1,193 @@
+# src/lcr_dataengineering_sql/features/checkpoint.py
+from __future__ import annotations
+import codecs
+import datetime as dt
+import io
+import json
+import os
+from dataclasses import asdict, dataclass, replace
+from typing import Callable, Iterator
+import pandas as pd
+from sqlalchemy.types import BigInteger, DateTime, Integer, String
+from ..core.ports import Db, LoadManifest
+from ..utils.files import read_records
+
+MANIFEST_TABLE = "lcr_load_manifest"
+CHUNK_ATTR = "lcr_chunk"   # df.attrs[CHUNK_ATTR] = (índice do chunk, offset em bytes do fim do chunk)
+
+@dataclass
+class Checkpoint:
+    """Um chunk commitado; o último de uma carga diz de onde a retomada continua."""
+    name: str
+    fingerprint: str
+    chunk_index: int = -1
+    byte_offset: int | None = None   # fim do chunk no CSV (None em Parquet: retoma por linhas)
+    rows: int = 0                    # linhas do chunk
+    rows_total: int = 0              # linhas commitadas até este chunk (inclusive)
+
+def _now() -> dt.datetime:
+    return dt.datetime.now(dt.timezone.utc).replace(tzinfo=None)
+
+# ------------------- manifests -------------------
+
+class ManifestTable:
+    """Tabela de controle no banco destino; o registro do chunk entra na mesma transação do dado."""
+    in_transaction = True
+
+    def __init__(self, db: Db, schema: str = "", table: str = MANIFEST_TABLE):
+        self.db, self.schema, self.table = db, schema, table
+
+    def ensure(self) -> None:
+        self.db.create_table_from_columns(self.schema, self.table, [
+            {"name": "load_name", "type": String(400), "nullable": False},
+            {"name": "chunk_index", "type": Integer(), "nullable": False},
+            {"name": "fingerprint", "type": String(100)},
+            {"name": "byte_offset", "type": BigInteger()},
+            {"name": "rows_loaded", "type": BigInteger()},
+            {"name": "rows_total", "type": BigInteger()},
+            {"name": "committed_at", "type": DateTime()},
+        ], pk=["load_name", "chunk_index"], if_not_exists=True)
+
+    def _sql(self, body: str) -> str:
+        q = self.db.quote
+        return body.format(t=self.db.fqtn(self.schema, self.table), name=q("load_name"), idx=q("chunk_index"),
+                           fp=q("fingerprint"), off=q("byte_offset"), rows=q("rows_loaded"),
+                           total=q("rows_total"), ts=q("committed_at"))
+
+    def last(self, name: str) -> Checkpoint | None:
+        rows = self.db.query_all(self._sql(
+            "SELECT {idx} AS chunk_index, {fp} AS fingerprint, {off} AS byte_offset, {rows} AS rows_loaded, "
+            "{total} AS rows_total FROM {t} WHERE {name} = :name "
+            "AND {idx} = (SELECT MAX({idx}) FROM {t} WHERE {name} = :name)"), {"name": name})
+        if not rows:
+            return None
+        r = rows[0]
+        return Checkpoint(name=name, fingerprint=r["fingerprint"], chunk_index=int(r["chunk_index"]),
+                          byte_offset=None if r["byte_offset"] is None else int(r["byte_offset"]),
+                          rows=int(r["rows_loaded"] or 0), rows_total=int(r["rows_total"] or 0))
+
+    def save(self, db: Db | None, cp: Checkpoint) -> None:
+        """Grava pelo `db` recebido (a transação que inseriu o chunk)."""
+        (db or self.db).execute(self._sql(
+            "INSERT INTO {t} ({name}, {idx}, {fp}, {off}, {rows}, {total}, {ts}) "
+            "VALUES (:name, :idx, :fp, :off, :rows, :total, :ts)"),
+            {"name": cp.name, "idx": cp.chunk_index, "fp": cp.fingerprint, "off": cp.byte_offset,
+             "rows": cp.rows, "total": cp.rows_total, "ts": _now()})
+
+    def reset(self, name: str) -> None:
+        self.db.execute(self._sql("DELETE FROM {t} WHERE {name} = :name"), {"name": name})
+
+class ManifestFile:
+    """
+    Manifest local (JSON lines, fsync por chunk) para quando não se pode criar tabela no destino.
+    Gravado logo depois do commit, não na mesma transação: se o processo cair entre os dois,
+    a retomada repete esse último chunk.
+    """
+    in_transaction = False
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def ensure(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+    def _entries(self) -> Iterator[dict]:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def last(self, name: str) -> Checkpoint | None:
+        found = None
+        for e in self._entries():
+            if e["name"] == name and (found is None or e["chunk_index"] > found["chunk_index"]):
+                found = e
+        if found is None:
+            return None
+        return Checkpoint(**{k: v for k, v in found.items() if k != "committed_at"})
+
+    def save(self, db: Db | None, cp: Checkpoint) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({**asdict(cp), "committed_at": _now().isoformat()}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def reset(self, name: str) -> None:
+        keep = [e for e in self._entries() if e["name"] != name]
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(e) + "\n" for e in keep)
+        os.replace(tmp, self.path)
+
+# ------------------- retomada -------------------
+
+def resume_point(manifest: LoadManifest, name: str, fingerprint: str) -> Checkpoint:
+    """Último chunk commitado da carga `name` (ou o início). Arquivo diferente do registrado -> erro."""
+    manifest.ensure()
+    last = manifest.last(name)
+    if last is None:
+        return Checkpoint(name=name, fingerprint=fingerprint)
+    if last.fingerprint != fingerprint:
+        raise RuntimeError(f"Arquivo da carga '{name}' mudou desde o último checkpoint "
+                           f"(chunk {last.chunk_index}, {last.rows_total} linhas já carregadas). "
+                           "Limpe o destino e chame reset_load_checkpoint antes de recarregar.")
+    return last
+
+class LoadTracker:
+    """
+    Liga o run_pipeline ao manifest: stage() roda dentro da transação do chunk (antes do
+    commit) e committed() depois dele, sempre na ordem do arquivo (pipeline em modo ordered).
+    """
+    def __init__(self, manifest: LoadManifest, start: Checkpoint):
+        self.manifest = manifest
+        self.start = self.last = start
+        self._pending: Checkpoint | None = None
+
+    def stage(self, tx: Db, df: pd.DataFrame, rows: int) -> None:
+        index, offset = df.attrs[CHUNK_ATTR]
+        self._pending = replace(self.last, chunk_index=index, byte_offset=offset, rows=rows,
+                                rows_total=self.last.rows_total + rows)
+        if self.manifest.in_transaction:
+            self.manifest.save(tx, self._pending)
+
+    def committed(self, df: pd.DataFrame, rows: int) -> None:
+        if not self.manifest.in_transaction:
+            self.manifest.save(None, self._pending)
+        self.last = self._pending
+
+# ------------------- leitores com posição -------------------
+
+def csv_chunks(path: str, size: int | Callable[[], int], start: Checkpoint, **read_options) -> Iterator[pd.DataFrame]:
+    """
+    Lê o CSV em blocos de registros inteiros a partir do byte_offset do checkpoint (seek, sem
+    reler o que já foi carregado). Cada bloco vira DataFrame com cabeçalho próprio e leva
+    (índice, offset final) em df.attrs[CHUNK_ATTR]. size: linhas por chunk ou função (chunksize="auto").
+    """
+    encoding = read_options.get("encoding") or "utf-8"
+    if codecs.lookup(encoding).name.startswith(("utf-16", "utf-32")):
+        raise ValueError(f"Carga retomável não suporta encoding {encoding} (offsets por linha em bytes).")
+    with open(path, "rb") as f:
+        header = read_records(f, 1)
+        if start.byte_offset:
+            f.seek(start.byte_offset)
+        index = start.chunk_index + 1
+        while True:
+            block = read_records(f, size() if callable(size) else size)
+            if not block:
+                return
+            df = pd.read_csv(io.BytesIO(header + block), **read_options)
+            df.attrs[CHUNK_ATTR] = (index, f.tell())
+            index += 1
+            yield df
+
+def tag_ranges(ranges: Iterator[tuple[int | None, pd.DataFrame]], start: Checkpoint) -> Iterator[pd.DataFrame]:
+    """Numera pares (offset do fim, DataFrame) a partir do checkpoint (ex.: utils.csv_ranges.parallel_frames)."""
+    for index, (offset, df) in enumerate(ranges, start.chunk_index + 1):
+        df.attrs[CHUNK_ATTR] = (index, offset)
+        yield df
+
+def tag_chunks(frames: Iterator[pd.DataFrame], start: Checkpoint) -> Iterator[pd.DataFrame]:
+    """Numera chunks sem offset em bytes (Parquet: a retomada pula rows_total linhas)."""
+    return tag_ranges(((None, df) for df in frames), start)
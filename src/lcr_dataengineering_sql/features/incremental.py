@@ -0,0 +1,154 @@
+# src/lcr_dataengineering_sql/features/incremental.py
+from __future__ import annotations
+import datetime as dt
+import decimal
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Mapping
+from sqlalchemy.types import BigInteger, DateTime, String, Text
+from ..core.ports import Db
+from ..utils.scalars import to_python_scalar
+
+CONTROL_TABLE = "lcr_sync_state"
+
+@dataclass
+class SyncResult:
+    """Resultado de um sync incremental: linhas do delta e o watermark final."""
+    name: str
+    rows: int = 0
+    pages: int = 0
+    watermark_from: Any = None
+    watermark_to: Any = None
+    wall_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.wall_seconds if self.wall_seconds else 0.0
+
+# ------------------- estado (JSON com tipos) -------------------
+
+def _enc(v: Any) -> Any:
+    v = to_python_scalar(v)
+    if isinstance(v, dt.datetime):
+        return {"$dt": v.isoformat()}
+    if isinstance(v, dt.date):
+        return {"$d": v.isoformat()}
+    if isinstance(v, decimal.Decimal):
+        return {"$dec": str(v)}
+    return v
+
+def _dec(v: Any) -> Any:
+    if isinstance(v, dict):
+        if "$dt" in v:
+            return dt.datetime.fromisoformat(v["$dt"])
+        if "$d" in v:
+            return dt.date.fromisoformat(v["$d"])
+        if "$dec" in v:
+            return decimal.Decimal(v["$dec"])
+    return v
+
+class WatermarkStore:
+    """Tabela de controle no banco destino: uma linha por sync, (watermark, chaves) da última linha aplicada."""
+    def __init__(self, db: Db, schema: str = "", table: str = CONTROL_TABLE):
+        self.db, self.schema, self.table = db, schema, table
+
+    def ensure(self) -> None:
+        self.db.create_table_from_columns(self.schema, self.table, [
+            {"name": "sync_name", "type": String(200), "nullable": False},
+            {"name": "position", "type": Text()},
+            {"name": "rows_total", "type": BigInteger()},
+            {"name": "updated_at", "type": DateTime()},
+        ], pk=["sync_name"], if_not_exists=True)
+
+    def _sql(self, body: str) -> str:
+        q = self.db.quote
+        return body.format(t=self.db.fqtn(self.schema, self.table), name=q("sync_name"), pos=q("position"),
+                           rows=q("rows_total"), ts=q("updated_at"))
+
+    def get(self, name: str) -> list | None:
+        rows = self.db.query_all(self._sql("SELECT {pos} AS position FROM {t} WHERE {name} = :name"), {"name": name})
+        return [_dec(v) for v in json.loads(rows[0]["position"])] if rows and rows[0]["position"] else None
+
+    def save(self, db: Db, name: str, position: list, rows: int) -> None:
+        """Grava a posição pelo `db` recebido (a transação que aplicou o lote): dado e estado juntos."""
+        params = {"name": name, "pos": json.dumps([_enc(v) for v in position]), "n": int(rows),
+                  "ts": dt.datetime.now(dt.timezone.utc).replace(tzinfo=None)}
+        n = db.execute(self._sql("UPDATE {t} SET {pos} = :pos, {rows} = {rows} + :n, {ts} = :ts "
+                                 "WHERE {name} = :name"), params)
+        if not n:
+            db.execute(self._sql("INSERT INTO {t} ({name}, {pos}, {rows}, {ts}) VALUES (:name, :pos, :n, :ts)"), params)
+
+    def reset(self, name: str) -> None:
+        self.db.execute(self._sql("DELETE FROM {t} WHERE {name} = :name"), {"name": name})
+
+# ------------------- sync -------------------
+
+def sync_incremental(src: Db, dst: Db, schema: str, table: str, watermark_column: str,
+                     key_columns: list[str] | None = None, target_schema: str | None = None,
+                     target_table: str | None = None, mode: str = "upsert", page_size: int = 50_000,
+                     columns: list[str] | None = None, where: str | None = None,
+                     params: Mapping[str, Any] | None = None, name: str | None = None,
+                     control_schema: str | None = None, control_table: str = CONTROL_TABLE,
+                     create: bool = True) -> SyncResult:
+    """
+    Copia só o delta: linhas com (watermark, chaves) > posição salva, paginando por keyset
+    (nunca OFFSET) até o MAX(watermark) lido no início. Cada página é aplicada no destino
+    (upsert por key_columns, ou append) na mesma transação que avança a posição na tabela
+    de controle: se cair no meio, o próximo sync retoma da última página gravada.
+    Sem key_columns o watermark precisa ser único (ex.: id crescente).
+    """
+    if mode not in ("upsert", "append"):
+        raise ValueError(f"mode inválido: {mode} (use 'upsert' ou 'append')")
+    key_columns = list(key_columns if key_columns is not None else src.get_pk(schema, table))
+    if mode == "upsert" and not key_columns:
+        raise ValueError("mode='upsert' precisa de key_columns (ou PK na tabela de origem).")
+    target_schema = schema if target_schema is None else target_schema
+    target_table = target_table or table
+    name = name or f"{schema}.{table}->{target_schema}.{target_table}"
+    seek = [watermark_column] + [k for k in key_columns if k != watermark_column]
+    if columns:
+        columns = list(columns) + [c for c in seek if c not in columns]
+
+    t0 = time.perf_counter()
+    store = WatermarkStore(dst, target_schema if control_schema is None else control_schema, control_table)
+    store.ensure()
+    position = store.get(name)
+    res = SyncResult(name=name, watermark_from=position[0] if position else None)
+
+    # teto fixo no início: o sync termina mesmo com a origem recebendo escrita
+    cond = f" WHERE {where}" if where else ""
+    hi = src.query_all(f"SELECT MAX({src.quote(watermark_column)}) AS hi FROM {src.fqtn(schema, table)}{cond}",
+                       params)[0]["hi"]
+    if hi is None:
+        res.wall_seconds = time.perf_counter() - t0
+        return res
+    bound = f"{src.quote(watermark_column)} <= :lcr_hi" + (f" AND ({where})" if where else "")
+    bound_params = {**(params or {}), "lcr_hi": hi}
+
+    if create:
+        cols = src.get_columns(schema, table)
+        if columns:
+            cols = [c for c in cols if c["name"] in set(columns)]
+        dst.create_table_from_columns(target_schema, target_table, cols, pk=key_columns or None)
+
+    while True:
+        df = src.seek_page(schema, table, seek, page_size, after=position, columns=columns,
+                           where=bound, params=bound_params, as_frame=True)
+        if not len(df):
+            break
+        position = [to_python_scalar(v) for v in df.iloc[-1][seek].tolist()]
+        with dst.transaction() as tx:
+            if mode == "upsert":
+                tx.upsert_df(df, target_schema, target_table, key_columns)
+            else:
+                tx.insert_df(df, target_schema, target_table)
+            store.save(tx, name, position, len(df))
+        res.rows += len(df)
+        res.pages += 1
+        if len(df) < page_size:
+            break
+
+    res.watermark_to = position[0] if position else None
+    res.wall_seconds = time.perf_counter() - t0
+    return res
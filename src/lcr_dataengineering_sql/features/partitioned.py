@@ -0,0 +1,164 @@
+# src/lcr_dataengineering_sql/features/partitioned.py
+from __future__ import annotations
+import datetime as dt
+import decimal
+import glob
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Sequence
+from ..core.ports import Db
+from ..utils import parquet as pq_utils
+
+@dataclass
+class Partition:
+    """Uma faixa da coluna de partição: predicado SQL + parâmetros."""
+    index: int
+    where: str
+    params: dict
+
+@dataclass
+class PartitionedResult:
+    """Resultado de read_partitioned com output="parquet": um arquivo por partição não vazia."""
+    path: str
+    rows: int = 0
+    partitions: int = 0
+    rows_per_partition: list[int] = field(default_factory=list)
+    files: list[str] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.wall_seconds if self.wall_seconds else 0.0
+
+# ------------------- limites -------------------
+
+def _interpolate(lo: Any, hi: Any, n: int) -> list:
+    """n-1 cortes igualmente espaçados entre lo e hi (inteiro, decimal, float, data, datetime)."""
+    if isinstance(lo, bool) or type(lo) is not type(hi):
+        raise ValueError(f"MIN/MAX com tipos inesperados ({type(lo).__name__}, {type(hi).__name__}).")
+    if isinstance(lo, int):
+        return [lo + (hi - lo) * i // n for i in range(1, n)]
+    if isinstance(lo, (float, decimal.Decimal)):
+        return [lo + (hi - lo) * i / n for i in range(1, n)]
+    if isinstance(lo, dt.datetime):
+        return [lo + (hi - lo) * i / n for i in range(1, n)]
+    if isinstance(lo, dt.date):
+        return [lo + dt.timedelta(days=(hi - lo).days * i // n) for i in range(1, n)]
+    raise ValueError(f"strategy='minmax' não sabe dividir {type(lo).__name__}; use strategy='quantiles'.")
+
+def range_bounds(db: Db, schema: str, table: str, column: str, num_partitions: int,
+                 strategy: str = "auto", where: str | None = None,
+                 params: Mapping[str, Any] | None = None) -> list:
+    """
+    Cortes (ordenados, sem repetição) que dividem a coluna em até `num_partitions` faixas.
+    - minmax: MIN/MAX e cortes uniformes (uma consulta barata com índice; bom para chaves densas).
+    - quantiles: NTILE no servidor (um scan + sort) -> faixas com o mesmo número de linhas,
+      para chaves com buracos ou concentração; aceita texto.
+    - auto: minmax para número/data, quantiles para o resto.
+    """
+    if strategy not in ("auto", "minmax", "quantiles"):
+        raise ValueError(f"strategy inválida: {strategy} (use 'auto', 'minmax' ou 'quantiles')")
+    n = max(int(num_partitions), 1)
+    if n == 1:
+        return []
+    col, fq = db.quote(column), db.fqtn(schema, table)
+    cond = f"{col} IS NOT NULL" + (f" AND ({where})" if where else "")
+    if strategy != "quantiles":
+        row = db.query_all(f"SELECT MIN({col}) AS lo, MAX({col}) AS hi FROM {fq} WHERE {cond}", params)[0]
+        lo, hi = row["lo"], row["hi"]
+        if lo is None:
+            return []
+        numeric = isinstance(lo, (int, float, decimal.Decimal, dt.date)) and not isinstance(lo, bool)
+        if strategy == "minmax" or numeric:
+            return sorted(set(_interpolate(lo, hi, n)) - {lo})
+    rows = db.query_all(
+        f"SELECT MIN({col}) AS lo FROM (SELECT {col}, NTILE({n}) OVER (ORDER BY {col}) AS lcr_tile "
+        f"FROM {fq} WHERE {cond}) q GROUP BY lcr_tile ORDER BY lo", params)
+    # início de cada faixa, menos a primeira; NTILE pode partir um valor repetido entre faixas
+    return sorted({r["lo"] for r in rows[1:]})
+
+def partitions(db: Db, column: str, bounds: Sequence[Any]) -> list[Partition]:
+    """Faixas [b(i-1), b(i)); a primeira também leva os NULLs, a última não tem teto."""
+    col = db.quote(column)
+    if not bounds:
+        return [Partition(0, "1 = 1", {})]
+    out = [Partition(0, f"({col} < :lcr_hi OR {col} IS NULL)", {"lcr_hi": bounds[0]})]
+    for i in range(1, len(bounds)):
+        out.append(Partition(i, f"{col} >= :lcr_lo AND {col} < :lcr_hi",
+                             {"lcr_lo": bounds[i - 1], "lcr_hi": bounds[i]}))
+    out.append(Partition(len(bounds), f"{col} >= :lcr_lo", {"lcr_lo": bounds[-1]}))
+    return out
+
+# ------------------- leitura -------------------
+
+def read_partitioned(db: Db, schema: str, table: str, partition_column: str, num_partitions: int = 4,
+                     columns: list[str] | None = None, where: str | None = None,
+                     params: Mapping[str, Any] | None = None, strategy: str = "auto",
+                     bounds: Sequence[Any] | None = None, connections: int | None = None,
+                     output: str = "frame", path: str | None = None, fetch_size: int = 100_000):
+    """
+    Lê a tabela em faixas da partition_column, cada uma numa conexão do pool, em paralelo
+    (como o partitionColumn do JDBC). output:
+      "frame"   -> DataFrame (partições concatenadas na ordem da chave)
+      "arrow"   -> pyarrow.Table
+      "parquet" -> diretório `path` com part-00000.parquet...; cada partição grava em streaming
+                   (fetch_size linhas por row group), os arquivos saem com schema único
+                   e devolve PartitionedResult.
+    bounds: cortes explícitos (ignora strategy). connections: threads/conexões simultâneas
+    (padrão: uma por partição; o pool precisa comportar).
+    Sem índice na partition_column cada faixa vira um scan completo no servidor.
+    """
+    if output not in ("frame", "arrow", "parquet"):
+        raise ValueError(f"output inválido: {output} (use 'frame', 'arrow' ou 'parquet')")
+    if output == "parquet" and not path:
+        raise ValueError("output='parquet' precisa de path (diretório).")
+    t0 = time.perf_counter()
+    if bounds is None:
+        bounds = range_bounds(db, schema, table, partition_column, num_partitions, strategy, where, params)
+    parts = partitions(db, partition_column, sorted(bounds))
+    col_sql = "*" if not columns else ", ".join(db.quote(c) for c in columns)
+    base = f"SELECT {col_sql} FROM {db.fqtn(schema, table)} WHERE "
+    cond = f"({where}) AND " if where else ""
+
+    def _query(p: Partition) -> tuple[str, dict]:
+        return base + cond + p.where, {**(params or {}), **p.params}
+
+    if output == "parquet":
+        os.makedirs(path, exist_ok=True)
+        for old in glob.glob(os.path.join(path, "part-*.parquet")):
+            os.remove(old)  # partições de uma leitura anterior
+
+    def _read(p: Partition):
+        sql, p_params = _query(p)
+        if output == "frame":
+            return db.query_df(sql, p_params)
+        if output == "arrow":
+            return db.query_arrow(sql, p_params, fetch_size=fetch_size)
+        file = os.path.join(path, f"part-{p.index:05d}.parquet")
+        return file, pq_utils.write_frames(db.query_batches(sql, p_params, fetch_size=fetch_size, as_frame=True),
+                                           file)
+
+    workers = max(int(connections or len(parts)), 1)
+    with ThreadPoolExecutor(max_workers=min(workers, len(parts)), thread_name_prefix="lcr-part") as pool:
+        results = list(pool.map(_read, parts))  # map mantém a ordem das partições
+
+    if output == "frame":
+        import pandas as pd
+        frames = [df for df in results if len(df)] or results[:1]
+        return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    if output == "arrow":
+        import pyarrow as pa
+        # partição só com NULL numa coluna vem como tipo null: permissive promove
+        return pa.concat_tables(results, promote_options="permissive")
+    res = PartitionedResult(path=path, partitions=len(parts))
+    for file, n in results:
+        res.rows_per_partition.append(n)
+        res.rows += n
+        if n:
+            res.files.append(file)
+    # cada partição fixa o próprio schema (coluna só com NULL numa faixa): igualar para ler como dataset
+    pq_utils.unify_files(res.files)
+    res.wall_seconds = time.perf_counter() - t0
+    return res
@@ -0,0 +1,233 @@
+# src/lcr_dataengineering_sql/features/pipeline.py
+from __future__ import annotations
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+import pandas as pd
+from ..core.ports import Db
+from ..infra.chunking import AdaptiveChunker, ChunkReport
+if TYPE_CHECKING:
+    from .checkpoint import LoadTracker
+
+_END = object()
+
+@dataclass
+class LoadResult:
+    """Resultado de uma carga: linhas e tempo gasto em cada estágio (segundos)."""
+    rows: int = 0
+    chunks: int = 0
+    parse_seconds: float = 0.0         # tempo dentro do parser (ler + transformar chunk)
+    write_seconds: float = 0.0         # soma do tempo de escrita de todos os writers
+    parser_blocked_seconds: float = 0.0  # parser esperando fila cheia -> banco é o gargalo
+    writers_idle_seconds: float = 0.0    # writers esperando chunk -> parse é o gargalo
+    wall_seconds: float = 0.0
+    bytes_read: int = 0
+    created: bool | None = None        # só preenchido quando a carga também cria a tabela
+    chunk_report: ChunkReport | None = None  # tamanhos escolhidos com chunksize="auto"
+    resumed_rows: int = 0              # já commitadas por uma execução anterior (carga retomada)
+    resumed_chunks: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes_read / 1e6 / self.wall_seconds if self.wall_seconds else 0.0
+
+@dataclass
+class CopyResult(LoadResult):
+    """LoadResult de uma cópia entre bancos (parse = leitura do cursor da origem)."""
+    source: str = ""
+    target: str = ""
+    peak_batch_bytes: int = 0          # maior lote em memória
+    max_batches_in_flight: int = 0     # fila + writers + o lote sendo lido
+
+    @property
+    def peak_memory_bytes(self) -> int:
+        # teto de memória dos lotes: a fila limitada não deixa passar disso
+        return self.peak_batch_bytes * self.max_batches_in_flight
+
+@dataclass
+class UpsertResult:
+    """Resultado de um upsert: linhas lidas, inseridas e de fato alteradas."""
+    rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    chunks: int = 0
+    wall_seconds: float = 0.0
+
+    @property
+    def unchanged(self) -> int:
+        # chave já existente com conteúdo igual (ou repetida no próprio lote)
+        return self.rows - self.inserted - self.updated
+
+class _Cancelled(Exception):
+    pass
+
+class _CommitGate:
+    """Libera as escritas na ordem dos chunks (modo ordered), uma de cada vez."""
+    def __init__(self, cancel: threading.Event, timeout: float | None = None):
+        self._cond = threading.Condition()
+        self._next = 0
+        self._cancel = cancel
+        self._timeout = timeout
+
+    def wait_turn(self, seq: int) -> None:
+        deadline = None if self._timeout is None else time.monotonic() + self._timeout
+        with self._cond:
+            while self._next != seq:
+                if self._cancel.is_set():
+                    raise _Cancelled()
+                if deadline is not None and time.monotonic() > deadline:
+                    raise TimeoutError(f"Chunk {seq} esperou {self._timeout:.0f}s pela escrita do chunk "
+                                       f"{self._next} (modo ordered).")
+                self._cond.wait(0.1)
+
+    def done(self, seq: int) -> None:
+        with self._cond:
+            self._next = seq + 1
+            self._cond.notify_all()
+
+def run_pipeline(chunks: Iterable[pd.DataFrame], db: Db, schema: str, table: str,
+                 transform: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+                 writers: int = 1, queue_depth: int = 2, ordered: bool = False,
+                 chunksize: int | str = 10000, chunker: AdaptiveChunker | None = None,
+                 tracker: LoadTracker | None = None, turn_timeout: float | None = 600.0) -> LoadResult:
+    """
+    Produtor/consumidor limitado: 1 thread de parse + N writers, cada writer usa
+    sua própria conexão do pool (insert_df abre a sua transação).
+    - queue_depth: chunks já parseados aguardando escrita (backpressure/memória).
+    - ordered=True: cada chunk espera a vez antes de abrir a transação, então insert+commit
+      saem em série na ordem do arquivo (requer db.transaction()). Esperar com a transação
+      aberta travava: o chunk seguinte segurava locks que o anterior precisava para commitar.
+      Com writers>1 só o parse continua sobreposto. turn_timeout: espera máxima pela vez (s).
+    - chunker: cada escrita alimenta o AIMD (o produtor de `chunks` lê chunker.size);
+      o chunk vai inteiro para o insert_df.
+    - tracker: cada chunk grava seu checkpoint na própria transação; força ordered
+      (o manifest sempre descreve um prefixo contíguo do arquivo).
+    O primeiro erro cancela o restante e é relançado aqui.
+    """
+    writers = max(int(writers), 1)
+    ordered = ordered or tracker is not None
+    q: queue.Queue = queue.Queue(maxsize=max(int(queue_depth), 1))
+    cancel = threading.Event()
+    gate = _CommitGate(cancel, turn_timeout)
+    errors: list[BaseException] = []
+    lock = threading.Lock()
+    res = LoadResult()
+
+    def _fail(e: BaseException) -> None:
+        with lock:
+            if not errors and not isinstance(e, _Cancelled):
+                errors.append(e)
+        cancel.set()
+
+    def _put(item) -> None:
+        t0 = time.perf_counter()
+        while not cancel.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        res.parser_blocked_seconds += time.perf_counter() - t0
+
+    def _parser() -> None:
+        it: Iterator[pd.DataFrame] = iter(chunks)
+        seq = 0
+        try:
+            while not cancel.is_set():
+                t0 = time.perf_counter()
+                try:
+                    df = next(it)
+                except StopIteration:
+                    break
+                if transform is not None:
+                    df = transform(df)
+                res.parse_seconds += time.perf_counter() - t0
+                if not len(df):
+                    continue
+                _put((seq, df))
+                seq += 1
+        except BaseException as e:
+            _fail(e)
+        finally:
+            # no cancelamento _put desiste; os writers saem sozinhos ao ver o evento
+            for _ in range(writers):
+                _put(_END)
+
+    def _write(seq: int, df: pd.DataFrame) -> int:
+        size = len(df) if chunker is not None else chunksize
+        if not ordered:
+            return db.insert_df(df, schema=schema, table=table, chunksize=size)
+        # a vez já foi esperada em _writer, antes de qualquer lock ser tomado
+        with db.transaction() as tx:
+            n = tx.insert_df(df, schema=schema, table=table, chunksize=size)
+            if tracker is not None:
+                tracker.stage(tx, df, n)
+        if tracker is not None:
+            tracker.committed(df, n)
+        gate.done(seq)
+        return n
+
+    def _writer() -> None:
+        while True:
+            t0 = time.perf_counter()
+            try:
+                item = q.get(timeout=0.1)
+            except queue.Empty:
+                with lock:
+                    res.writers_idle_seconds += time.perf_counter() - t0
+                if cancel.is_set():
+                    return
+                continue
+            with lock:
+                res.writers_idle_seconds += time.perf_counter() - t0
+            if item is _END or cancel.is_set():
+                return
+            seq, df = item
+            try:
+                if ordered:
+                    gate.wait_turn(seq)
+                t1 = time.perf_counter()
+                n = _write(seq, df)
+            except BaseException as e:
+                _fail(e)
+                return
+            elapsed = time.perf_counter() - t1
+            if chunker is not None:
+                chunker.observe(n, elapsed)
+            with lock:
+                res.write_seconds += elapsed
+                res.rows += n
+                res.chunks += 1
+
+    t_start = time.perf_counter()
+    threads = [threading.Thread(target=_parser, name="lcr-parse", daemon=True)]
+    threads += [threading.Thread(target=_writer, name=f"lcr-write-{i}", daemon=True) for i in range(writers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    res.wall_seconds = time.perf_counter() - t_start
+    if chunker is not None:
+        res.chunk_report = chunker.report
+    if errors:
+        raise errors[0]
+    return res
+
+def adaptive_chunks(reader, chunker: AdaptiveChunker, first: pd.DataFrame | None = None) -> Iterator[pd.DataFrame]:
+    """Lê do TextFileReader/iterador com get_chunk no tamanho atual do chunker."""
+    if first is not None:
+        yield first
+    while True:
+        try:
+            df = reader.get_chunk(chunker.size)
+        except StopIteration:
+            return
+        if not len(df):
+            return
+        yield df
@@ -0,0 +1,278 @@
+# src/lcr_dataengineering_sql/features/profiling.py
+from __future__ import annotations
+import datetime as dt
+import json
+import os
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, Callable, Mapping, Union
+import pandas as pd
+from sqlalchemy.types import (BigInteger, Boolean, Date, DateTime, Float, Integer, Numeric, SmallInteger,
+                              String, Text, TypeEngine, Unicode, UnicodeText)
+
+# candidatos em ordem de preferência: o primeiro que sobreviver ao arquivo inteiro vence
+KINDS = ["bool", "int", "decimal", "float", "date", "datetime", "string"]
+
+DATE_FORMATS = ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%m/%d/%y", "%d/%m/%y", "%Y/%m/%d", "%d.%m.%Y"]
+DATETIME_FORMATS = ["%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S.%f",
+                    "%m/%d/%Y %H:%M", "%m/%d/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%d/%m/%Y %H:%M:%S"]
+
+_INT = r"[+-]?\d+"
+_LEADING_ZERO = r"[+-]?0\d"      # CEP/códigos ("01960"): como número perderiam o zero
+_DEC = r"[+-]?(?:\d+\.?\d*|\.\d+)"
+_SCI = r"[+-]?(?:\d+\.?\d*|\.\d+)[eE][+-]?\d+"
+_DATEISH = r"\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}(?:[ T].*)?"
+_BOOL = {"true", "false"}
+
+# maior VARCHAR(n)/NVARCHAR(n) antes de cair em TEXT/(max)
+_MAX_VARCHAR = {"mssql": 8000, "mysql": 16383}
+_MAX_NVARCHAR = {"mssql": 4000}
+_EMPTY_LENGTH = 255   # coluna sem nenhum valor no arquivo
+# versão assumida no preview do to_ddl sem conexão (dialect "cru" não tem server_version_info:
+# o MSSQL compila DATE como DATETIME e NVARCHAR(max) como NTEXT)
+_PREVIEW_VERSIONS = {"mssql": (16,), "postgresql": (16,), "mysql": (8, 0), "oracle": (19,)}
+
+@dataclass
+class ColumnProfile:
+    """Estatísticas de uma coluna acumuladas sobre o arquivo inteiro."""
+    name: str
+    rows: int = 0
+    nulls: int = 0
+    kinds: list[str] = field(default_factory=lambda: list(KINDS))
+    formats: list[str] = field(default_factory=lambda: DATE_FORMATS + DATETIME_FORMATS)
+    min_value: Any = None
+    max_value: Any = None
+    int_digits: int = 0
+    scale: int = 0
+    max_length: int = 0
+    non_ascii: bool = False
+
+    @property
+    def kind(self) -> str:
+        return "empty" if self.rows == self.nulls else self.kinds[0]
+
+    @property
+    def nullable(self) -> bool:
+        return self.nulls > 0
+
+    @property
+    def date_format(self) -> str | None:
+        fmts = DATE_FORMATS if self.kind == "date" else DATETIME_FORMATS if self.kind == "datetime" else []
+        return next((f for f in self.formats if f in fmts), None)
+
+    def _drop(self, kind: str) -> None:
+        if kind in self.kinds:
+            self.kinds.remove(kind)
+
+    def update(self, col: pd.Series, decimal: str = ".") -> None:
+        """Acumula um chunk (strings cruas, NaN = nulo)."""
+        self.rows += len(col)
+        values = col.dropna()
+        self.nulls += len(col) - len(values)
+        if not len(values):
+            return
+        # estatísticas de valores distintos são as mesmas: trabalha só com os únicos do chunk
+        raw = pd.Series(values.unique(), dtype=object).astype(str)
+        self.max_length = max(self.max_length, int(raw.str.len().max()))
+        if not self.non_ascii:
+            self.non_ascii = not bool(raw.str.isascii().all())
+        s = raw.str.strip()
+        if decimal != ".":
+            s = s.str.replace(decimal, ".", regex=False)
+
+        if "bool" in self.kinds and not s.str.lower().isin(_BOOL).all():
+            self._drop("bool")
+        if s.str.match(_LEADING_ZERO).any():
+            for k in ("int", "decimal", "float"):
+                self._drop(k)
+        if "int" in self.kinds and not s.str.fullmatch(_INT).all():
+            self._drop("int")
+        is_dec = s.str.fullmatch(_DEC)
+        if "decimal" in self.kinds and not is_dec.all():
+            self._drop("decimal")
+        if "float" in self.kinds and not (is_dec | s.str.fullmatch(_SCI)).all():
+            self._drop("float")
+        if {"int", "decimal", "float"} & set(self.kinds):
+            self._numeric(s)
+        if {"date", "datetime"} & set(self.kinds):
+            self._dates(s)
+
+    def _numeric(self, s: pd.Series) -> None:
+        if "int" in self.kinds:
+            ints = s.map(int)  # int do Python: sem estouro acima de int64
+            lo, hi = int(ints.min()), int(ints.max())
+        else:
+            num = pd.to_numeric(s, errors="coerce")
+            lo, hi = float(num.min()), float(num.max())
+        self.min_value = lo if self.min_value is None else min(self.min_value, lo)
+        self.max_value = hi if self.max_value is None else max(self.max_value, hi)
+        if "decimal" in self.kinds:
+            parts = s.str.lstrip("+-").str.split(".", n=1, expand=True)
+            whole = parts[0].str.lstrip("0").str.len()
+            self.int_digits = max(self.int_digits, int(whole.max()))
+            if parts.shape[1] > 1:
+                frac = parts[1].fillna("").str.rstrip("0").str.len()
+                self.scale = max(self.scale, int(frac.max()))
+
+    def _dates(self, s: pd.Series) -> None:
+        if not s.str.fullmatch(_DATEISH).all():
+            self._drop("date")
+            self._drop("datetime")
+            self.formats = []
+            return
+        self.formats = [f for f in self.formats
+                        if pd.to_datetime(s, format=f, errors="coerce").notna().all()]
+        if not any(f in DATE_FORMATS for f in self.formats):
+            self._drop("date")
+        if not any(f in DATETIME_FORMATS for f in self.formats):
+            self._drop("datetime")
+
+# (perfil da coluna, dialect) -> tipo; o type_map aceita o tipo pronto ou uma função
+TypeRule = Union[TypeEngine, Callable[[ColumnProfile, str], TypeEngine]]
+
+def _string(c: ColumnProfile, dialect: str) -> TypeEngine:
+    n = max(c.max_length, 1)
+    if c.non_ascii and dialect in _MAX_NVARCHAR:
+        return Unicode(n) if n <= _MAX_NVARCHAR[dialect] else UnicodeText()
+    return String(n) if n <= _MAX_VARCHAR.get(dialect, 10_485_760) else Text()
+
+def _int(c: ColumnProfile, dialect: str) -> TypeEngine:
+    lo, hi = c.min_value, c.max_value
+    if -2**15 <= lo and hi < 2**15:
+        return SmallInteger()
+    if -2**31 <= lo and hi < 2**31:
+        return Integer()
+    if -2**63 <= lo and hi < 2**63:
+        return BigInteger()
+    return Numeric(min(c.int_digits, 38), 0)
+
+def _decimal(c: ColumnProfile, dialect: str) -> TypeEngine:
+    p = max(c.int_digits + c.scale, 1)
+    return Numeric(p, c.scale) if p <= 38 else Float(53)
+
+DEFAULT_TYPES: dict[str, TypeRule] = {
+    "bool": lambda c, d: Boolean(),
+    "int": _int,
+    "decimal": _decimal,
+    "float": lambda c, d: Float(53),
+    "date": lambda c, d: Date(),
+    "datetime": lambda c, d: DateTime(),
+    "string": _string,
+    "empty": lambda c, d: String(_EMPTY_LENGTH),
+}
+
+@dataclass
+class TableProfile:
+    """Perfil do arquivo inteiro; salvo em JSON para reaproveitar em cargas seguintes."""
+    source: str = ""
+    rows: int = 0
+    sep: str = ","
+    encoding: str = "utf-8"
+    decimal: str = "."
+    created_at: str = ""
+    columns: list[ColumnProfile] = field(default_factory=list)
+
+    def column(self, name: str) -> ColumnProfile:
+        return next(c for c in self.columns if c.name == name)
+
+    def sql_type(self, col: ColumnProfile, dialect: str, type_map: Mapping[str, TypeRule] | None = None) -> TypeEngine:
+        # precedência: nome da coluna no type_map > tipo inferido no type_map > padrão
+        rules = {**DEFAULT_TYPES, **(type_map or {})}
+        rule = rules.get(col.name) or rules[col.kind]
+        return rule(col, dialect) if callable(rule) else rule
+
+    def to_columns(self, dialect: str, type_map: Mapping[str, TypeRule] | None = None,
+                   rename: Mapping[str, str] | None = None) -> list[dict]:
+        """Colunas no formato de get_columns (entrada do create_table_from_columns)."""
+        rename = rename or {}
+        return [{"name": rename.get(c.name, c.name), "type": self.sql_type(c, dialect, type_map),
+                 "nullable": c.nullable} for c in self.columns]
+
+    def to_ddl(self, dialect: Any, table: str, schema: str = "", type_map: Mapping[str, TypeRule] | None = None,
+               pk: list[str] | None = None) -> str:
+        """
+        CREATE TABLE compilado para o dialect (para revisão; a criação usa create_table_from_columns).
+        dialect: o Dialect do banco (ex.: repo.db.dialect, com a versão real do servidor) ou o nome;
+        pelo nome assume uma versão recente do servidor (_PREVIEW_VERSIONS).
+        """
+        from sqlalchemy import Column, MetaData, PrimaryKeyConstraint, Table
+        from sqlalchemy.dialects import registry
+        from sqlalchemy.schema import CreateTable
+        if isinstance(dialect, str):
+            name = dialect.replace("+", ".").split(".")[0]
+            compiler = registry.load(dialect.replace("+", "."))()
+            if not compiler.server_version_info:
+                compiler.server_version_info = _PREVIEW_VERSIONS.get(name)
+            if name == "mssql":
+                compiler._setup_version_attributes()  # o que o initialize() faria ao conectar
+        else:
+            compiler, name = dialect, dialect.name
+        cols = [Column(c["name"], c["type"], nullable=c["nullable"] and c["name"] not in (pk or []),
+                       autoincrement=False)
+                for c in self.to_columns(name, type_map)]
+        extra = [PrimaryKeyConstraint(*pk)] if pk else []
+        t = Table(table, MetaData(), *cols, *extra, schema=schema or None)
+        return str(CreateTable(t).compile(dialect=compiler)).strip()
+
+    def read_options(self) -> dict:
+        """dtype/parse_dates para o pd.read_csv ler cada coluna como o perfil viu (ex.: CEP com zero)."""
+        dtype, dates, formats = {}, [], {}
+        for c in self.columns:
+            k = c.kind
+            if k == "int":
+                dtype[c.name] = "Int64" if -2**63 <= c.min_value and c.max_value < 2**63 else str
+            elif k == "bool":
+                dtype[c.name] = "boolean"
+            elif k in ("decimal", "float"):
+                # além de 15 dígitos o float64 perde precisão: vai como texto para o banco converter
+                dtype[c.name] = "float64" if k == "float" or c.int_digits + c.scale <= 15 else str
+            elif k in ("date", "datetime"):
+                dtype[c.name] = str
+                dates.append(c.name)
+                formats[c.name] = c.date_format
+            else:
+                dtype[c.name] = str
+        return {"dtype": dtype, "parse_dates": dates or None, "date_format": formats or None}
+
+    def save(self, path: str) -> str:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f, indent=2, ensure_ascii=False)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> TableProfile:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        data["columns"] = [ColumnProfile(**c) for c in data.get("columns", [])]
+        return cls(**data)
+
+    def renamed(self, mapping: Mapping[str, str]) -> TableProfile:
+        return replace(self, columns=[replace(c, name=mapping.get(c.name, c.name)) for c in self.columns])
+
+def profile_frames(frames, decimal: str = ".", source: str = "") -> TableProfile:
+    """Perfil a partir de DataFrames de strings (um chunk por vez; memória limitada ao chunk)."""
+    prof = TableProfile(source=source, decimal=decimal,
+                        created_at=dt.datetime.now().isoformat(timespec="seconds"))
+    cols: dict[str, ColumnProfile] = {}
+    for df in frames:
+        for name in df.columns:
+            c = cols.get(str(name))
+            if c is None:
+                c = cols[str(name)] = ColumnProfile(str(name), rows=prof.rows, nulls=prof.rows)
+            c.update(df[name], decimal=decimal)
+        prof.rows += len(df)
+    prof.columns = list(cols.values())
+    return prof
+
+def profile_csv(csv_path: str, sep: str = ",", encoding: str = "utf-8", decimal: str = ".",
+                chunksize: int = 200_000, save_to: str | None = None) -> TableProfile:
+    """
+    Varre o CSV inteiro em chunks (tudo como texto, nulos como o pandas os reconhece) e
+    acompanha por coluna: nulos, maior tamanho, faixa numérica, dígitos/escala e formatos
+    de data que seguem válidos. O tipo sai do arquivo todo, não de uma amostra.
+    """
+    frames = pd.read_csv(csv_path, sep=sep, encoding=encoding, dtype=str, chunksize=chunksize, low_memory=False)
+    prof = profile_frames(frames, decimal=decimal, source=os.path.abspath(csv_path))
+    prof.sep, prof.encoding = sep, encoding
+    if save_to:
+        prof.save(save_to)
+    return prof
@@ -1,20 +1,64 @@
 from __future__ import annotations
-from typing import Iterable, Mapping, Any
+import itertools
+import os
+import time
+from contextlib import closing
+from typing import Iterable, Iterator, Mapping, Any
 import pandas as pd
-from ..core.ports import Db
-from ..utils.naming import rename_df_columns
-
-def _b(name: str) -> str:
-    return f"[{name.replace(']', ']]')}]"
-
-def _fqtn(schema: str, table: str) -> str:
-    return f"{_b(schema)}.{_b(table)}"
+from ..infra.chunking import AdaptiveChunker, plan_for_df
+from ..infra.instrumentation import instrument_methods
+from ..core.ports import Db, LoadManifest
+from ..utils.csv_ranges import parallel_frames
+from ..utils.files import CountingReader, file_fingerprint
+from ..utils.naming import build_column_mapping, column_renamer, rename_df_columns
+from ..utils import parquet as pq_utils
+from ..utils.scalars import to_python_scalar
+from .checkpoint import (ManifestFile, ManifestTable, LoadTracker, csv_chunks, resume_point,
+                         tag_chunks, tag_ranges)
+from .partitioned import PartitionedResult, read_partitioned
+from .profiling import TableProfile, TypeRule, profile_csv
+from .incremental import CONTROL_TABLE, SyncResult, sync_incremental
+from .pipeline import CopyResult, LoadResult, UpsertResult, adaptive_chunks, run_pipeline
 
+@instrument_methods
 class Repo:
     """Fachada genérica, recebe Db e opera em qualquer schema/tabela/view/procedure."""
     def __init__(self, db: Db):
         self.db = db
 
+    @staticmethod
+    def _read_size(chunksize: int | str) -> int:
+        # no modo auto o reader só fornece a amostra; o resto vem de get_chunk(chunker.size)
+        return 1000 if chunksize == "auto" else int(chunksize)
+
+    def _chunker(self, sample: pd.DataFrame, chunksize: int | str, writers: int,
+                 queue_depth: int) -> AdaptiveChunker | None:
+        if chunksize != "auto":
+            return None
+        # orçamento de memória vale para todos os lotes em voo: fila + writers + o do parser
+        return plan_for_df(sample, self._dialect(), in_flight=max(int(queue_depth), 1) + max(int(writers), 1) + 1)
+
+    def _dialect(self) -> str:
+        return getattr(getattr(self.db, "dialect", None), "name", "")
+
+    def _manifest(self, manifest: LoadManifest | str | None, schema: str) -> LoadManifest:
+        # None: tabela de controle no schema destino; str: arquivo JSON lines local
+        if manifest is None:
+            return ManifestTable(self.db, schema)
+        return ManifestFile(manifest) if isinstance(manifest, str) else manifest
+
+    @staticmethod
+    def _load_name(checkpoint: bool | str, path: str, schema: str, table: str) -> str:
+        return checkpoint if isinstance(checkpoint, str) else f"{os.path.abspath(path)}->{schema}.{table}"
+
+    @staticmethod
+    def _read_options(profile: TableProfile | str | None, parse_dates: list[str] | None) -> dict:
+        # com perfil, dtype/datas vêm dele (ex.: CEP "01960" continua texto); sem, o parse_dates recebido
+        if profile is None:
+            return {"parse_dates": parse_dates}
+        prof = TableProfile.load(profile) if isinstance(profile, str) else profile
+        return prof.read_options()
+
     # ------------------- Schema / Tabelas -------------------
 
     def ensure_schema(self, schema: str) -> None:
@@ -23,45 +67,292 @@ class Repo:
     def create_table_raw(self, create_table_sql: str) -> None:
         self.db.create_table_from_query(create_table_sql)
 
+    def profile_csv(self, csv_path: str, sep=",", encoding="utf-8", decimal=".",
+                    chunksize: int = 200_000, save_to: str | None = None) -> TableProfile:
+        """Varre o arquivo inteiro (streaming) e devolve o perfil de tipos; save_to grava em JSON."""
+        return profile_csv(csv_path, sep=sep, encoding=encoding, decimal=decimal,
+                           chunksize=chunksize, save_to=save_to)
+
+    def create_table_from_profile(self, profile: TableProfile | str, schema: str, table: str,
+                                  pk: list[str] | None = None, column_prefix: str | None = None,
+                                  type_map: Mapping[str, TypeRule] | None = None) -> bool:
+        """
+        CREATE TABLE com os tipos mínimos do perfil (VARCHAR(n), SMALLINT, DECIMAL(p,s), DATE...)
+        no dialect do Db. type_map sobrescreve por nome de coluna ou por tipo inferido.
+        """
+        prof = TableProfile.load(profile) if isinstance(profile, str) else profile
+        rename = build_column_mapping([c.name for c in prof.columns], column_prefix) if column_prefix else None
+        return self.db.create_table_from_columns(schema, table, prof.to_columns(self._dialect(), type_map, rename),
+                                                 pk=pk, if_not_exists=True)
+
     def create_table_from_csv(self, csv_path: str, schema: str, table: str,
                               pk: list[str] | None = None, sep=",", encoding="utf-8",
                               decimal=".", parse_dates: list[str] | None = None,
-                              sample_rows: int = 100000) -> bool:
-        # lê sample primeiro para criar com tipos razoáveis
-        df0 = pd.read_csv(csv_path, sep=sep, encoding=encoding, decimal=decimal,
-                          parse_dates=parse_dates, nrows=sample_rows, low_memory=False)
-        created = self.db.create_table_from_df(df0, schema=schema, table=table, pk=pk, if_not_exists=True)
-        # insere sample
-        if len(df0):
-            self.db.insert_df(df0, schema=schema, table=table)
-        # stream restante
-        it = pd.read_csv(csv_path, sep=sep, encoding=encoding, decimal=decimal,
-                         parse_dates=parse_dates, chunksize=100000, skiprows=range(1, len(df0)+1),
-                         low_memory=False)
-        for chunk in it:
-            if len(chunk):
-                self.db.insert_df(chunk, schema=schema, table=table)
-        return created
+                              sample_rows: int = 100000, profile: TableProfile | str | None = None,
+                              type_map: Mapping[str, TypeRule] | None = None) -> bool:
+        # profile (objeto ou JSON salvo): tipos do arquivo inteiro em vez da amostra de sample_rows
+        if profile is not None:
+            created = self.create_table_from_profile(profile, schema, table, pk=pk, type_map=type_map)
+            self.load_csv(csv_path, schema, table, sep=sep, encoding=encoding, decimal=decimal, profile=profile)
+            return created
+        return self.create_and_load_csv(csv_path, schema, table, pk=pk, sep=sep, encoding=encoding,
+                                        decimal=decimal, parse_dates=parse_dates,
+                                        sample_rows=sample_rows).created
+
+    def create_and_load_csv(self, csv_path: str, schema: str, table: str,
+                            pk: list[str] | None = None, sep=",", encoding="utf-8",
+                            decimal=".", parse_dates: list[str] | None = None,
+                            sample_rows: int = 100000, chunksize: int | str = 100000,
+                            writers: int = 1, queue_depth: int = 2, ordered: bool = False) -> LoadResult:
+        """
+        Passada única: o primeiro chunk (sample_rows) infere os tipos e cria a tabela,
+        é inserido, e o mesmo reader segue com o restante do arquivo.
+        chunksize="auto": lotes dimensionados pela largura/memória e ajustados pela vazão.
+        """
+        t0 = time.perf_counter()
+        with CountingReader(open(csv_path, "rb")) as f:
+            it = pd.read_csv(f, sep=sep, encoding=encoding, decimal=decimal, parse_dates=parse_dates,
+                             chunksize=self._read_size(chunksize), low_memory=False)
+            try:
+                df0 = it.get_chunk(sample_rows)
+            except StopIteration:  # arquivo só com cabeçalho
+                df0 = pd.read_csv(csv_path, sep=sep, encoding=encoding, nrows=0)
+            sample_seconds = time.perf_counter() - t0
+            created = self.db.create_table_from_df(df0, schema=schema, table=table, pk=pk, if_not_exists=True)
+            chunker = self._chunker(df0, chunksize, writers, queue_depth)
+            # o chain solta o sample assim que ele vai para a fila
+            chunks = adaptive_chunks(it, chunker, df0) if chunker else itertools.chain([df0], it)
+            del df0
+            res = run_pipeline(chunks, self.db, schema, table, writers=writers, queue_depth=queue_depth,
+                               ordered=ordered, chunksize=chunksize, chunker=chunker)
+            res.bytes_read = f.bytes_read
+        res.parse_seconds += sample_seconds
+        res.wall_seconds = time.perf_counter() - t0
+        res.created = created
+        return res
 
     def create_table_from_parquet(self, parquet_path: str, schema: str, table: str,
-                                  pk: list[str] | None = None) -> bool:
-        df = pd.read_parquet(parquet_path)  # requer pyarrow
+                                  pk: list[str] | None = None, columns: list[str] | None = None) -> bool:
+        # tipos vêm do schema Arrow; nenhuma linha é materializada (requer pyarrow)
+        df = pq_utils.empty_frame(parquet_path, columns=columns)
         return self.db.create_table_from_df(df, schema=schema, table=table, pk=pk, if_not_exists=True)
 
     def insert_csv(self, csv_path: str, schema: str, table: str,
                    sep=",", encoding="utf-8", decimal=".", parse_dates: list[str] | None = None,
-                   chunksize: int = 100000) -> int:
-        total = 0
-        it = pd.read_csv(csv_path, sep=sep, encoding=encoding, decimal=decimal,
-                         parse_dates=parse_dates, chunksize=chunksize, low_memory=False)
-        for chunk in it:
-            if len(chunk):
-                total += self.db.insert_df(chunk, schema=schema, table=table, chunksize=chunksize)
-        return total
-
-    def insert_parquet(self, parquet_path: str, schema: str, table: str, chunksize: int = 100000) -> int:
-        df = pd.read_parquet(parquet_path)
-        return self.db.insert_df(df, schema=schema, table=table, chunksize=chunksize)
+                   chunksize: int | str = 100000, writers: int = 1, queue_depth: int = 2,
+                   ordered: bool = False, profile: TableProfile | str | None = None,
+                   checkpoint: bool | str = False, manifest: LoadManifest | str | None = None,
+                   parse_processes: int = 0) -> int:
+        return self.load_csv(csv_path, schema, table, sep=sep, encoding=encoding, decimal=decimal,
+                             parse_dates=parse_dates, chunksize=chunksize, writers=writers,
+                             queue_depth=queue_depth, ordered=ordered, profile=profile,
+                             checkpoint=checkpoint, manifest=manifest, parse_processes=parse_processes).rows
+
+    def load_csv(self, csv_path: str, schema: str, table: str, column_prefix: str | None = None,
+                 sep=",", encoding="utf-8", decimal=".", parse_dates: list[str] | None = None,
+                 chunksize: int | str = 100000, writers: int = 1, queue_depth: int = 2,
+                 ordered: bool = False, profile: TableProfile | str | None = None,
+                 checkpoint: bool | str = False, manifest: LoadManifest | str | None = None,
+                 parse_processes: int = 0) -> LoadResult:
+        """
+        Insere o CSV com parse e escrita sobrepostos (1 parser + `writers` conexões).
+        Retorna LoadResult com linhas e tempos por estágio para achar o gargalo.
+        chunksize="auto": ver create_and_load_csv (res.chunk_report traz os tamanhos usados).
+        profile: lê cada coluna com o tipo do perfil (profile_csv) em vez da inferência do pandas.
+        checkpoint: carga retomável (True ou nome da carga; padrão "caminho->schema.tabela").
+          Cada chunk grava (fingerprint, índice, offset em bytes, linhas) no manifest na mesma
+          transação do dado; rodar de novo após uma falha faz seek direto para o primeiro chunk
+          não commitado (res.resumed_rows). Insert+commit de cada chunk saem em série, na
+          ordem do arquivo: com checkpoint usa um writer só (os demais ficariam ociosos).
+        manifest: None = tabela lcr_load_manifest no schema destino; str = arquivo local.
+        parse_processes: N > 0 faz o parse em N processos sobre faixas de bytes do arquivo
+          (mmap, cortes em fronteira de registro; ver utils.csv_ranges). Cada faixa (~16 MiB)
+          vira um chunk; chunksize passa a ser só o lote do insert. Os processos são "spawn" e
+          reimportam o script chamador: ele precisa de `if __name__ == "__main__":`; sem isso o
+          pool quebra e o parse segue serial (aviso no log).
+        """
+        transform = column_renamer(column_prefix) if column_prefix else None
+        read_options = dict(sep=sep, encoding=encoding, decimal=decimal, low_memory=False,
+                            **self._read_options(profile, parse_dates))
+        if checkpoint:
+            return self._load_csv_resumable(csv_path, schema, table, transform, checkpoint, manifest,
+                                            chunksize, writers, queue_depth, read_options, parse_processes)
+        if parse_processes:
+            frames = (df for _, df in parallel_frames(csv_path, parse_processes, **read_options))
+            res = run_pipeline(frames, self.db, schema, table, transform=transform, writers=writers,
+                               queue_depth=queue_depth, ordered=ordered, chunksize=chunksize)
+            res.bytes_read = os.path.getsize(csv_path)
+            return res
+        with CountingReader(open(csv_path, "rb")) as f:
+            it = pd.read_csv(f, sep=sep, encoding=encoding, decimal=decimal,
+                             chunksize=self._read_size(chunksize), low_memory=False,
+                             **self._read_options(profile, parse_dates))
+            chunker = None
+            if chunksize == "auto":
+                # amostra pequena só para medir largura e bytes por linha
+                probe = next(iter(it), None)
+                chunker = self._chunker(probe, chunksize, writers, queue_depth) if probe is not None else None
+                it = adaptive_chunks(it, chunker, probe) if chunker else iter(())
+            res = run_pipeline(it, self.db, schema, table, transform=transform, writers=writers,
+                               queue_depth=queue_depth, ordered=ordered, chunksize=chunksize, chunker=chunker)
+            res.bytes_read = f.bytes_read
+        return res
+
+    def _load_csv_resumable(self, csv_path: str, schema: str, table: str, transform, checkpoint: bool | str,
+                            manifest: LoadManifest | str | None, chunksize: int | str, writers: int,
+                            queue_depth: int, read_options: dict, parse_processes: int = 0) -> LoadResult:
+        t0 = time.perf_counter()
+        writers = 1  # escrita em série (ordered): writers extras só prenderiam conexões do pool
+        store = self._manifest(manifest, schema)
+        start = resume_point(store, self._load_name(checkpoint, csv_path, schema, table), file_fingerprint(csv_path))
+        tracker = LoadTracker(store, start)
+        chunker = None
+        read_size = self._read_size(chunksize)
+        if parse_processes:
+            chunks = tag_ranges(parallel_frames(csv_path, parse_processes, start=start.byte_offset or 0,
+                                                **read_options), start)
+        else:
+            chunks = csv_chunks(csv_path, lambda: chunker.size if chunker else read_size, start, **read_options)
+        if chunksize == "auto" and not parse_processes:
+            probe = next(chunks, None)
+            chunker = self._chunker(probe, chunksize, writers, queue_depth) if probe is not None else None
+            chunks = itertools.chain([probe], chunks) if probe is not None else iter(())
+        res = run_pipeline(chunks, self.db, schema, table, transform=transform, writers=writers,
+                           queue_depth=queue_depth, chunksize=chunksize, chunker=chunker, tracker=tracker)
+        end = tracker.last.byte_offset if tracker.last.byte_offset is not None else 0
+        res.bytes_read = max(end - (start.byte_offset or 0), 0)
+        res.resumed_rows, res.resumed_chunks = start.rows_total, start.chunk_index + 1
+        res.wall_seconds = time.perf_counter() - t0
+        return res
+
+    def reset_load_checkpoint(self, name: str, schema: str = "", manifest: LoadManifest | str | None = None) -> None:
+        """Apaga o progresso da carga `name` (o dado já inserido não é removido)."""
+        self._manifest(manifest, schema).reset(name)
+
+    def insert_parquet(self, parquet_path: str, schema: str, table: str, chunksize: int = 100000,
+                       columns: list[str] | None = None, writers: int = 1, queue_depth: int = 2,
+                       checkpoint: bool | str = False, manifest: LoadManifest | str | None = None) -> int:
+        return self.load_parquet(parquet_path, schema, table, chunksize=chunksize, columns=columns,
+                                 writers=writers, queue_depth=queue_depth, checkpoint=checkpoint,
+                                 manifest=manifest).rows
+
+    def load_parquet(self, parquet_path: str, schema: str, table: str, chunksize: int = 100000,
+                     columns: list[str] | None = None, writers: int = 1, queue_depth: int = 2,
+                     ordered: bool = False, checkpoint: bool | str = False,
+                     manifest: LoadManifest | str | None = None) -> LoadResult:
+        """
+        Insere Parquet em streaming (record batches de até `chunksize` linhas), com memória
+        limitada a ~queue_depth+writers batches. Aceita arquivo, diretório ou glob.
+        checkpoint/manifest: como no load_csv; a retomada pula as linhas já commitadas
+        (row groups inteiros pelo footer, sem ler).
+        """
+        if not checkpoint:
+            frames = pq_utils.iter_frames(parquet_path, columns=columns, batch_size=chunksize)
+            return run_pipeline(frames, self.db, schema, table, writers=writers,
+                                queue_depth=queue_depth, ordered=ordered, chunksize=chunksize)
+        t0 = time.perf_counter()
+        store = self._manifest(manifest, schema)
+        start = resume_point(store, self._load_name(checkpoint, parquet_path, schema, table),
+                             pq_utils.fingerprint(parquet_path))
+        frames = pq_utils.iter_frames(parquet_path, columns=columns, batch_size=chunksize,
+                                      skip_rows=start.rows_total)
+        # como no load_csv: com checkpoint a escrita é em série, um writer basta
+        res = run_pipeline(tag_chunks(frames, start), self.db, schema, table, writers=1,
+                           queue_depth=queue_depth, chunksize=chunksize,
+                           tracker=LoadTracker(store, start))
+        res.resumed_rows, res.resumed_chunks = start.rows_total, start.chunk_index + 1
+        res.wall_seconds = time.perf_counter() - t0
+        return res
+
+    def upsert_df(self, df: pd.DataFrame, schema: str, table: str, key_columns: list[str],
+                  chunksize: int = 100000) -> UpsertResult:
+        """
+        Insere/atualiza por key_columns numa transação: staging temporária + um comando
+        set-based (MERGE / ON CONFLICT / ON DUPLICATE KEY). Custo ~ linhas do df, não da tabela.
+        """
+        t0 = time.perf_counter()
+        ins, upd = self.db.upsert_df(df, schema, table, key_columns, chunksize=chunksize)
+        return UpsertResult(rows=len(df), inserted=ins, updated=upd, chunks=1 if len(df) else 0,
+                            wall_seconds=time.perf_counter() - t0)
+
+    def upsert_csv(self, csv_path: str, schema: str, table: str, key_columns: list[str],
+                   column_prefix: str | None = None, sep=",", encoding="utf-8", decimal=".",
+                   parse_dates: list[str] | None = None, chunksize: int = 100000) -> UpsertResult:
+        """Upsert do CSV em chunks; cada chunk é uma transação (chave repetida: vale o último)."""
+        t0 = time.perf_counter()
+        res = UpsertResult()
+        rename = column_renamer(column_prefix) if column_prefix else None
+        with pd.read_csv(csv_path, sep=sep, encoding=encoding, decimal=decimal,
+                         parse_dates=parse_dates, chunksize=chunksize, low_memory=False) as it:
+            for df in it:
+                if rename:
+                    df = rename(df)
+                ins, upd = self.db.upsert_df(df, schema, table, key_columns, chunksize=chunksize)
+                res.rows += len(df)
+                res.inserted += ins
+                res.updated += upd
+                res.chunks += 1
+        res.wall_seconds = time.perf_counter() - t0
+        return res
+
+    def copy_table(self, schema: str, table: str, target: Repo | Db,
+                   target_schema: str | None = None, target_table: str | None = None,
+                   columns: list[str] | None = None, where: str | None = None,
+                   params: Mapping[str, Any] | None = None, create: bool = True,
+                   fetch_size: int = 100_000, writers: int = 1, queue_depth: int = 2) -> CopyResult:
+        """
+        Copia uma tabela deste banco para `target` em streaming: cursor do lado do
+        servidor na origem, bulk insert no destino, fila limitada entre os dois.
+        create=True cria a tabela destino com os tipos refletidos da origem (+ PK).
+        """
+        dst = target.db if isinstance(target, Repo) else target
+        target_schema = schema if target_schema is None else target_schema
+        target_table = target_table or table
+        t0 = time.perf_counter()
+        created = False
+        if create:
+            cols = self.db.get_columns(schema, table)
+            if columns:
+                wanted = set(columns)
+                cols = [c for c in cols if c["name"] in wanted]
+            pk = [k for k in self.db.get_pk(schema, table) if k in {c["name"] for c in cols}]
+            created = dst.create_table_from_columns(target_schema, target_table, cols, pk=pk or None)
+        col_sql = "*" if not columns else ", ".join(self.db.quote(c) for c in columns)
+        sql = f"SELECT {col_sql} FROM {self.db.fqtn(schema, table)}" + (f" WHERE {where}" if where else "")
+        peak = moved = 0
+
+        def _measure(df: pd.DataFrame) -> pd.DataFrame:
+            nonlocal peak, moved
+            size = int(df.memory_usage(deep=True, index=False).sum())
+            peak, moved = max(peak, size), moved + size
+            return df
+
+        frames = self.db.query_batches(sql, params, fetch_size=fetch_size, as_frame=True)
+        with closing(frames):
+            res = run_pipeline(frames, dst, target_schema, target_table, transform=_measure,
+                               writers=writers, queue_depth=queue_depth, chunksize=fetch_size)
+        out = CopyResult(**vars(res), source=f"{schema}.{table}", target=f"{target_schema}.{target_table}",
+                         peak_batch_bytes=peak, max_batches_in_flight=max(queue_depth, 1) + max(writers, 1) + 1)
+        out.created = created
+        out.bytes_read = moved  # bytes em memória lidos da origem (mb_per_second)
+        out.wall_seconds = time.perf_counter() - t0
+        return out
+
+    def sync_incremental(self, schema: str, table: str, target: Repo | Db, watermark_column: str,
+                         key_columns: list[str] | None = None, target_schema: str | None = None,
+                         target_table: str | None = None, mode: str = "upsert", page_size: int = 50_000,
+                         columns: list[str] | None = None, where: str | None = None,
+                         params: Mapping[str, Any] | None = None, name: str | None = None,
+                         control_schema: str | None = None, control_table: str = CONTROL_TABLE) -> SyncResult:
+        """
+        Sync incremental desta tabela para `target`: só linhas com watermark acima do último
+        sync (ver features.incremental.sync_incremental). key_columns: PK da origem por padrão.
+        """
+        dst = target.db if isinstance(target, Repo) else target
+        return sync_incremental(self.db, dst, schema, table, watermark_column, key_columns=key_columns,
+                                target_schema=target_schema, target_table=target_table, mode=mode,
+                                page_size=page_size, columns=columns, where=where, params=params,
+                                name=name, control_schema=control_schema, control_table=control_table)
 
     def truncate_table(self, schema: str, table: str) -> None:
         self.db.truncate_table(schema, table)
@@ -70,27 +361,92 @@ class Repo:
         self.db.drop_table(schema, table, if_exists=if_exists)
 
     def delete_where(self, schema: str, table: str, where: str, params: Mapping[str, Any] | None = None) -> int:
-        sql = f"DELETE FROM {_fqtn(schema, table)} WHERE {where}"
+        sql = f"DELETE FROM {self.db.fqtn(schema, table)} WHERE {where}"
         return self.db.execute(sql, params or {})
 
     # ------------------- Selects -------------------
 
-    def select_raw(self, sql: str, params: Mapping[str, Any] | None = None) -> list[dict]:
-        return self.db.query_all(sql, params)
+    def _select(self, sql: str, params: Mapping[str, Any] | None, as_frame: bool):
+        # as_frame=True: DataFrame direto do cursor (sem um dict por linha)
+        return self.db.query_df(sql, params) if as_frame else self.db.query_all(sql, params)
+
+    def select_raw(self, sql: str, params: Mapping[str, Any] | None = None,
+                   as_frame: bool = False) -> list[dict] | pd.DataFrame:
+        return self._select(sql, params, as_frame)
+
+    def select_arrow(self, sql: str, params: Mapping[str, Any] | None = None, schema=None):
+        return self.db.query_arrow(sql, params, schema=schema)
 
     def select_top(self, schema: str, table: str, n: int = 10,
                    columns: Iterable[str] | str = "*",
-                   where: str | None = None, order_by: str | None = None) -> list[dict]:
-        cols = "*" if columns == "*" else ", ".join(_b(c) for c in columns)
-        sql = [f"SELECT TOP ({int(n)}) {cols} FROM {_fqtn(schema, table)}"]
-        if where:
-            sql.append(f"WHERE {where}")
-        if order_by:
-            sql.append(f"ORDER BY {order_by}")
-        return self.db.query_all(" ".join(sql))
+                   where: str | None = None, order_by: str | None = None,
+                   as_frame: bool = False) -> list[dict] | pd.DataFrame:
+        cols = None if columns == "*" else list(columns)
+        return self.db.select_table(schema, table, columns=cols, where=where, order_by=order_by,
+                                    limit=n, as_frame=as_frame)
+
+    def paginate(self, schema: str, table: str, key_columns: list[str], page_size: int = 10_000,
+                 where: str | None = None, params: Mapping[str, Any] | None = None,
+                 columns: list[str] | None = None, as_frame: bool = False) -> Iterator[list[dict] | pd.DataFrame]:
+        """
+        Percorre a tabela em páginas por keyset (seek): WHERE (chaves) > última chave vista
+        + ORDER BY chaves + TOP/LIMIT/FETCH do dialect. A página N custa o mesmo que a 1a
+        (sem OFFSET), desde que haja índice nas key_columns, que devem ser únicas e não nulas.
+        As key_columns entram no resultado mesmo se ausentes de `columns`.
+        """
+        keys = list(key_columns)
+        if columns:
+            columns = list(columns) + [k for k in keys if k not in columns]
+        after = None
+        while True:
+            page = self.db.seek_page(schema, table, keys, page_size, after=after, columns=columns,
+                                     where=where, params=params, as_frame=as_frame)
+            if not len(page):
+                return
+            last = page.iloc[-1] if as_frame else page[-1]
+            after = [to_python_scalar(last[k]) for k in keys]
+            yield page
+            if len(page) < page_size:
+                return
+
+    def read_partitioned(self, schema: str, table: str, partition_column: str, num_partitions: int = 4,
+                         columns: list[str] | None = None, where: str | None = None,
+                         params: Mapping[str, Any] | None = None, strategy: str = "auto",
+                         bounds: list | None = None, connections: int | None = None, output: str = "frame",
+                         path: str | None = None,
+                         fetch_size: int = 100_000) -> pd.DataFrame | Any | PartitionedResult:
+        """
+        Extração paralela por faixas de chave: limites por MIN/MAX ou quantis (NTILE), uma
+        conexão do pool por faixa. output="frame" | "arrow" | "parquet" (diretório em `path`,
+        um arquivo por partição). Ver features.partitioned.read_partitioned.
+        """
+        return read_partitioned(self.db, schema, table, partition_column, num_partitions, columns=columns,
+                                where=where, params=params, strategy=strategy, bounds=bounds,
+                                connections=connections, output=output, path=path, fetch_size=fetch_size)
+
+    def export_query(self, sql: str, path: str, format: str = "parquet",
+                     params: Mapping[str, Any] | None = None, fetch_size: int = 100_000,
+                     sep=",", encoding="utf-8") -> int:
+        """
+        Exporta o resultado lote a lote (cursor do lado do servidor): no máximo
+        `fetch_size` linhas em memória. Retorna o total de linhas gravadas.
+        """
+        if format == "parquet":
+            return pq_utils.write_frames(self.db.query_batches(sql, params, fetch_size=fetch_size, as_frame=True),
+                                         path)
+        if format == "csv":
+            # keep_empty: consulta sem linhas ainda grava o cabeçalho
+            frames = self.db.query_batches(sql, params, fetch_size=fetch_size, as_frame=True, keep_empty=True)
+            total, first = 0, True
+            with open(path, "w", encoding=encoding, newline="") as f:
+                for df in frames:
+                    df.to_csv(f, sep=sep, index=False, header=first)
+                    total, first = total + len(df), False
+            return total
+        raise ValueError(f"Formato de exportação não suportado: {format}")
 
     def count(self, schema: str, table: str) -> int:
-        row = self.db.query_all(f"SELECT COUNT(*) AS cnt FROM {_fqtn(schema, table)}")[0]
+        row = self.db.query_all(f"SELECT COUNT(*) AS cnt FROM {self.db.fqtn(schema, table)}")[0]
         return int(row["cnt"])
 
     # ------------------- Views -------------------
@@ -101,18 +457,18 @@ class Repo:
     def drop_view(self, schema: str, view: str, if_exists: bool = True) -> None:
         self.db.drop_view(schema, view, if_exists=if_exists)
 
-    def select_view(self, schema: str, view: str, n: int | None = None) -> list[dict]:
-        base = f"SELECT * FROM {_fqtn(schema, view)}"
-        sql = f"SELECT TOP ({n}) * FROM {_fqtn(schema, view)}" if n else base
-        return self.db.query_all(sql)
+    def select_view(self, schema: str, view: str, n: int | None = None,
+                    as_frame: bool = False) -> list[dict] | pd.DataFrame:
+        return self.db.select_table(schema, view, limit=n or None, as_frame=as_frame)
 
     # ------------------- Procedures -------------------
 
     def create_procedure(self, schema: str, proc: str, definition_sql: str, or_alter: bool = True) -> None:
         self.db.create_procedure(schema, proc, definition_sql, or_alter=or_alter)
 
-    def exec_procedure(self, schema: str, proc: str, params: Mapping[str, Any] | None = None) -> list[dict]:
-        return self.db.exec_procedure(schema, proc, params or {})
+    def exec_procedure(self, schema: str, proc: str, params: Mapping[str, Any] | None = None,
+                       as_frame: bool = False) -> list[dict] | pd.DataFrame:
+        return self.db.exec_procedure(schema, proc, params or {}, as_frame=as_frame)
 
     def create_table_from_csv_with_prefix(
             self,
@@ -127,11 +483,17 @@ class Repo:
             parse_dates: list[str] | None = None,
             sample_rows: int = 100_000,
             chunksize_insert: int = 100_000,
+            profile: TableProfile | str | None = None,
+            type_map: Mapping[str, TypeRule] | None = None,
     ) -> bool:
         """
         Cria a tabela a partir de um CSV, renomeando colunas (PREFIXO + MAIÚSCULO + saneado),
         e já insere todos os dados.
+        Com profile, os tipos vêm do perfil do arquivo inteiro (type_map usa os nomes originais).
         """
+        if profile is not None:
+            return self.create_table_from_profile(profile, schema, table, pk=pk, column_prefix=column_prefix,
+                                                  type_map=type_map)
         # 1) lê um sample para inferir tipos e criar a tabela
         df0 = pd.read_csv(
             csv_path,
@@ -159,23 +521,26 @@ class Repo:
             decimal=".",
             parse_dates: list[str] | None = None,
             chunksize: int = 100_000,
+            writers: int = 1,
+            queue_depth: int = 2,
+            ordered: bool = False,
+            profile: TableProfile | str | None = None,
     ) -> int:
         """
         Apenas insere (não cria). Renomeia colunas do CSV com o mesmo algoritmo do create_table_from_csv_with_prefix.
         """
-        total = 0
-        it = pd.read_csv(
+        return self.load_csv(
             csv_path,
+            schema,
+            table,
+            column_prefix=column_prefix,
             sep=sep,
             encoding=encoding,
             decimal=decimal,
             parse_dates=parse_dates,
             chunksize=chunksize,
-            low_memory=False,
-        )
-        for chunk in it:
-            if not len(chunk):
-                continue
-            chunk_db = rename_df_columns(chunk, prefix=column_prefix)
-            total += self.db.insert_df(chunk_db, schema=schema, table=table, chunksize=chunksize)
-        return total
+            writers=writers,
+            queue_depth=queue_depth,
+            ordered=ordered,
+            profile=profile,
+        ).rows
@@ -1,7 +1,75 @@
 from __future__ import annotations
-from typing import Mapping
-from ..core.ports import Db
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable, Mapping
+from ..core.ports import Db, AsyncDb
 from .repo import Repo
+from .async_repo import AsyncRepo
+
+# query SQL (select_raw como DataFrame) ou função que recebe o Repo do alias
+Task = str | Callable[[Repo], Any]
+AsyncTask = str | Callable[[AsyncRepo], Awaitable[Any]]
+Timeout = float | Mapping[str, float] | None
+# "schema.tabela" ou (schema, tabela)
+TableRef = str | tuple[str, str]
+
+@dataclass
+class AliasResult:
+    alias: str
+    value: Any = None
+    error: BaseException | None = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+@dataclass
+class FanOutResult:
+    """Resultado por alias (ou tabela, no copy); falhas/timeouts de um não derrubam os demais."""
+    results: dict[str, AliasResult] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+
+    @property
+    def ok(self) -> dict[str, Any]:
+        return {a: r.value for a, r in self.results.items() if r.ok}
+
+    @property
+    def errors(self) -> dict[str, BaseException]:
+        return {a: r.error for a, r in self.results.items() if not r.ok}
+
+    def raise_for_errors(self) -> None:
+        if self.errors:
+            msgs = "; ".join(f"{a}: {e!r}" for a, e in self.errors.items())
+            raise RuntimeError(f"Falha em {len(self.errors)} de {len(self.results)}: {msgs}")
+
+    def to_frame(self, alias_column: str = "alias"):
+        """Concatena os resultados bem-sucedidos num DataFrame com a coluna do alias."""
+        import pandas as pd
+        frames = []
+        for alias, value in self.ok.items():
+            if isinstance(value, pd.DataFrame):
+                df = value.copy(deep=False)
+            elif isinstance(value, list):
+                df = pd.DataFrame([dict(r) for r in value])
+            else:
+                df = pd.DataFrame({"value": [value]})
+            df.insert(0, alias_column, alias)
+            frames.append(df)
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame({alias_column: []})
+
+def _split(ref: TableRef) -> tuple[str, str]:
+    if isinstance(ref, str):
+        schema, _, table = ref.rpartition(".")
+        return schema, table
+    return ref[0], ref[1]
+
+def _timeout_for(timeout: Timeout, alias: str) -> float | None:
+    if isinstance(timeout, Mapping):
+        return timeout.get(alias)
+    return timeout
 
 class RepoRouter:
     def __init__(self, router: Mapping[str, Db]):
@@ -13,3 +81,107 @@ class RepoRouter:
         except KeyError:
             raise KeyError(f"Alias '{alias}' não registrado no db_router.")
         return Repo(db)
+
+    def fan_out(self, task: Task, aliases: Iterable[str] | None = None,
+                params: Mapping[str, Any] | None = None, timeout: Timeout = None) -> FanOutResult:
+        """
+        Roda a mesma consulta (ou função Repo -> valor) em vários aliases ao mesmo tempo,
+        uma thread por alias: a latência total fica perto da do banco mais lento.
+        timeout: segundos (global ou {alias: s}); quem estoura vira erro no resultado.
+        A consulta que estourou segue rodando na sua thread até o banco responder.
+        """
+        aliases = list(aliases or self._router.keys())
+        repos = {a: self.for_db(a) for a in aliases}
+        fn = task if callable(task) else (lambda repo: repo.select_raw(task, params, as_frame=True))
+
+        def _run(alias: str) -> tuple[Any, float]:
+            t0 = time.perf_counter()
+            return fn(repos[alias]), time.perf_counter() - t0
+
+        out = FanOutResult()
+        t_start = time.perf_counter()
+        ex = ThreadPoolExecutor(max_workers=max(len(aliases), 1), thread_name_prefix="lcr-fanout")
+        try:
+            futures = {a: ex.submit(_run, a) for a in aliases}
+            for alias, fut in futures.items():
+                limit = _timeout_for(timeout, alias)
+                # prazo absoluto: todos começaram juntos em t_start
+                wait = None if limit is None else max(limit - (time.perf_counter() - t_start), 0)
+                try:
+                    value, secs = fut.result(timeout=wait)
+                    out.results[alias] = AliasResult(alias, value=value, seconds=secs)
+                except FutureTimeout:
+                    out.results[alias] = AliasResult(
+                        alias, error=TimeoutError(f"{alias} excedeu {limit}s"), seconds=limit)
+                except Exception as e:
+                    out.results[alias] = AliasResult(alias, error=e, seconds=time.perf_counter() - t_start)
+        finally:
+            ex.shutdown(wait=False, cancel_futures=True)
+        out.wall_seconds = time.perf_counter() - t_start
+        return out
+
+    def copy(self, source: str, target: str, tables: Iterable[TableRef],
+             target_schema: str | None = None, parallel: int = 4, **copy_kwargs: Any) -> FanOutResult:
+        """
+        Copia tabelas do alias `source` para `target` (Repo.copy_table, em streaming),
+        até `parallel` tabelas ao mesmo tempo. Resultado por "schema.tabela" (CopyResult).
+        """
+        src, dst = self.for_db(source), self.for_db(target)
+        refs = [_split(t) for t in tables]
+        out = FanOutResult()
+        t_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(min(int(parallel), len(refs)), 1),
+                                thread_name_prefix="lcr-copy") as ex:
+            futures = {
+                ex.submit(src.copy_table, schema, table, dst, target_schema=target_schema, **copy_kwargs):
+                    f"{schema}.{table}" if schema else table
+                for schema, table in refs
+            }
+            for fut in as_completed(futures):
+                name = futures[fut]
+                try:
+                    value = fut.result()
+                    out.results[name] = AliasResult(name, value=value, seconds=value.wall_seconds)
+                except Exception as e:
+                    out.results[name] = AliasResult(name, error=e, seconds=time.perf_counter() - t_start)
+        out.wall_seconds = time.perf_counter() - t_start
+        return out
+
+    def sync(self, source: str, target: str, schema: str, table: str, watermark_column: str,
+             **sync_kwargs: Any):
+        """Sync incremental de uma tabela do alias `source` para `target` (Repo.sync_incremental)."""
+        return self.for_db(source).sync_incremental(schema, table, self.for_db(target), watermark_column,
+                                                    **sync_kwargs)
+
+class AsyncRepoRouter:
+    def __init__(self, router: Mapping[str, AsyncDb]):
+        self._router = router
+
+    def for_db(self, alias: str) -> AsyncRepo:
+        try:
+            db = self._router[alias]
+        except KeyError:
+            raise KeyError(f"Alias '{alias}' não registrado no db_router.")
+        return AsyncRepo(db)
+
+    async def fan_out(self, task: AsyncTask, aliases: Iterable[str] | None = None,
+                      params: Mapping[str, Any] | None = None, timeout: Timeout = None) -> FanOutResult:
+        """Versão asyncio do RepoRouter.fan_out; aqui o timeout cancela a consulta de fato."""
+        aliases = list(aliases or self._router.keys())
+
+        async def _run(alias: str) -> AliasResult:
+            repo = self.for_db(alias)
+            limit = _timeout_for(timeout, alias)
+            t0 = time.perf_counter()
+            try:
+                coro = task(repo) if callable(task) else repo.select_raw(task, params, as_frame=True)
+                value = await asyncio.wait_for(coro, timeout=limit)
+                return AliasResult(alias, value=value, seconds=time.perf_counter() - t0)
+            except asyncio.TimeoutError:
+                return AliasResult(alias, error=TimeoutError(f"{alias} excedeu {limit}s"), seconds=limit)
+            except Exception as e:
+                return AliasResult(alias, error=e, seconds=time.perf_counter() - t0)
+
+        t_start = time.perf_counter()
+        results = await asyncio.gather(*(_run(a) for a in aliases))
+        return FanOutResult(results={r.alias: r for r in results}, wall_seconds=time.perf_counter() - t_start)
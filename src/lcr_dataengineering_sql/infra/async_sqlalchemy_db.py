@@ -0,0 +1,195 @@
+# src/lcr_dataengineering_sql/infra/async_sqlalchemy_db.py
+from __future__ import annotations
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Mapping, TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
+from ..core.ports import AsyncDb
+from .bulk_load import _pg_frame, _rows
+from .chunking import plan_for_df
+from .sqlalchemy_db import _TxDb, _fqtn, _quote, _seek_stmt, _select_stmt, _text
+
+class AsyncSqlAlchemyDb(AsyncDb):
+    """
+    Db sobre o AsyncEngine do SQLAlchemy (asyncpg / aiomysql / aiosqlite / aioodbc).
+    Consultas rodam nativamente async; a DDL por dialect reaproveita a lógica do
+    SqlAlchemyDb via run_sync, na mesma conexão, sem bloquear o event loop.
+    """
+    def __init__(self, engine_provider: Callable[[], Any]):
+        self._engine_provider = engine_provider
+
+    @property
+    def engine(self):
+        return self._engine_provider()
+
+    # conexões: o _AsyncTxDb devolve sempre a da transação
+    def _connect(self):
+        return self.engine.connect()
+
+    def _begin(self):
+        return self.engine.begin()
+
+    async def _run_sync(self, fn: Callable[[_TxDb], Any]) -> Any:
+        async with self._begin() as conn:
+            return await conn.run_sync(lambda sync_conn: fn(_TxDb(sync_conn)))
+
+    async def ping(self) -> bool:
+        try:
+            async with self._connect() as conn:
+                await conn.execute(_text("SELECT 1"))
+            return True
+        except Exception:
+            return False
+
+    # -------- básicos --------
+    async def execute(self, sql: str, params: Mapping[str, Any] | None = None) -> int:
+        async with self._begin() as conn:
+            res = await conn.execute(_text(sql), params or {})
+            return res.rowcount or 0
+
+    async def query_all(self, sql: str, params: Mapping[str, Any] | None = None) -> list[dict]:
+        async with self._connect() as conn:
+            res = await conn.execute(_text(sql), params or {})
+            return res.mappings().all()
+
+    async def query_iter(self, sql: str, params: Mapping[str, Any] | None = None,
+                         fetch_size: int = 1000) -> AsyncIterator[dict]:
+        async with self._connect() as conn:
+            res = await conn.stream(_text(sql), params or {}, execution_options={"yield_per": fetch_size})
+            async for row in res.mappings():
+                yield row
+
+    async def query_batches(self, sql: str, params: Mapping[str, Any] | None = None,
+                            fetch_size: int = 10000, as_frame: bool = False) -> AsyncIterator[list[dict] | pd.DataFrame]:
+        async with self._connect() as conn:
+            res = await conn.stream(_text(sql), params or {}, execution_options={"yield_per": fetch_size})
+            cols = list(res.keys())
+            if as_frame:
+                import pandas as pd
+            async for part in res.partitions(fetch_size):
+                if as_frame:
+                    yield pd.DataFrame.from_records(part, columns=cols)
+                else:
+                    yield [dict(zip(cols, row)) for row in part]
+
+    async def query_df(self, sql: str, params: Mapping[str, Any] | None = None,
+                       dtype: Mapping[str, Any] | None = None) -> pd.DataFrame:
+        async with self._connect() as conn:
+            res = await conn.execute(_text(sql), params or {})
+            import pandas as pd
+            df = pd.DataFrame.from_records(res.fetchall(), columns=list(res.keys()))
+        return df.astype(dtype) if dtype else df
+
+    async def _select(self, stmt, params: Mapping[str, Any] | None, as_frame: bool):
+        async with self._connect() as conn:
+            res = await conn.execute(stmt, params or {})
+            if not as_frame:
+                return res.mappings().all()
+            import pandas as pd
+            return pd.DataFrame.from_records(res.fetchall(), columns=list(res.keys()))
+
+    async def select_table(self, schema: str, table: str, columns: list[str] | None = None,
+                           where: str | None = None, order_by: str | None = None, limit: int | None = None,
+                           params: Mapping[str, Any] | None = None,
+                           as_frame: bool = False) -> list[dict] | pd.DataFrame:
+        return await self._select(_select_stmt(schema, table, columns, where, order_by, limit), params, as_frame)
+
+    async def seek_page(self, schema: str, table: str, key_columns: list[str], page_size: int,
+                        after: list | tuple | None = None, columns: list[str] | None = None,
+                        where: str | None = None, params: Mapping[str, Any] | None = None,
+                        as_frame: bool = False) -> list[dict] | pd.DataFrame:
+        return await self._select(_seek_stmt(schema, table, key_columns, page_size, after, columns, where),
+                                  params, as_frame)
+
+    def quote(self, ident: str) -> str:
+        return _quote(self.engine.dialect, ident)
+
+    def fqtn(self, schema: str, table: str) -> str:
+        return _fqtn(self.engine.dialect, schema, table)
+
+    # -------- schema / tabela / view / proc (lógica do SqlAlchemyDb) --------
+    async def create_schema(self, schema: str, if_not_exists: bool = True) -> None:
+        await self._run_sync(lambda db: db.create_schema(schema, if_not_exists=if_not_exists))
+
+    async def truncate_table(self, schema: str, table: str) -> None:
+        await self._run_sync(lambda db: db.truncate_table(schema, table))
+
+    async def drop_table(self, schema: str, table: str, if_exists: bool = True) -> None:
+        await self._run_sync(lambda db: db.drop_table(schema, table, if_exists=if_exists))
+
+    async def table_exists(self, schema: str, table: str) -> bool:
+        return await self._run_sync(lambda db: db.table_exists(schema, table))
+
+    async def create_view(self, schema: str, view: str, select_sql: str, or_replace: bool = True) -> None:
+        await self._run_sync(lambda db: db.create_view(schema, view, select_sql, or_replace=or_replace))
+
+    async def drop_view(self, schema: str, view: str, if_exists: bool = True) -> None:
+        await self._run_sync(lambda db: db.drop_view(schema, view, if_exists=if_exists))
+
+    async def create_procedure(self, schema: str, proc: str, definition_sql: str, or_alter: bool = True) -> None:
+        await self._run_sync(lambda db: db.create_procedure(schema, proc, definition_sql, or_alter=or_alter))
+
+    async def exec_procedure(self, schema: str, proc: str, params: Mapping[str, Any] | None = None,
+                             as_frame: bool = False) -> list[dict] | pd.DataFrame:
+        return await self._run_sync(lambda db: db.exec_procedure(schema, proc, params, as_frame=as_frame))
+
+    # -------- criar/ingestar dados --------
+    async def create_table_from_query(self, create_table_sql: str) -> None:
+        await self._run_sync(lambda db: db.create_table_from_query(create_table_sql))
+
+    async def create_table_from_df(self, df: pd.DataFrame, schema: str, table: str,
+                                   pk: list[str] | None = None, if_not_exists: bool = True) -> bool:
+        return await self._run_sync(
+            lambda db: db.create_table_from_df(df, schema, table, pk=pk, if_not_exists=if_not_exists))
+
+    async def insert_df(self, df: pd.DataFrame, schema: str, table: str, chunksize: int | str = 10000,
+                        strategy: str = "auto") -> int:
+        async with self._begin() as conn:
+            native = (strategy == "auto" and conn.dialect.driver == "asyncpg" and len(df)
+                      and await conn.run_sync(lambda c: _TxDb(c).table_exists(schema, table)))
+            if native:
+                # COPY binário nativo do asyncpg (o COPY do psycopg não existe aqui)
+                raw = await conn.get_raw_connection()
+                df = _pg_frame(df)  # mesma normalização do pg_copy_loader (int com NULL chega como float)
+                cols = [str(c) for c in df.columns]
+                chunker = plan_for_df(df, conn.dialect.name) if chunksize == "auto" else None
+                i = 0
+                while i < len(df):
+                    part = df.iloc[i:i + (chunker.size if chunker else max(int(chunksize), 1))]
+                    t0 = time.perf_counter()
+                    await raw.driver_connection.copy_records_to_table(
+                        table, records=_rows(part), columns=cols, schema_name=schema or None)
+                    if chunker:
+                        chunker.observe(len(part), time.perf_counter() - t0)
+                    i += len(part)
+                return len(df)
+            # demais drivers: caminho síncrono (to_sql) dentro do greenlet do SQLAlchemy;
+            # os loaders nativos usam cursores DBAPI que os adaptadores async não têm
+            return await conn.run_sync(
+                lambda c: _TxDb(c).insert_df(df, schema, table, chunksize=chunksize,
+                                             strategy="to_sql" if strategy == "auto" else strategy))
+
+    async def upsert_df(self, df: pd.DataFrame, schema: str, table: str, key_columns: list[str],
+                        chunksize: int | str = 10000, strategy: str = "auto") -> tuple[int, int]:
+        # staging via INSERT parametrizado: os loaders nativos usam cursores DBAPI que o adaptador async não tem
+        strategy = "executemany" if strategy == "auto" else strategy
+        return await self._run_sync(
+            lambda db: db.upsert_df(df, schema, table, key_columns, chunksize=chunksize, strategy=strategy))
+
+    @asynccontextmanager
+    async def transaction(self):
+        async with self.engine.begin() as conn:
+            yield _AsyncTxDb(conn)
+
+class _AsyncTxDb(AsyncSqlAlchemyDb):
+    def __init__(self, conn):
+        super().__init__(engine_provider=lambda: conn.engine)
+        self._conn = conn
+
+    @asynccontextmanager
+    async def _connect(self):
+        yield self._conn
+
+    def _begin(self):
+        return self._connect()
@@ -0,0 +1,260 @@
+# src/lcr_dataengineering_sql/infra/bulk_load.py
+from __future__ import annotations
+import io
+import logging
+import os
+import tempfile
+import time
+from functools import lru_cache
+from typing import Callable, Dict, TYPE_CHECKING
+if TYPE_CHECKING:
+    import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from .chunking import AdaptiveChunker, max_rows_for_params, plan_for_df
+
+log = logging.getLogger(__name__)
+
+# (conn, df, schema, table, chunksize) -> linhas inseridas
+BulkLoader = Callable[[Connection, "pd.DataFrame", str, str, int], int]
+
+def _q(conn: Connection, ident: str) -> str:
+    return conn.dialect.identifier_preparer.quote(ident)
+
+def _fq(conn: Connection, schema: str, table: str) -> str:
+    return f"{_q(conn, schema)}.{_q(conn, table)}" if schema else _q(conn, table)
+
+def _cols(conn: Connection, df: pd.DataFrame) -> str:
+    return ", ".join(_q(conn, str(c)) for c in df.columns)
+
+def _slices(df: pd.DataFrame, chunksize: int):
+    step = max(int(chunksize or len(df)), 1)
+    for i in range(0, len(df), step):
+        yield df.iloc[i:i + step]
+
+def _values(s: pd.Series) -> list:
+    # coluna inteira de uma vez: tolist() já entrega tipos python; nulos trocados só onde existem
+    if s.dtype.kind == "M":
+        vals = s.dt.to_pydatetime().tolist()
+    elif s.dtype.kind == "m":
+        vals = s.dt.to_pytimedelta().tolist()
+    else:
+        vals = s.tolist()
+    nulls = s.isna().to_numpy().nonzero()[0]
+    for i in nulls.tolist():
+        vals[i] = None
+    return vals
+
+def _rows(df: pd.DataFrame) -> list[tuple]:
+    # NaN/NaT/NA -> None, datetime64 -> datetime, numpy -> python (o que os drivers DBAPI aceitam),
+    # coluna a coluna, sem astype(object) do frame nem dict por linha
+    return list(zip(*(_values(df.iloc[:, i]) for i in range(df.shape[1]))))
+
+# marcador posicional por paramstyle do DBAPI (named fica de fora: pede dict por linha)
+_MARKERS = {"qmark": "?", "format": "%s", "pyformat": "%s", "numeric": ":{}", "numeric_dollar": "${}"}
+
+@lru_cache(maxsize=256)
+def _insert_sql(paramstyle: str, target: str, cols: tuple[str, ...]) -> str | None:
+    """INSERT posicional montado uma vez por (paramstyle, tabela, colunas)."""
+    marker = _MARKERS.get(paramstyle)
+    if marker is None:
+        return None
+    if paramstyle in ("format", "pyformat"):
+        target, cols = target.replace("%", "%%"), tuple(c.replace("%", "%%") for c in cols)
+    marks = ", ".join(marker.format(i + 1) for i in range(len(cols)))
+    return f"INSERT INTO {target} ({', '.join(cols)}) VALUES ({marks})"
+
+# ------------------- fallback -------------------
+
+def to_sql_loader(conn: Connection, df: pd.DataFrame, schema: str, table: str, chunksize: int) -> int:
+    conn = conn.execution_options(fast_executemany=True)
+    # schema "" não é o schema padrão para o pandas (não acha a tabela e tenta criá-la)
+    df.to_sql(name=table, con=conn, schema=schema or None, if_exists="append", index=False, chunksize=chunksize)
+    return len(df)
+
+def executemany_loader(conn: Connection, df: pd.DataFrame, schema: str, table: str, chunksize: int) -> int:
+    """
+    INSERT direto no executemany do driver para tabela existente: statement em cache por
+    tabela/colunas, tuplas posicionais montadas por coluna (sem reflexão do to_sql, sem
+    dict por linha). Não cria tabela; serve a qualquer dialect.
+    """
+    cols = tuple(_q(conn, str(c)) for c in df.columns)
+    sql = _insert_sql(conn.dialect.paramstyle, _fq(conn, schema, table), cols)
+    if sql is None:  # paramstyle "named": cai no text() com dicts
+        names = [f"p{i}" for i in range(len(cols))]
+        stmt = text(f"INSERT INTO {_fq(conn, schema, table)} ({', '.join(cols)}) "
+                    f"VALUES ({', '.join(':' + n for n in names)})")
+        for part in _slices(df, chunksize):
+            conn.execute(stmt, [dict(zip(names, row)) for row in _rows(part)])
+        return len(df)
+    for part in _slices(df, chunksize):
+        conn.exec_driver_sql(sql, _rows(part))
+    return len(df)
+
+def multirow_loader(conn: Connection, df: pd.DataFrame, schema: str, table: str, chunksize: int) -> int:
+    # INSERT ... VALUES (...), (...): um statement por lote, cortado no limite de parâmetros do dialect
+    ncols = len(df.columns)
+    step = max(int(chunksize or len(df)), 1)
+    cap = max_rows_for_params(conn.dialect.name, ncols)
+    if cap is not None:
+        step = min(step, cap)
+    head = f"INSERT INTO {_fq(conn, schema, table)} ({_cols(conn, df)}) VALUES "
+    stmts: Dict[int, object] = {}
+    for part in _slices(df, step):
+        n = len(part)
+        if n not in stmts:  # no máximo dois: lote cheio e a cauda
+            stmts[n] = text(head + ", ".join(
+                "(" + ", ".join(f":p{r}_{c}" for c in range(ncols)) + ")" for r in range(n)))
+        conn.execute(stmts[n], {f"p{r}_{c}": v for r, row in enumerate(_rows(part)) for c, v in enumerate(row)})
+    return len(df)
+
+# ------------------- PostgreSQL: COPY FROM STDIN -------------------
+
+def _pg_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Inteiro com NULL chega do pandas como float64 e o COPY (CSV ou binário do asyncpg)
+    rejeita 3.0 em coluna inteira: float cujos valores não nulos são todos inteiros vira Int64.
+    """
+    out = None
+    for c in df.columns:
+        s = df[c]
+        if s.dtype.kind != "f":
+            continue
+        vals = s.dropna()
+        # inf % 1 é NaN: não passa; acima de 2**53 o float já não é exato
+        if len(vals) and (vals % 1 == 0).all() and vals.abs().max() < 2 ** 53:
+            if out is None:
+                out = df.copy(deep=False)
+            out[c] = s.astype("Int64")
+    return df if out is None else out
+
+def pg_copy_loader(conn: Connection, df: pd.DataFrame, schema: str, table: str, chunksize: int) -> int:
+    sql = (f"COPY {_fq(conn, schema, table)} ({_cols(conn, df)}) "
+           "FROM STDIN WITH (FORMAT csv, NULL '\\N')")
+    df = _pg_frame(df)
+    cur = conn.connection.cursor()
+    try:
+        for part in _slices(df, chunksize):
+            buf = io.StringIO()
+            part.to_csv(buf, index=False, header=False, na_rep="\\N", lineterminator="\n")
+            buf.seek(0)
+            if hasattr(cur, "copy_expert"):      # psycopg2
+                cur.copy_expert(sql, buf)
+            else:                                # psycopg (v3)
+                with cur.copy(sql) as cp:
+                    cp.write(buf.getvalue())
+    finally:
+        cur.close()
+    return len(df)
+
+# ------------------- MySQL: LOAD DATA LOCAL INFILE -------------------
+
+# erros do MySQL quando LOCAL INFILE está desligado no cliente/servidor
+_MYSQL_LOCAL_INFILE_DISABLED = {1148, 2068, 3948}
+
+def _mysql_frame(df: pd.DataFrame) -> pd.DataFrame:
+    from pandas.api.types import is_object_dtype, is_string_dtype
+    out = df.copy(deep=False)
+    for c in out.columns:
+        s = out[c]
+        if s.dtype == bool:
+            out[c] = s.astype("int8")           # BOOL no MySQL é TINYINT; "True" viraria 0
+        elif is_object_dtype(s) or is_string_dtype(s):   # pandas 3: texto vem como dtype str
+            # ESCAPED BY '\\': barras do conteúdo precisam ser duplicadas
+            out[c] = s.map(lambda v: v.replace("\\", "\\\\") if isinstance(v, str) else v)
+    return out
+
+def mysql_load_data_loader(conn: Connection, df: pd.DataFrame, schema: str, table: str, chunksize: int) -> int:
+    cur = conn.connection.cursor()
+    fd, path = tempfile.mkstemp(prefix="lcr_load_", suffix=".csv")
+    os.close(fd)
+    try:
+        sql = (f"LOAD DATA LOCAL INFILE '{path.replace(os.sep, '/')}' "
+               f"INTO TABLE {_fq(conn, schema, table)} CHARACTER SET utf8mb4 "
+               "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '\\\\' "
+               f"LINES TERMINATED BY '\\n' ({_cols(conn, df)})")
+        step = max(int(chunksize or len(df)), 1)
+        for start in range(0, len(df), step):
+            _mysql_frame(df.iloc[start:start + step]).to_csv(
+                path, index=False, header=False, na_rep="\\N", lineterminator="\n", encoding="utf-8")
+            try:
+                cur.execute(sql)
+            except Exception as e:
+                if (e.args[0] if e.args else None) not in _MYSQL_LOCAL_INFILE_DISABLED:
+                    raise
+                # local_infile desligado no cliente/servidor: segue pelo caminho genérico
+                to_sql_loader(conn, df.iloc[start:], schema, table, chunksize)
+                break
+    finally:
+        cur.close()
+        os.remove(path)
+    return len(df)
+
+# ------------------- MSSQL: array binding (pyodbc fast_executemany) -------------------
+
+def mssql_bulk_loader(conn: Connection, df: pd.DataFrame, schema: str, table: str, chunksize: int) -> int:
+    if conn.dialect.driver != "pyodbc":
+        return to_sql_loader(conn, df, schema, table, chunksize)
+    marks = ", ".join("?" for _ in df.columns)
+    sql = f"INSERT INTO {_fq(conn, schema, table)} ({_cols(conn, df)}) VALUES ({marks})"
+    cur = conn.connection.cursor()
+    try:
+        cur.fast_executemany = True  # envia o lote inteiro como array de parâmetros ODBC
+        for part in _slices(df, chunksize):
+            cur.executemany(sql, _rows(part))
+    finally:
+        cur.close()
+    return len(df)
+
+# ------------------- registro de estratégias -------------------
+
+_LOADERS: Dict[str, BulkLoader] = {
+    "to_sql": to_sql_loader,
+    "executemany": executemany_loader,
+    "multirow": multirow_loader,
+    "postgresql": pg_copy_loader,
+    "mysql": mysql_load_data_loader,
+    "mssql": mssql_bulk_loader,
+}
+
+def register_bulk_loader(name: str, loader: BulkLoader) -> None:
+    """Registra/substitui uma estratégia (nome = dialect, ou nome livre para uso explícito)."""
+    _LOADERS[name] = loader
+
+def bulk_insert(conn: Connection, df: pd.DataFrame, schema: str, table: str,
+                chunksize: int | str = 10000, strategy: str = "auto", table_exists: bool | None = None,
+                chunker: AdaptiveChunker | None = None) -> int:
+    """
+    Insere df usando o caminho nativo do dialect (COPY / LOAD DATA / array binding).
+    strategy="auto" escolhe pelo dialect (sem caminho nativo: executemany direto);
+    "to_sql" força o caminho genérico do pandas.
+    table_exists: resposta já conhecida (ex.: cache de metadados); None consulta o catálogo.
+    chunksize="auto" (ou um `chunker`): lote inicial pela largura/memória/limite de
+    parâmetros, ajustado a cada lote pela vazão medida (chunker.report tem os tamanhos).
+    """
+    name = conn.dialect.name if strategy == "auto" else strategy
+    # sem caminho nativo no dialect: executemany direto (to_sql só se a tabela não existir)
+    loader = _LOADERS.get(name, executemany_loader if strategy == "auto" else None)
+    if loader is None:
+        raise ValueError(f"Estratégia de bulk load desconhecida: {strategy}")
+    # caminhos nativos exigem a tabela criada; to_sql cria se faltar (comportamento antigo)
+    if loader is not to_sql_loader:
+        if table_exists is None:
+            table_exists = conn.dialect.has_table(conn, table, schema=schema or None)
+        if not table_exists:
+            loader = to_sql_loader
+    if chunker is None and chunksize != "auto":
+        return loader(conn, df, schema, table, int(chunksize))
+    if chunker is None:
+        chunker = plan_for_df(df, conn.dialect.name, multirow=loader is multirow_loader)
+    start = 0
+    while start < len(df):
+        part = df.iloc[start:start + chunker.size]
+        t0 = time.perf_counter()
+        loader(conn, part, schema, table, len(part))
+        chunker.observe(len(part), time.perf_counter() - t0)
+        start += len(part)
+    r = chunker.report
+    log.debug("chunksize auto %s: inicial=%d final=%d melhor=%d (limite: %s, %d lotes)",
+              table, r.initial, r.final, r.best_size, r.limited_by, len(r.sizes))
+    return len(df)
@@ -0,0 +1,122 @@
+# src/lcr_dataengineering_sql/infra/chunking.py
+from __future__ import annotations
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from ..config import ChunkConfig
+if TYPE_CHECKING:
+    import pandas as pd
+
+# parâmetros por statement (INSERT multi-linha: linhas x colunas precisa caber)
+PARAM_LIMITS = {
+    "mssql": 2100,         # inclui os internos do sp_executesql: sobra margem abaixo
+    "sqlite": 32766,       # SQLITE_MAX_VARIABLE_NUMBER (3.32+); 999 em builds antigas
+    "postgresql": 65535,
+    "mysql": 65535,
+    "oracle": 65535,
+}
+
+def max_rows_for_params(dialect: str, ncols: int, reserve: int = 10) -> int | None:
+    """Maior lote que cabe num único INSERT ... VALUES (...), (...); None = sem limite conhecido."""
+    limit = PARAM_LIMITS.get(dialect)
+    if limit is None or ncols <= 0:
+        return None
+    return max((limit - reserve) // ncols, 1)
+
+def row_bytes(df: pd.DataFrame) -> float:
+    # tamanho em memória por linha (object/str contam o conteúdo)
+    return float(df.memory_usage(index=False, deep=True).sum()) / max(len(df), 1)
+
+@dataclass
+class ChunkReport:
+    """Tamanhos escolhidos pelo chunksize="auto" e a vazão medida em cada lote."""
+    initial: int
+    min_rows: int
+    max_rows: int
+    final: int = 0
+    sizes: list[int] = field(default_factory=list)
+    rows_per_second: list[float] = field(default_factory=list)
+    increases: int = 0
+    decreases: int = 0
+    limited_by: str = ""   # "memória", "parâmetros" ou "config"
+
+    @property
+    def best_size(self) -> int:
+        if not self.rows_per_second:
+            return self.initial
+        return self.sizes[max(range(len(self.sizes)), key=self.rows_per_second.__getitem__)]
+
+class AdaptiveChunker:
+    """
+    AIMD sobre o tamanho do lote: cresce em passos fixos enquanto a latência fica
+    abaixo do alvo e a vazão (linhas/s) não cai; corta pela metade quando passa do
+    alvo ou quando um aumento piorou a vazão. Thread-safe (vários writers).
+    """
+    def __init__(self, initial: int, min_rows: int, max_rows: int, target_seconds: float = 2.0,
+                 step: int | None = None, decrease: float = 0.5, tolerance: float = 0.1,
+                 limited_by: str = ""):
+        self.min_rows, self.max_rows = max(int(min_rows), 1), max(int(max_rows), 1)
+        self.min_rows = min(self.min_rows, self.max_rows)
+        self._size = min(max(int(initial), self.min_rows), self.max_rows)
+        self.target_seconds = target_seconds
+        self.step = max(int(step or self._size // 4), 1)
+        self.decrease, self.tolerance = decrease, tolerance
+        self._rate = 0.0        # média móvel da vazão no tamanho atual
+        self._grew = False      # último ajuste foi aumento
+        self._lock = threading.Lock()
+        self.report = ChunkReport(initial=self._size, min_rows=self.min_rows, max_rows=self.max_rows,
+                                  final=self._size, limited_by=limited_by)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def observe(self, rows: int, seconds: float) -> int:
+        """Registra um lote escrito e devolve o próximo tamanho."""
+        with self._lock:
+            # cauda do arquivo (lote bem menor que o pedido) não diz nada sobre o tamanho
+            if rows <= 0 or rows < self._size // 2:
+                return self._size
+            rate = rows / max(seconds, 1e-9)
+            self.report.sizes.append(rows)
+            self.report.rows_per_second.append(rate)
+            if seconds > self.target_seconds or (self._grew and rate < self._rate * (1 - self.tolerance)):
+                self._size = max(int(self._size * self.decrease), self.min_rows)
+                self.report.decreases += 1
+                self._grew = False
+                self._rate = rate
+            else:
+                self._rate = rate if not self._rate or self._grew else 0.7 * self._rate + 0.3 * rate
+                grown = min(self._size + self.step, self.max_rows)
+                self._grew = grown != self._size
+                self.report.increases += int(self._grew)
+                self._size = grown
+            self.report.final = self._size
+            return self._size
+
+def plan(dialect: str, ncols: int, bytes_per_row: float, multirow: bool = False, in_flight: int = 1,
+         config: ChunkConfig | None = None) -> AdaptiveChunker:
+    """
+    Lote inicial pela largura da tabela (config.cells / colunas), limitado pelo orçamento
+    de memória (dividido pelos lotes em voo) e, em INSERT multi-linha, pelo limite de
+    parâmetros do dialect. 5 colunas -> lotes grandes; 300 colunas -> lotes pequenos.
+    """
+    cfg = config or ChunkConfig()
+    ncols = max(int(ncols), 1)
+    cap, limited_by = cfg.max_rows, "config"
+    by_memory = int(cfg.memory_mb * 1e6 / max(in_flight, 1) / max(bytes_per_row, 1.0))
+    if by_memory < cap:
+        cap, limited_by = max(by_memory, 1), "memória"
+    by_params = max_rows_for_params(dialect, ncols) if multirow else None
+    if by_params is not None and by_params < cap:
+        cap, limited_by = by_params, "parâmetros"
+    initial = min(max(cfg.cells // ncols, cfg.min_rows), cap)
+    return AdaptiveChunker(initial, min(cfg.min_rows, cap), cap, target_seconds=cfg.target_ms / 1000,
+                           limited_by=limited_by)
+
+def plan_for_df(df: pd.DataFrame, dialect: str, multirow: bool = False, in_flight: int = 1,
+                config: ChunkConfig | None = None) -> AdaptiveChunker:
+    # amostra as primeiras linhas: deep=True em milhões de strings custaria caro
+    sample = df.iloc[:1000]
+    return plan(dialect, len(df.columns), row_bytes(sample) if len(sample) else 1.0,
+                multirow=multirow, in_flight=in_flight, config=config)
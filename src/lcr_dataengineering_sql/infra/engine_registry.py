@@ -0,0 +1,133 @@
+# src/lcr_dataengineering_sql/infra/engine_registry.py
+from __future__ import annotations
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from ..config import PoolConfig
+
+@dataclass
+class _Entry:
+    engine: Engine
+    connections_opened: int = 0
+    async_engine: Any = None  # AsyncEngine; `engine` é o seu sync_engine
+
+def _is_sqlite_memory(url: str) -> bool:
+    u = make_url(url)
+    return u.get_backend_name() == "sqlite" and u.database in (None, "", ":memory:")
+
+def _pool_kwargs(url: str, pool: PoolConfig) -> dict:
+    kwargs: Dict[str, Any] = {"pool_pre_ping": pool.pre_ping, "pool_recycle": pool.recycle}
+    # SQLite em memória usa SingletonThreadPool, que não aceita tamanho/overflow
+    if not _is_sqlite_memory(url):
+        kwargs.update(pool_size=pool.size, max_overflow=pool.max_overflow, pool_timeout=pool.timeout)
+    return kwargs
+
+class EngineRegistry:
+    """
+    Cache de Engines por processo, chaveado por URL + opções.
+    Evita criar Engine/pool novo a cada chamada (um login ODBC por statement).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._count_lock = threading.Lock()
+        self._entries: Dict[str, _Entry] = {}
+        self.generation = 0  # sobe a cada dispose_all: quem guarda Engine sabe que precisa pedir de novo
+
+    @staticmethod
+    def _key(url: str, pool: PoolConfig, options: Mapping[str, Any], is_async: bool) -> str:
+        return repr((str(url), pool, sorted(options.items()), is_async))
+
+    def _get(self, url: str, pool: PoolConfig | None, options: Mapping[str, Any], is_async: bool) -> _Entry:
+        pool = pool or PoolConfig()
+        key = self._key(url, pool, options, is_async)
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        with self._lock:
+            entry = self._entries.get(key)
+            created = entry is None
+            if created:
+                if is_async:
+                    from sqlalchemy.ext.asyncio import create_async_engine
+                    aeng = create_async_engine(url, **_pool_kwargs(url, pool), **options)
+                    entry = _Entry(engine=aeng.sync_engine, async_engine=aeng)
+                else:
+                    entry = _Entry(engine=create_engine(url, future=True, **_pool_kwargs(url, pool), **options))
+
+                # conta conexões físicas abertas (não checkouts do pool)
+                def _on_connect(dbapi_conn, conn_record, _entry=entry):
+                    with self._count_lock:
+                        _entry.connections_opened += 1
+
+                event.listen(entry.engine, "connect", _on_connect)
+                self._entries[key] = entry
+        # aquece fora do lock: os eventos "connect" não podem esperar o registro
+        # (engines async só conectam dentro de um event loop; não aquecem aqui)
+        if created and pool.warm_up and not is_async:
+            self.warm_up(entry.engine, min(pool.warm_up, pool.size))
+        return entry
+
+    def get_engine(self, url: str, pool: PoolConfig | None = None, **options: Any) -> Engine:
+        return self._get(url, pool, options, is_async=False).engine
+
+    def get_async_engine(self, url: str, pool: PoolConfig | None = None, **options: Any):
+        """AsyncEngine (asyncpg/aiomysql/aiosqlite/aioodbc) com o mesmo cache e contador."""
+        return self._get(url, pool, options, is_async=True).async_engine
+
+    @staticmethod
+    def warm_up(engine: Engine, n: int) -> None:
+        """Abre n conexões em paralelo e devolve ao pool já autenticadas."""
+        if n <= 0:
+            return
+        with ThreadPoolExecutor(max_workers=n) as ex:
+            conns = list(ex.map(lambda _: engine.connect(), range(n)))
+        for c in conns:
+            c.close()
+
+    def connections_opened(self, engine: Engine | None = None) -> int:
+        """Total de conexões físicas abertas (de um engine ou de todos)."""
+        entries = list(self._entries.values())
+        with self._count_lock:
+            return sum(e.connections_opened for e in entries if engine is None or e.engine is engine)
+
+    def stats(self) -> list[dict]:
+        entries = list(self._entries.values())
+        with self._count_lock:
+            return [
+                {
+                    "url": e.engine.url.render_as_string(hide_password=True),
+                    "connections_opened": e.connections_opened,
+                    "pool": e.engine.pool.status(),
+                }
+                for e in entries
+            ]
+
+    def dispose_all(self, close: bool = True) -> None:
+        """
+        Descarta todos os pools e limpa o registro.
+        Em workers após fork use close=False: não fecha os sockets herdados do pai,
+        apenas abandona o pool para o filho abrir conexões próprias.
+        Engines async sempre são abandonados (close=False): fechar exige o event loop;
+        para fechá-los de fato use `await engine.dispose()`.
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self.generation += 1
+        for e in entries:
+            e.engine.dispose(close=close and e.async_engine is None)
+
+# registro padrão do processo (compartilhado por container e container_multi)
+registry = EngineRegistry()
+
+def get_engine(url: str, pool: PoolConfig | None = None, **options: Any) -> Engine:
+    return registry.get_engine(url, pool=pool, **options)
+
+def get_async_engine(url: str, pool: PoolConfig | None = None, **options: Any):
+    return registry.get_async_engine(url, pool=pool, **options)
+
+def dispose_all(close: bool = True) -> None:
+    registry.dispose_all(close=close)
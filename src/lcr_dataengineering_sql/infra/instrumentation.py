@@ -0,0 +1,371 @@
+# src/lcr_dataengineering_sql/infra/instrumentation.py
+from __future__ import annotations
+import bisect
+import contextvars
+import functools
+import hashlib
+import inspect
+import logging
+import re
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, Tuple
+from sqlalchemy import event
+
+log = logging.getLogger("lcr_dataengineering_sql.slow_query")
+
+SECONDS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+ROWS = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+BYTES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+
+# (nome, atributos) -> context manager; ex.: otel_span_hook(tracer)
+SpanHook = Callable[[str, Dict[str, Any]], ContextManager]
+
+# operação do Repo em andamento (rótulo dos statements disparados por ela)
+_operation: contextvars.ContextVar[str] = contextvars.ContextVar("lcr_operation", default="")
+
+# ------------------- fingerprint -------------------
+
+_STR = re.compile(r"'(?:[^']|'')*'")
+_NUM = re.compile(r"\b\d+(?:\.\d+)?\b")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_PARAM = re.compile(r"%\(\w+\)s|%s|:\w+|\$\d+|@\w+")
+_WS = re.compile(r"\s+")
+
+def fingerprint(sql: str) -> tuple[str, str]:
+    """SQL com literais/parâmetros trocados por ? -> (texto normalizado, id curto)."""
+    s = _STR.sub("?", sql)
+    s = _PARAM.sub("?", s)
+    s = _NUM.sub("?", s)
+    s = _LIST.sub("(?+)", s)
+    s = _WS.sub(" ", s).strip().lower()
+    return s, hashlib.md5(s.encode()).hexdigest()[:12]
+
+def _kind(sql: str) -> str:
+    head = sql.lstrip().split(None, 1)
+    return head[0].upper() if head else ""
+
+# ------------------- métricas -------------------
+
+class Histogram:
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+class MetricsRegistry:
+    """
+    Registro em processo: histogramas e contadores com rótulos, agregados por
+    fingerprint de SQL (estilo pg_stat_statements) e log de consultas lentas.
+    """
+    def __init__(self, slow_query_ms: float = 1000.0, max_fingerprints: int = 500, slow_log_size: int = 200):
+        self.slow_query_ms = slow_query_ms
+        self.max_fingerprints = max_fingerprints
+        self._lock = threading.Lock()
+        self._hist: Dict[Tuple[str, Tuple], Histogram] = {}
+        self._counters: Dict[Tuple[str, Tuple], float] = {}
+        self._help: Dict[str, str] = {}
+        self._statements: Dict[str, dict] = {}
+        self.slow_queries: deque = deque(maxlen=slow_log_size)
+
+    def observe(self, name: str, value: float, buckets: tuple = SECONDS, help: str = "", **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            h = self._hist.get(key)
+            if h is None:
+                h = self._hist[key] = Histogram(buckets)
+                self._help.setdefault(name, help)
+            h.observe(value)
+
+    def inc(self, name: str, value: float = 1, help: str = "", **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+            self._help.setdefault(name, help)
+
+    def statement(self, alias: str, sql: str, seconds: float, rows: int, bytes_sent: int) -> None:
+        text, fp = fingerprint(sql)
+        with self._lock:
+            st = self._statements.get(fp)
+            if st is None:
+                if len(self._statements) >= self.max_fingerprints:
+                    return
+                st = self._statements[fp] = {"fingerprint": fp, "sql": text, "alias": alias, "calls": 0,
+                                             "total_seconds": 0.0, "max_seconds": 0.0, "rows": 0, "bytes_sent": 0}
+            st["calls"] += 1
+            st["total_seconds"] += seconds
+            st["max_seconds"] = max(st["max_seconds"], seconds)
+            st["rows"] += max(rows, 0)
+            st["bytes_sent"] += bytes_sent
+        if seconds * 1000 >= self.slow_query_ms:
+            entry = {"alias": alias, "fingerprint": fp, "sql": text, "ms": round(seconds * 1000, 1),
+                     "rows": rows, "operation": _operation.get(), "at": time.time()}
+            self.slow_queries.append(entry)
+            self.inc("lcr_db_slow_queries_total", help="Statements acima do limiar de lentidão", alias=alias)
+            log.warning("consulta lenta (%.1f ms, alias=%s, fp=%s): %s", entry["ms"], alias, fp, text[:500])
+
+    def top_statements(self, n: int = 20, by: str = "total_seconds") -> list[dict]:
+        with self._lock:
+            rows = [dict(s, mean_seconds=s["total_seconds"] / s["calls"]) for s in self._statements.values()]
+        return sorted(rows, key=lambda s: s[by], reverse=True)[:n]
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "histograms": {f"{n}{dict(l)}": {"count": h.count, "sum": h.sum} for (n, l), h in self._hist.items()},
+                "counters": {f"{n}{dict(l)}": v for (n, l), v in self._counters.items()},
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hist.clear()
+            self._counters.clear()
+            self._statements.clear()
+            self.slow_queries.clear()
+
+    @staticmethod
+    def _labels(labels: Tuple, le: str = "") -> str:
+        esc = lambda v: str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts = [f'{k}="{esc(v)}"' for k, v in labels]
+        if le:
+            parts.append(f'le="{le}"')
+        return "{" + ",".join(parts) + "}" if parts else ""
+
+    def to_prometheus(self) -> str:
+        """Exposição em texto do Prometheus (text/plain; version=0.0.4)."""
+        out: list[str] = []
+        with self._lock:
+            by_name: Dict[str, list] = {}
+            for (name, labels), h in sorted(self._hist.items()):
+                by_name.setdefault(name, []).append((labels, h))
+            for name, series in by_name.items():
+                out += [f"# HELP {name} {self._help.get(name) or name}", f"# TYPE {name} histogram"]
+                for labels, h in series:
+                    acc = 0
+                    for le, c in zip([*h.buckets, "+Inf"], h.counts):
+                        acc += c
+                        out.append(f"{name}_bucket{self._labels(labels, str(le))} {acc}")
+                    out.append(f"{name}_sum{self._labels(labels)} {h.sum}")
+                    out.append(f"{name}_count{self._labels(labels)} {h.count}")
+            seen = set()
+            for (name, labels), v in sorted(self._counters.items()):
+                if name not in seen:
+                    seen.add(name)
+                    out += [f"# HELP {name} {self._help.get(name) or name}", f"# TYPE {name} counter"]
+                out.append(f"{name}{self._labels(labels)} {v}")
+        return "\n".join(out) + "\n"
+
+registry = MetricsRegistry()
+_enabled = False
+_span_hook: SpanHook | None = None
+_instrumented: "weakref.WeakSet" = weakref.WeakSet()
+_lock = threading.Lock()
+
+def enable(slow_query_ms: float | None = None, span_hook: SpanHook | None = None) -> MetricsRegistry:
+    """Liga a instrumentação (engines passam a ser instrumentados ao serem usados pelos containers)."""
+    global _enabled, _span_hook
+    _enabled = True
+    if slow_query_ms is not None:
+        registry.slow_query_ms = slow_query_ms
+    if span_hook is not None:
+        _span_hook = span_hook
+    return registry
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+def enabled() -> bool:
+    return _enabled
+
+def set_span_hook(hook: SpanHook | None) -> None:
+    global _span_hook
+    _span_hook = hook
+
+def otel_span_hook(tracer: Any) -> SpanHook:
+    """Adaptador para OpenTelemetry: otel_span_hook(trace.get_tracer("lcr"))."""
+    return lambda name, attrs: tracer.start_as_current_span(name, attributes=attrs)
+
+def _span(name: str, attrs: Dict[str, Any]) -> ContextManager:
+    return _span_hook(name, attrs) if _span_hook is not None else nullcontext()
+
+# ------------------- engine / pool -------------------
+
+def _approx_bytes(statement: str, parameters: Any, executemany: bool) -> int:
+    # estimativa barata: o 1o conjunto de parâmetros vezes a quantidade
+    n = len(statement)
+    if not parameters:
+        return n
+    sample = parameters[0] if executemany and isinstance(parameters, (list, tuple)) else parameters
+    values = sample.values() if isinstance(sample, dict) else (sample if isinstance(sample, (list, tuple)) else ())
+    one = sum(len(v) if isinstance(v, (str, bytes)) else 8 for v in values)
+    return n + one * (len(parameters) if executemany else 1)
+
+def _wrap_pool(pool: Any, alias: str) -> None:
+    # não há evento "antes do checkout": mede o Pool.connect() (espera + eventual conexão nova)
+    if getattr(pool, "_lcr_wrapped", False):
+        return
+    original = pool.connect
+
+    @functools.wraps(original)
+    def connect(*args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            if _enabled:
+                registry.observe("lcr_db_pool_checkout_seconds", time.perf_counter() - t0,
+                                 help="Espera por uma conexão do pool (inclui abrir uma nova)", alias=alias)
+                registry.inc("lcr_db_pool_checkouts_total", help="Checkouts do pool", alias=alias)
+    pool.connect = connect
+    pool._lcr_wrapped = True
+
+def instrument_engine(engine: Any, alias: str = "default") -> None:
+    """Pendura os listeners no engine (idempotente; AsyncEngine usa o sync_engine)."""
+    engine = getattr(engine, "sync_engine", engine)
+    with _lock:
+        if engine in _instrumented:
+            return
+        _instrumented.add(engine)
+    local = threading.local()
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        if not _enabled or context is None:
+            return
+        context._lcr = (time.perf_counter(), _approx_bytes(statement, parameters, executemany))
+        kind = _kind(statement)
+        span = _span(f"db.{kind.lower() or 'statement'}",
+                     {"db.system": conn.dialect.name, "db.statement": statement[:1000], "lcr.alias": alias})
+        span.__enter__()
+        context._lcr_span = span
+
+    def after(conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_lcr", None)
+        if start is None:
+            return
+        seconds = time.perf_counter() - start[0]
+        kind = _kind(statement)
+        rows = cursor.rowcount if cursor is not None and cursor.rowcount is not None else -1
+        registry.observe("lcr_db_statement_seconds", seconds, help="Duração por statement", alias=alias, kind=kind)
+        if rows >= 0:
+            registry.observe("lcr_db_statement_rows", rows, ROWS, help="Linhas afetadas por statement",
+                             alias=alias, kind=kind)
+        registry.observe("lcr_db_statement_bytes_sent", start[1], BYTES,
+                         help="Bytes enviados por statement (SQL + parâmetros, estimado)", alias=alias, kind=kind)
+        registry.statement(alias, statement, seconds, rows, start[1])
+        context._lcr_span.__exit__(None, None, None)
+        context._lcr = None
+
+    def on_error(ctx):
+        registry.inc("lcr_db_statement_errors_total", help="Statements com erro", alias=alias,
+                     kind=_kind(ctx.statement or ""))
+        ec = ctx.execution_context
+        if ec is not None and getattr(ec, "_lcr", None) is not None:
+            e = ctx.original_exception
+            ec._lcr_span.__exit__(type(e), e, e.__traceback__)
+            ec._lcr = None
+
+    def do_connect(dialect, conn_rec, cargs, cparams):
+        local.t0 = time.perf_counter()
+
+    def on_connect(dbapi_conn, conn_rec):
+        t0 = getattr(local, "t0", None)
+        if _enabled and t0 is not None:
+            registry.observe("lcr_db_pool_connect_seconds", time.perf_counter() - t0,
+                             help="Tempo para abrir uma conexão DBAPI", alias=alias)
+        local.t0 = None
+
+    event.listen(engine, "before_cursor_execute", before)
+    event.listen(engine, "after_cursor_execute", after)
+    event.listen(engine, "handle_error", on_error)
+    event.listen(engine, "do_connect", do_connect)
+    event.listen(engine, "connect", on_connect)
+    # dispose() troca o pool: embrulha o novo também
+    event.listen(engine, "engine_disposed", lambda e: _wrap_pool(e.pool, alias))
+    _wrap_pool(engine.pool, alias)
+
+def maybe_instrument(engine: Any, alias: str = "default") -> Any:
+    """Chamado pelos providers: instrumenta só se enable() foi chamado. Devolve o engine."""
+    if _enabled:
+        instrument_engine(engine, alias)
+    return engine
+
+# ------------------- operações do Repo -------------------
+
+def _rows_of(result: Any) -> int | None:
+    if isinstance(result, bool):
+        return None
+    if isinstance(result, int):
+        return result
+    rows = getattr(result, "rows", None)
+    if isinstance(rows, int):
+        return rows
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+def instrument_methods(cls: type) -> type:
+    """Decorador de classe: cada método público vira uma operação medida (latência e linhas)."""
+    for name, fn in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(fn) or inspect.isgeneratorfunction(fn) \
+                or inspect.isasyncgenfunction(fn):
+            continue
+        setattr(cls, name, _async_op(fn, name) if inspect.iscoroutinefunction(fn) else _op(fn, name))
+    return cls
+
+def _record(op: str, seconds: float, result: Any, error: bool) -> None:
+    registry.observe("lcr_repo_operation_seconds", seconds, help="Duração por operação do Repo",
+                     operation=op, status="error" if error else "ok")
+    rows = None if error else _rows_of(result)
+    if rows is not None:
+        registry.observe("lcr_repo_operation_rows", rows, ROWS, help="Linhas por operação do Repo", operation=op)
+
+def _op(fn: Callable, op: str) -> Callable:
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return fn(*args, **kwargs)
+        token = _operation.set(op)
+        t0 = time.perf_counter()
+        result, error = None, False
+        try:
+            with _span(f"repo.{op}", {"lcr.operation": op}):
+                result = fn(*args, **kwargs)
+            return result
+        except BaseException:
+            error = True
+            raise
+        finally:
+            _record(op, time.perf_counter() - t0, result, error)
+            _operation.reset(token)
+    return wrapper
+
+def _async_op(fn: Callable, op: str) -> Callable:
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        if not _enabled:
+            return await fn(*args, **kwargs)
+        token = _operation.set(op)
+        t0 = time.perf_counter()
+        result, error = None, False
+        try:
+            with _span(f"repo.{op}", {"lcr.operation": op}):
+                result = await fn(*args, **kwargs)
+            return result
+        except BaseException:
+            error = True
+            raise
+        finally:
+            _record(op, time.perf_counter() - t0, result, error)
+            _operation.reset(token)
+    return wrapper
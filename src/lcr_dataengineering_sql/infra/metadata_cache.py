@@ -0,0 +1,103 @@
+# src/lcr_dataengineering_sql/infra/metadata_cache.py
+from __future__ import annotations
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Tuple
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine, Connection
+
+Bind = Engine | Connection
+
+class MetadataCache:
+    """
+    Cache de reflexão por engine (tabelas/views por schema, colunas e PK por tabela).
+    Uma listagem de schema responde a existência de todas as suas tabelas, então
+    carregar 500 tabelas não dispara milhares de consultas ao catálogo.
+    Entradas expiram após `ttl` segundos; DDL feita pela lib invalida na hora.
+    """
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: Dict[Tuple, Tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _get(self, key: Tuple, load: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and now - item[0] < self.ttl:
+                self.hits += 1
+                return item[1]
+            self.misses += 1
+        value = load()
+        with self._lock:
+            self._data[key] = (now, value)
+        return value
+
+    @staticmethod
+    def _contains(names: frozenset, name: str, dialect: str) -> bool:
+        if name in names:
+            return True
+        # só o PostgreSQL diferencia maiúsculas em nomes quotados
+        return dialect != "postgresql" and name.lower() in {n.lower() for n in names}
+
+    # ------------------- consultas -------------------
+
+    def table_names(self, bind: Bind, schema: str | None) -> frozenset:
+        return self._get(("tables", schema or None),
+                         lambda: frozenset(inspect(bind).get_table_names(schema=schema or None)))
+
+    def view_names(self, bind: Bind, schema: str | None) -> frozenset:
+        return self._get(("views", schema or None),
+                         lambda: frozenset(inspect(bind).get_view_names(schema=schema or None)))
+
+    def table_exists(self, bind: Bind, schema: str | None, table: str) -> bool:
+        return self._contains(self.table_names(bind, schema), table, bind.dialect.name)
+
+    def view_exists(self, bind: Bind, schema: str | None, view: str) -> bool:
+        return self._contains(self.view_names(bind, schema), view, bind.dialect.name)
+
+    def columns(self, bind: Bind, schema: str | None, table: str) -> list[dict]:
+        """[{name, type, nullable, ...}] como em Inspector.get_columns."""
+        return self._get(("columns", schema or None, table),
+                         lambda: inspect(bind).get_columns(table, schema=schema or None))
+
+    def pk(self, bind: Bind, schema: str | None, table: str) -> list[str]:
+        return self._get(("pk", schema or None, table),
+                         lambda: list(inspect(bind).get_pk_constraint(table, schema=schema or None)
+                                      .get("constrained_columns") or []))
+
+    # ------------------- invalidação / métricas -------------------
+
+    def invalidate(self, schema: str | None = None, name: str | None = None) -> None:
+        """Sem argumentos limpa tudo; com schema limpa o schema; com nome, só aquele objeto."""
+        with self._lock:
+            self.invalidations += 1
+            if schema is None and name is None:
+                self._data.clear()
+                return
+            for key in list(self._data):
+                if key[1] != (schema or None):
+                    continue
+                # listagens do schema sempre caem; colunas/PK só do objeto afetado
+                if name is None or len(key) == 2 or key[2] == name:
+                    del self._data[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "invalidations": self.invalidations, "entries": len(self._data)}
+
+_caches: "weakref.WeakKeyDictionary[Engine, MetadataCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+def metadata_cache_for(engine: Engine, ttl: float = 300.0) -> MetadataCache:
+    """Um cache por Engine (o engine vem do registry, então é um por URL)."""
+    with _caches_lock:
+        cache = _caches.get(engine)
+        if cache is None:
+            cache = _caches[engine] = MetadataCache(ttl=ttl)
+        return cache
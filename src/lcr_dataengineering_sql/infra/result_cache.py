@@ -0,0 +1,386 @@
+# src/lcr_dataengineering_sql/infra/result_cache.py
+from __future__ import annotations
+import hashlib
+import os
+import pickle
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Tuple
+
+# TTL fixo (segundos) ou função (sql, tabelas) -> segundos; None/0 = não cachear essa consulta
+Ttl = float | Callable[[str, frozenset], float | None]
+
+_WS = re.compile(r"\s+")
+# tabelas citadas num SQL: FROM/JOIN (leitura) e alvos de escrita/DDL
+_TABLE_REF = re.compile(
+    r"\b(?:FROM|JOIN|INTO|UPDATE|TABLE|VIEW|MERGE)\s+((?:[\[\]\"`\w]+\s*\.\s*)*[\[\]\"`\w]+)", re.IGNORECASE)
+
+def _normalize(sql: str) -> str:
+    return _WS.sub(" ", sql).strip().rstrip(";")
+
+def _name(ident: str) -> str:
+    # "[dbo].[T]" / "public"."t" / t -> "t": compara só o nome do objeto (invalida a mais, nunca a menos)
+    return ident.split(".")[-1].strip().strip('[]"`').lower()
+
+def tables_in(sql: str) -> frozenset:
+    return frozenset(_name(m) for m in _TABLE_REF.findall(sql))
+
+@dataclass
+class _Entry:
+    blob: bytes | None          # None = está no disco
+    size: int
+    expires: float
+    alias: str
+    tables: frozenset
+    path: str | None = None
+
+class ResultCache:
+    """
+    Cache de resultados de leitura, compartilhável entre aliases.
+    - chave: alias + SQL normalizado + parâmetros
+    - memória: LRU limitado em bytes (resultados guardados em pickle: tamanho exato e
+      cada hit devolve uma cópia, então quem chamou pode alterar o DataFrame à vontade)
+    - disco (opcional): o que sai da memória vai para `disk_dir`, até `max_disk_bytes`;
+      o índice fica em memória, então nada do disco sobrevive a um restart (nem fica velho)
+    - invalidação por tabela: escrita em T derruba toda consulta do mesmo alias que lê T
+    """
+    def __init__(self, max_bytes: int = 256 * 2**20, ttl: Ttl = 300.0,
+                 disk_dir: str | None = None, max_disk_bytes: int = 2 * 2**30,
+                 max_entry_bytes: int | None = None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.max_entry_bytes = max_entry_bytes or max_bytes // 4
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._mem: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._disk: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._by_table: Dict[Tuple[str, str], set] = {}
+        self._epoch: Dict[str, int] = {}
+        # dependências de views criadas pela lib: view -> tabelas do SELECT
+        self._view_deps: Dict[Tuple[str, str], frozenset] = {}
+        self.mem_bytes = self.disk_bytes = 0
+        self.hits = self.disk_hits = self.misses = 0
+        self.evictions = self.spills = self.expirations = self.invalidations = 0
+
+    # ------------------- chave / dependências -------------------
+
+    @staticmethod
+    def key(alias: str, kind: str, sql: str, params: Mapping[str, Any] | None, extra: Any = None) -> str:
+        raw = repr((alias, kind, _normalize(sql), sorted((params or {}).items()), extra))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def register_view(self, alias: str, view: str, select_sql: str) -> None:
+        with self._lock:
+            self._view_deps[(alias, _name(view))] = tables_in(select_sql)
+
+    def _expand(self, alias: str, tables: frozenset) -> frozenset:
+        # consulta numa view também depende das tabelas da view
+        out, todo = set(tables), list(tables)
+        while todo:
+            for t in self._view_deps.get((alias, todo.pop()), ()):
+                if t not in out:
+                    out.add(t)
+                    todo.append(t)
+        return frozenset(out)
+
+    def _ttl_for(self, sql: str, tables: frozenset, ttl: Ttl | None) -> float | None:
+        ttl = self.ttl if ttl is None else ttl
+        return ttl(sql, tables) if callable(ttl) else ttl
+
+    # ------------------- get / put -------------------
+
+    def get_or_load(self, alias: str, key: str, sql: str, tables: frozenset, load: Callable[[], Any],
+                    ttl: Ttl | None = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._mem.get(key)
+            if entry is not None and entry.expires > now:
+                self._mem.move_to_end(key)
+                self.hits += 1
+                return pickle.loads(entry.blob)
+            blob = None
+            if entry is None:
+                entry = self._disk.get(key)
+                if entry is not None and entry.expires > now:
+                    blob = self._read(entry)
+            if blob is not None:
+                self.disk_hits += 1
+                self._drop_disk(key)
+                self._store(key, _Entry(blob, len(blob), entry.expires, alias, entry.tables))
+                return pickle.loads(blob)
+            if entry is not None:
+                self.expirations += 1
+                self._remove(key)
+            self.misses += 1
+            epoch = self._epoch.get(alias, 0)
+            tables = self._expand(alias, tables)
+        value = load()
+        seconds = self._ttl_for(sql, tables, ttl)
+        if not seconds:
+            return value
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_entry_bytes:
+            return value
+        with self._lock:
+            # escrita no meio da leitura: o resultado pode já estar velho, não guarda
+            if self._epoch.get(alias, 0) == epoch:
+                self._store(key, _Entry(blob, len(blob), time.monotonic() + seconds, alias, tables))
+        return value
+
+    def _store(self, key: str, entry: _Entry) -> None:
+        self._remove(key)
+        self._mem[key] = entry
+        self.mem_bytes += entry.size
+        for t in entry.tables:
+            self._by_table.setdefault((entry.alias, t), set()).add(key)
+        while self.mem_bytes > self.max_bytes and self._mem:
+            old_key, old = self._mem.popitem(last=False)
+            self.mem_bytes -= old.size
+            self.evictions += 1
+            if self.disk_dir and old.expires > time.monotonic():
+                self._spill(old_key, old)
+            else:
+                self._unindex(old_key, old)
+
+    # ------------------- disco -------------------
+
+    def _spill(self, key: str, entry: _Entry) -> None:
+        path = os.path.join(self.disk_dir, key + ".pkl")
+        try:
+            with open(path, "wb") as f:
+                f.write(entry.blob)
+        except OSError:
+            self._unindex(key, entry)
+            return
+        entry.blob, entry.path = None, path
+        self._disk[key] = entry
+        self.disk_bytes += entry.size
+        self.spills += 1
+        while self.disk_bytes > self.max_disk_bytes and self._disk:
+            old_key = next(iter(self._disk))
+            self._unindex(old_key, self._disk[old_key])
+            self._drop_disk(old_key)
+
+    @staticmethod
+    def _read(entry: _Entry) -> bytes | None:
+        try:
+            with open(entry.path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _drop_disk(self, key: str) -> None:
+        entry = self._disk.pop(key, None)
+        if entry is not None:
+            self.disk_bytes -= entry.size
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    # ------------------- invalidação / métricas -------------------
+
+    def _unindex(self, key: str, entry: _Entry) -> None:
+        for t in entry.tables:
+            keys = self._by_table.get((entry.alias, t))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_table[(entry.alias, t)]
+
+    def _remove(self, key: str) -> None:
+        entry = self._mem.pop(key, None)
+        if entry is not None:
+            self.mem_bytes -= entry.size
+            self._unindex(key, entry)
+        entry = self._disk.get(key)
+        if entry is not None:
+            self._unindex(key, entry)
+            self._drop_disk(key)
+
+    def invalidate(self, alias: str, tables: frozenset | None = None) -> None:
+        """Derruba as consultas do alias que dependem de `tables` (None = todas do alias)."""
+        with self._lock:
+            self.invalidations += 1
+            self._epoch[alias] = self._epoch.get(alias, 0) + 1
+            if tables is None:
+                keys = {k for k, e in [*self._mem.items(), *self._disk.items()] if e.alias == alias}
+            else:
+                keys = set()
+                for t in tables:
+                    keys |= self._by_table.get((alias, _name(t)), set())
+            for k in keys:
+                self._remove(k)
+
+    def clear(self) -> None:
+        with self._lock:
+            for k in list(self._disk):
+                self._drop_disk(k)
+            self._mem.clear()
+            self._by_table.clear()
+            self.mem_bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                    "hit_ratio": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                    "evictions": self.evictions, "spills": self.spills,
+                    "expirations": self.expirations, "invalidations": self.invalidations,
+                    "entries": len(self._mem), "disk_entries": len(self._disk),
+                    "bytes": self.mem_bytes, "disk_bytes": self.disk_bytes}
+
+# ------------------- Db com cache -------------------
+
+class CachedDb:
+    """
+    Envolve um Db: leituras (query_all, query_df, query_arrow, select_table) passam pelo
+    ResultCache; escritas feitas por aqui invalidam as tabelas tocadas. Escritas por fora
+    (outro processo, SQL direto no banco) só caem pelo TTL.
+    Todo o resto do Db é repassado como está.
+    """
+    def __init__(self, db: Any, cache: ResultCache, alias: str = "default", ttl: Ttl | None = None):
+        self.db = db
+        self.cache = cache
+        self.alias = alias
+        self.ttl = ttl  # None = TTL do cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.db, name)
+
+    def _cached(self, kind: str, sql: str, params, tables: frozenset, load: Callable[[], Any],
+                extra: Any = None, ttl: Ttl | None = None) -> Any:
+        key = ResultCache.key(self.alias, kind, sql, params, extra)
+        return self.cache.get_or_load(self.alias, key, sql, tables, load, ttl=self.ttl if ttl is None else ttl)
+
+    def _touch(self, *tables: str) -> None:
+        self.cache.invalidate(self.alias, frozenset(tables) if tables else None)
+
+    # -------- leituras --------
+    def query_all(self, sql: str, params: Mapping[str, Any] | None = None, ttl: Ttl | None = None) -> list[dict]:
+        return self._cached("all", sql, params, tables_in(sql),
+                            lambda: [dict(r) for r in self.db.query_all(sql, params)], ttl=ttl)
+
+    def query_df(self, sql: str, params: Mapping[str, Any] | None = None,
+                 dtype: Mapping[str, Any] | None = None, chunksize: int | None = None, ttl: Ttl | None = None):
+        if chunksize:  # streaming não entra no cache
+            return self.db.query_df(sql, params, dtype=dtype, chunksize=chunksize)
+        return self._cached("df", sql, params, tables_in(sql),
+                            lambda: self.db.query_df(sql, params, dtype=dtype), extra=dtype, ttl=ttl)
+
+    def query_arrow(self, sql: str, params: Mapping[str, Any] | None = None, schema=None,
+                    fetch_size: int = 100_000, ttl: Ttl | None = None):
+        return self._cached("arrow", sql, params, tables_in(sql),
+                            lambda: self.db.query_arrow(sql, params, schema=schema, fetch_size=fetch_size),
+                            extra=str(schema), ttl=ttl)
+
+    def select_table(self, schema: str, table: str, columns: list[str] | None = None,
+                     where: str | None = None, order_by: str | None = None, limit: int | None = None,
+                     params: Mapping[str, Any] | None = None, as_frame: bool = False, ttl: Ttl | None = None):
+        sql = f"SELECT {columns or '*'} FROM {schema}.{table} WHERE {where} ORDER BY {order_by} LIMIT {limit}"
+        load = lambda: self.db.select_table(schema, table, columns=columns, where=where, order_by=order_by,
+                                            limit=limit, params=params, as_frame=as_frame)
+        return self._cached("table", sql, params, frozenset({_name(table)}) | tables_in(where or ""),
+                            (lambda: [dict(r) for r in load()]) if not as_frame else load,
+                            extra=as_frame, ttl=ttl)
+
+    # -------- escritas: repassa e invalida --------
+    def execute(self, sql: str, params: Mapping[str, Any] | None = None) -> int:
+        n = self.db.execute(sql, params)
+        tables = tables_in(sql)
+        self._touch(*tables)  # SQL sem tabela reconhecível (ex.: EXEC): invalida o alias inteiro
+        return n
+
+    def insert_df(self, df, schema: str, table: str, chunksize: int | str = 10000, strategy: str = "auto") -> int:
+        n = self.db.insert_df(df, schema, table, chunksize=chunksize, strategy=strategy)
+        self._touch(table)
+        return n
+
+    def upsert_df(self, df, schema: str, table: str, key_columns: list[str], chunksize: int | str = 10000,
+                  strategy: str = "auto") -> tuple[int, int]:
+        res = self.db.upsert_df(df, schema, table, key_columns, chunksize=chunksize, strategy=strategy)
+        self._touch(table)
+        return res
+
+    def truncate_table(self, schema: str, table: str) -> None:
+        self.db.truncate_table(schema, table)
+        self._touch(table)
+
+    def drop_table(self, schema: str, table: str, if_exists: bool = True) -> None:
+        self.db.drop_table(schema, table, if_exists=if_exists)
+        self._touch(table)
+
+    def drop_view(self, schema: str, view: str, if_exists: bool = True) -> None:
+        self.db.drop_view(schema, view, if_exists=if_exists)
+        self._touch(view)
+
+    def create_view(self, schema: str, view: str, select_sql: str, or_replace: bool = True) -> None:
+        self.db.create_view(schema, view, select_sql, or_replace=or_replace)
+        self.cache.register_view(self.alias, view, select_sql)
+        self._touch(view)
+
+    def create_table_from_query(self, create_table_sql: str) -> None:
+        self.db.create_table_from_query(create_table_sql)
+        self._touch(*tables_in(create_table_sql))
+
+    def create_table_from_df(self, df, schema: str, table: str, pk: list[str] | None = None,
+                             if_not_exists: bool = True) -> bool:
+        created = self.db.create_table_from_df(df, schema, table, pk=pk, if_not_exists=if_not_exists)
+        self._touch(table)
+        return created
+
+    def create_table_from_columns(self, schema: str, table: str, columns: list[dict],
+                                  pk: list[str] | None = None, if_not_exists: bool = True) -> bool:
+        created = self.db.create_table_from_columns(schema, table, columns, pk=pk, if_not_exists=if_not_exists)
+        self._touch(table)
+        return created
+
+    def exec_procedure(self, schema: str, proc: str, params: Mapping[str, Any] | None = None,
+                       as_frame: bool = False):
+        # procedure pode escrever em qualquer tabela: invalida o alias
+        res = self.db.exec_procedure(schema, proc, params, as_frame=as_frame)
+        self._touch()
+        return res
+
+    @contextmanager
+    def transaction(self):
+        # leituras dentro da transação não usam o cache (veriam dado não commitado);
+        # escritas invalidam na hora e de novo no commit
+        with self.db.transaction() as tx:
+            inner = _TxCachedDb(tx, self.cache, self.alias)
+            yield inner
+        inner.flush()
+
+class _TxCachedDb(CachedDb):
+    def __init__(self, db: Any, cache: ResultCache, alias: str):
+        super().__init__(db, cache, alias)
+        self._touched: set | None = set()
+
+    def _cached(self, kind, sql, params, tables, load, extra=None, ttl=None):
+        return load()
+
+    def _touch(self, *tables: str) -> None:
+        if self._touched is not None:
+            self._touched = self._touched | set(tables) if tables else None
+        super()._touch(*tables)
+
+    def flush(self) -> None:
+        if self._touched is None or self._touched:
+            self.cache.invalidate(self.alias, None if self._touched is None else frozenset(self._touched))
+
+    @contextmanager
+    def transaction(self):
+        yield self
+
+def with_result_cache(router: Mapping[str, Any], cache: ResultCache | None = None,
+                      ttl: Ttl | None = None) -> Dict[str, CachedDb]:
+    """Envolve cada Db do router (ex.: container_multi.db_router) num CachedDb com um cache comum."""
+    cache = cache or ResultCache()
+    return {alias: CachedDb(db, cache, alias=alias, ttl=ttl) for alias, db in router.items()}
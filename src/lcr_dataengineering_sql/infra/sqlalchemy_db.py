@@ -1,32 +1,163 @@
 from __future__ import annotations
-from typing import Mapping, Any, Iterator
-from contextlib import contextmanager
-import pandas as pd
-from sqlalchemy import text, inspect
-from sqlalchemy.engine import Engine, Connection
+from functools import lru_cache
+from typing import Mapping, Any, Iterator, TYPE_CHECKING
+from contextlib import contextmanager, nullcontext
+if TYPE_CHECKING:  # pandas só carrega quando um DataFrame é pedido (ping/execute não precisam)
+    import pandas as pd
+from sqlalchemy import (Column, MetaData, PrimaryKeyConstraint, Table, and_, column, literal_column,
+                        or_, select, table as table_clause, text)
+from sqlalchemy.sql import Select
+from sqlalchemy.types import Text, TypeEngine
+from sqlalchemy.engine import Engine, Connection, Dialect
+from sqlalchemy.sql.elements import TextClause
 from ..core.ports import Db
+from .bulk_load import bulk_insert
+from .upsert import upsert
+from .metadata_cache import MetadataCache, metadata_cache_for
 
-def _dialect_name(engine: Engine) -> str:
-    return engine.dialect.name  # "mssql" | "postgresql" | "mysql" | ...
+# quantos SQLs distintos manter já parseados em TextClause
+STATEMENT_CACHE_SIZE = 1024
 
-def _quote(engine: Engine, ident: str) -> str:
+@lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def _text(sql: str) -> TextClause:
+    # TextClause é imutável e independe do dialect; a forma compilada por dialect
+    # fica no compiled_cache de cada Engine, que reconhece o mesmo objeto
+    return text(sql)
+
+def _dialect_name(dialect: Dialect) -> str:
+    return dialect.name  # "mssql" | "postgresql" | "mysql" | ...
+
+def _quote(dialect: Dialect, ident: str) -> str:
     # usa o preparer do dialect para quotar corretamente cada banco
-    prep = engine.dialect.identifier_preparer
-    return prep.quote(ident)
+    # (o preparer já memoiza por identificador; o custo era resolver o engine)
+    return dialect.identifier_preparer.quote(ident)
 
-def _fqtn(engine: Engine, schema: str, table: str) -> str:
+def _fqtn(dialect: Dialect, schema: str, table: str) -> str:
     if schema:
-        return f"{_quote(engine, schema)}.{_quote(engine, table)}"
-    return _quote(engine, table)
+        return f"{_quote(dialect, schema)}.{_quote(dialect, table)}"
+    return _quote(dialect, table)
+
+def _portable_type(type_: TypeEngine, dialect: Dialect) -> TypeEngine:
+    # tipo refletido (ex.: mssql.BIT) -> genérico (Boolean) que o dialect alvo saiba compilar;
+    # no mesmo dialect mantém o tipo exato (DATETIME2, TINYINT...)
+    try:
+        generic = type_.as_generic()
+    except NotImplementedError:
+        generic = type_
+    native = type(type_).__module__.startswith(("sqlalchemy.sql", f"sqlalchemy.dialects.{dialect.name}"))
+    for t in ((type_, generic) if native else (generic, type_)):
+        try:
+            t.compile(dialect=dialect)
+            return t
+        except Exception:
+            continue
+    return Text()  # sem equivalente (ex.: VARCHAR sem tamanho no MySQL)
+
+def _table_select(schema: str, table: str, columns: list[str] | None = None,
+                  where: str | None = None, key_columns: list[str] = ()) -> tuple[Select, list]:
+    # SELECT em Core: quoting e LIMIT (TOP / LIMIT / FETCH) ficam a cargo do dialect
+    keys = [column(k) for k in key_columns]
+    t = table_clause(table, *keys, schema=schema or None)
+    cols = [column(c) for c in columns] if columns else [literal_column("*")]
+    stmt = select(*cols).select_from(t)
+    if where:
+        stmt = stmt.where(text(f"({where})"))
+    return stmt, keys
+
+def _select_stmt(schema: str, table: str, columns: list[str] | None = None, where: str | None = None,
+                 order_by: str | None = None, limit: int | None = None) -> Select:
+    stmt, _ = _table_select(schema, table, columns, where)
+    if order_by:
+        stmt = stmt.order_by(text(order_by))
+    return stmt if limit is None else stmt.limit(int(limit))
+
+def _seek_stmt(schema: str, table: str, key_columns: list[str], page_size: int,
+               after: list | tuple | None = None, columns: list[str] | None = None,
+               where: str | None = None) -> Select:
+    """
+    SELECT de uma página por keyset: ORDER BY chaves + (k1, k2, ...) > after, expandido em
+    OR/AND (MSSQL não compara tuplas). O LIMIT sai como TOP / LIMIT / FETCH conforme o dialect.
+    """
+    stmt, keys = _table_select(schema, table, columns, where, key_columns)
+    if after is not None:
+        stmt = stmt.where(or_(*(
+            and_(*(k == v for k, v in zip(keys[:i], after[:i])), keys[i] > after[i])
+            for i in range(len(keys)))))
+    return stmt.order_by(*keys).limit(int(page_size))
+
+def _batches(res, fetch_size: int, as_frame: bool, keep_empty: bool = False) -> Iterator[list[dict] | pd.DataFrame]:
+    import pandas as pd
+    cols = list(res.keys())
+    empty = True
+    for part in res.partitions(fetch_size):
+        empty = False
+        if as_frame:
+            # tuplas direto para o DataFrame, sem criar um dict por linha
+            yield pd.DataFrame.from_records(part, columns=cols)
+        else:
+            yield [dict(zip(cols, row)) for row in part]
+    if empty and keep_empty and as_frame:
+        yield pd.DataFrame(columns=cols)   # resultado sem linhas ainda diz quais são as colunas
+
+def _frame(res, dtype: Mapping[str, Any] | None = None) -> pd.DataFrame:
+    import pandas as pd
+    df = pd.DataFrame.from_records(res.fetchall(), columns=list(res.keys()))
+    return df.astype(dtype) if dtype else df
+
+def _arrow(res, fetch_size: int, schema=None):
+    import pyarrow as pa  # opcional: só quem pede Arrow precisa do pyarrow
+    cols = list(res.keys())
+    batches = []
+    for part in res.partitions(fetch_size):
+        # transpõe as tuplas do cursor em colunas: um array Arrow por coluna
+        arrays = list(zip(*part))
+        if schema is not None:
+            batches.append(pa.RecordBatch.from_arrays(
+                [pa.array(a, type=f.type) for a, f in zip(arrays, schema)], schema=schema))
+        else:
+            batches.append(pa.RecordBatch.from_arrays([pa.array(a) for a in arrays], names=cols))
+    if not batches:
+        if schema is None:
+            schema = pa.schema([(c, pa.null()) for c in cols])
+        return schema.empty_table()
+    if schema is None:
+        # tipos inferidos por lote: coluna só com NULL num lote vem null; permissive promove
+        return pa.concat_tables([pa.Table.from_batches([b]) for b in batches], promote_options="permissive")
+    return pa.Table.from_batches(batches, schema=schema)
 
 class SqlAlchemyDb(Db):
-    def __init__(self, engine_provider: callable[[], Engine]):
+    def __init__(self, engine_provider: callable[[], Engine], metadata_ttl: float = 300.0):
         self._engine_provider = engine_provider
+        self._metadata_ttl = metadata_ttl
+        self._dialect: Dialect | None = None
 
     @property
     def engine(self) -> Engine:
         return self._engine_provider()
 
+    @property
+    def dialect(self) -> Dialect:
+        # resolvido uma vez: o dialect de uma URL não muda, mesmo após dispose do pool
+        if self._dialect is None:
+            self._dialect = self.engine.dialect
+        return self._dialect
+
+    @property
+    def metadata(self) -> MetadataCache:
+        """Cache de reflexão compartilhado por todos os Db do mesmo engine (stats() p/ hit/miss)."""
+        return metadata_cache_for(self.engine, ttl=self._metadata_ttl)
+
+    def _bind(self):
+        # onde rodar a reflexão: engine aqui, a conexão da transação no _TxDb
+        return self.engine
+
+    def _begin(self):
+        # conexão + transação para DDL em vários passos; o _TxDb reaproveita a sua
+        return self.engine.begin()
+
+    def invalidate_metadata(self, schema: str | None = None, name: str | None = None) -> None:
+        self.metadata.invalidate(schema, name)
+
     def ping(self) -> bool:
         """
         Faz um round-trip simples no banco.
@@ -34,7 +165,7 @@ class SqlAlchemyDb(Db):
         """
         try:
             with self.engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+                conn.execute(_text("SELECT 1"))
             return True
         except Exception:
             return False
@@ -42,50 +173,108 @@ class SqlAlchemyDb(Db):
     # -------- básicos --------
     def execute(self, sql: str, params: Mapping[str, Any] | None = None) -> int:
         with self.engine.begin() as conn:
-            res = conn.execute(text(sql), params or {})
+            res = conn.execute(_text(sql), params or {})
             return res.rowcount or 0
 
     def query_all(self, sql: str, params: Mapping[str, Any] | None = None) -> list[dict]:
         with self.engine.connect() as conn:
-            res = conn.execute(text(sql), params or {})
+            res = conn.execute(_text(sql), params or {})
             return res.mappings().all()
 
-    def query_iter(self, sql: str, params: Mapping[str, Any] | None = None) -> Iterator[dict]:
+    def query_iter(self, sql: str, params: Mapping[str, Any] | None = None,
+                   fetch_size: int = 1000) -> Iterator[dict]:
+        # cursor do lado do servidor (stream_results) quando o driver suporta
         conn = self.engine.connect()
         try:
-            res = conn.execute(text(sql), params or {})
+            res = conn.execute(_text(sql), params or {}, execution_options={"yield_per": fetch_size})
             for row in res.mappings():
                 yield row
         finally:
             conn.close()
 
+    def query_batches(self, sql: str, params: Mapping[str, Any] | None = None,
+                      fetch_size: int = 10000, as_frame: bool = False,
+                      keep_empty: bool = False) -> Iterator[list[dict] | pd.DataFrame]:
+        """
+        Um lote por fetch: lista de dicts ou DataFrame (as_frame=True). keep_empty (com
+        as_frame): resultado sem linhas ainda rende um DataFrame vazio com as colunas.
+        """
+        conn = self.engine.connect()
+        try:
+            res = conn.execute(_text(sql), params or {}, execution_options={"yield_per": fetch_size})
+            yield from _batches(res, fetch_size, as_frame, keep_empty)
+        finally:
+            conn.close()
+
+    def query_df(self, sql: str, params: Mapping[str, Any] | None = None,
+                 dtype: Mapping[str, Any] | None = None, chunksize: int | None = None):
+        """DataFrame direto das tuplas do cursor; com chunksize devolve um iterador de DataFrames."""
+        if chunksize:
+            return (df.astype(dtype) if dtype else df
+                    for df in self.query_batches(sql, params, fetch_size=chunksize, as_frame=True))
+        with self.engine.connect() as conn:
+            return _frame(conn.execute(_text(sql), params or {}), dtype)
+
+    def query_arrow(self, sql: str, params: Mapping[str, Any] | None = None,
+                    schema=None, fetch_size: int = 100_000):
+        """pyarrow.Table montada lote a lote; `schema` (pa.Schema) fixa os tipos."""
+        with self.engine.connect() as conn:
+            res = conn.execute(_text(sql), params or {}, execution_options={"yield_per": fetch_size})
+            return _arrow(res, fetch_size, schema)
+
+    def select_table(self, schema: str, table: str, columns: list[str] | None = None,
+                     where: str | None = None, order_by: str | None = None, limit: int | None = None,
+                     params: Mapping[str, Any] | None = None, as_frame: bool = False) -> list[dict] | pd.DataFrame:
+        """SELECT em uma tabela/view com o LIMIT do dialect (TOP no MSSQL, LIMIT no PG/MySQL...)."""
+        stmt = _select_stmt(schema, table, columns, where, order_by, limit)
+        with self.engine.connect() as conn:
+            res = conn.execute(stmt, params or {})
+            return _frame(res) if as_frame else res.mappings().all()
+
+    def seek_page(self, schema: str, table: str, key_columns: list[str], page_size: int,
+                  after: list | tuple | None = None, columns: list[str] | None = None,
+                  where: str | None = None, params: Mapping[str, Any] | None = None,
+                  as_frame: bool = False) -> list[dict] | pd.DataFrame:
+        """Próxima página depois de `after` (valores das key_columns da última linha; None = início)."""
+        stmt = _seek_stmt(schema, table, key_columns, page_size, after, columns, where)
+        with self.engine.connect() as conn:
+            res = conn.execute(stmt, params or {})
+            return _frame(res) if as_frame else res.mappings().all()
+
+    def quote(self, ident: str) -> str:
+        return _quote(self.dialect, ident)
+
+    def fqtn(self, schema: str, table: str) -> str:
+        return _fqtn(self.dialect, schema, table)
+
     # -------- schema / tabela / view / proc --------
     def create_schema(self, schema: str, if_not_exists: bool = True) -> None:
-        d = _dialect_name(self.engine)
+        d = _dialect_name(self.dialect)
         if d == "mssql":
             if if_not_exists:
-                self.execute(f"IF SCHEMA_ID(N'{schema}') IS NULL EXEC('CREATE SCHEMA {_quote(self.engine, schema)}');")
+                self.execute(f"IF SCHEMA_ID(N'{schema}') IS NULL EXEC('CREATE SCHEMA {_quote(self.dialect, schema)}');")
             else:
-                self.execute(f"CREATE SCHEMA {_quote(self.engine, schema)};")
+                self.execute(f"CREATE SCHEMA {_quote(self.dialect, schema)};")
         elif d == "postgresql":
-            self.execute(f"CREATE SCHEMA {'IF NOT EXISTS ' if if_not_exists else ''}{_quote(self.engine, schema)};")
+            self.execute(f"CREATE SCHEMA {'IF NOT EXISTS ' if if_not_exists else ''}{_quote(self.dialect, schema)};")
         elif d == "mysql":
             # em MySQL, schema = database
-            self.execute(f"CREATE DATABASE {'IF NOT EXISTS ' if if_not_exists else ''}{_quote(self.engine, schema)};")
+            self.execute(f"CREATE DATABASE {'IF NOT EXISTS ' if if_not_exists else ''}{_quote(self.dialect, schema)};")
         else:
             raise NotImplementedError(f"create_schema não implementado para {d}")
+        self.invalidate_metadata(schema)
 
     def truncate_table(self, schema: str, table: str) -> None:
-        d = _dialect_name(self.engine)
-        fq = _fqtn(self.engine, schema, table)
+        d = _dialect_name(self.dialect)
+        fq = _fqtn(self.dialect, schema, table)
         if d in ("mssql", "postgresql", "mysql"):
             self.execute(f"TRUNCATE TABLE {fq};")
         else:
             raise NotImplementedError(f"truncate_table não implementado para {d}")
 
     def drop_table(self, schema: str, table: str, if_exists: bool = True) -> None:
-        d = _dialect_name(self.engine)
-        fq = _fqtn(self.engine, schema, table)
+        d = _dialect_name(self.dialect)
+        fq = _fqtn(self.dialect, schema, table)
         if d == "mssql":
             if if_exists:
                 self.execute(f"IF OBJECT_ID(N'{schema}.{table}', N'U') IS NOT NULL DROP TABLE {fq};")
@@ -97,14 +286,23 @@ class SqlAlchemyDb(Db):
             self.execute(f"DROP TABLE {'IF EXISTS ' if if_exists else ''}{fq};")
         else:
             raise NotImplementedError(f"drop_table não implementado para {d}")
+        self.invalidate_metadata(schema, table)
 
     def table_exists(self, schema: str, table: str) -> bool:
-        insp = inspect(self.engine)
-        return insp.has_table(table, schema=schema)
+        return self.metadata.table_exists(self._bind(), schema, table)
+
+    def view_exists(self, schema: str, view: str) -> bool:
+        return self.metadata.view_exists(self._bind(), schema, view)
+
+    def get_columns(self, schema: str, table: str) -> list[dict]:
+        return self.metadata.columns(self._bind(), schema, table)
+
+    def get_pk(self, schema: str, table: str) -> list[str]:
+        return self.metadata.pk(self._bind(), schema, table)
 
     def create_view(self, schema: str, view: str, select_sql: str, or_replace: bool = True) -> None:
-        d = _dialect_name(self.engine)
-        fq = _fqtn(self.engine, schema, view)
+        d = _dialect_name(self.dialect)
+        fq = _fqtn(self.dialect, schema, view)
         if d == "mssql":
             if or_replace:
                 self.execute(f"IF OBJECT_ID(N'{schema}.{view}', N'V') IS NOT NULL DROP VIEW {fq};")
@@ -113,10 +311,11 @@ class SqlAlchemyDb(Db):
             self.execute(f"{'CREATE OR REPLACE' if or_replace else 'CREATE'} VIEW {fq} AS {select_sql};")
         else:
             raise NotImplementedError(f"create_view não implementado para {d}")
+        self.invalidate_metadata(schema, view)
 
     def drop_view(self, schema: str, view: str, if_exists: bool = True) -> None:
-        d = _dialect_name(self.engine)
-        fq = _fqtn(self.engine, schema, view)
+        d = _dialect_name(self.dialect)
+        fq = _fqtn(self.dialect, schema, view)
         if d == "mssql":
             if if_exists:
                 self.execute(f"IF OBJECT_ID(N'{schema}.{view}', N'V') IS NOT NULL DROP VIEW {fq};")
@@ -128,10 +327,11 @@ class SqlAlchemyDb(Db):
             self.execute(f"DROP VIEW {'IF EXISTS ' if if_exists else ''}{fq};")
         else:
             raise NotImplementedError(f"drop_view não implementado para {d}")
+        self.invalidate_metadata(schema, view)
 
     def create_procedure(self, schema: str, proc: str, definition_sql: str, or_alter: bool = True) -> None:
-        d = _dialect_name(self.engine)
-        fq = _fqtn(self.engine, schema, proc)
+        d = _dialect_name(self.dialect)
+        fq = _fqtn(self.dialect, schema, proc)
         if d == "mssql":
             if or_alter:
                 self.execute(f"""
@@ -155,63 +355,93 @@ class SqlAlchemyDb(Db):
         else:
             raise NotImplementedError(f"create_procedure não implementado para {d}")
 
-    def exec_procedure(self, schema: str, proc: str, params: Mapping[str, Any] | None = None) -> list[dict]:
-        d = _dialect_name(self.engine)
+    def exec_procedure(self, schema: str, proc: str, params: Mapping[str, Any] | None = None,
+                       as_frame: bool = False) -> list[dict] | pd.DataFrame:
+        d = _dialect_name(self.dialect)
         params = params or {}
+        query = self.query_df if as_frame else self.query_all
         # monta lista de nomeados "nome=:nome"
         named = ", ".join(f"{k}=:${k}" if d=="postgresql" else f"{k}=:{k.lstrip('@')}" for k in params.keys())
 
         if d == "mssql":
             # EXEC [schema].[proc] @p=:p
-            sql = f"EXEC {_fqtn(self.engine, schema, proc)} {named}" if named else f"EXEC {_fqtn(self.engine, schema, proc)}"
+            sql = f"EXEC {_fqtn(self.dialect, schema, proc)} {named}" if named else f"EXEC {_fqtn(self.dialect, schema, proc)}"
             # tira '@' do dict
             clean = {k.lstrip('@'): v for k, v in params.items()}
-            return self.query_all(sql, clean)
+            return query(sql, clean)
         elif d == "postgresql":
             # CALL schema.proc(:p1,:p2) — em PG os params são posicionais ou nomeados com =>?
             # Usaremos nomeados: CALL sch.proc(p=>:p, x=>:x)
             named_call = ", ".join(f"{k}=>:{k}" for k in params.keys())
-            sql = f"CALL {_fqtn(self.engine, schema, proc)}({named_call});" if params else f"CALL {_fqtn(self.engine, schema, proc)}();"
-            return self.query_all(sql, params)
+            sql = f"CALL {_fqtn(self.dialect, schema, proc)}({named_call});" if params else f"CALL {_fqtn(self.dialect, schema, proc)}();"
+            return query(sql, params)
         elif d == "mysql":
             # CALL schema.proc(:p1,:p2) – nomeados não são padrão; convertemos para posicionais
             if params:
                 placeholders = ", ".join([f":p{i}" for i,_ in enumerate(params, start=1)])
                 ordered = {f"p{i}": v for i, v in enumerate(params.values(), start=1)}
-                sql = f"CALL {_fqtn(self.engine, schema, proc)}({placeholders});"
-                return self.query_all(sql, ordered)
+                sql = f"CALL {_fqtn(self.dialect, schema, proc)}({placeholders});"
+                return query(sql, ordered)
             else:
-                sql = f"CALL {_fqtn(self.engine, schema, proc)}();"
-                return self.query_all(sql)
+                sql = f"CALL {_fqtn(self.dialect, schema, proc)}();"
+                return query(sql)
         else:
             raise NotImplementedError(f"exec_procedure não implementado para {d}")
 
     # -------- criar/ingestar dados --------
     def create_table_from_query(self, create_table_sql: str) -> None:
         self.execute(create_table_sql)
+        self.invalidate_metadata()  # SQL livre: não dá para saber o que mudou
 
     def create_table_from_df(self, df: pd.DataFrame, schema: str, table: str,
                              pk: list[str] | None = None, if_not_exists: bool = True) -> bool:
         if if_not_exists and self.table_exists(schema, table):
             return False
         empty = df.iloc[0:0]
-        with self.engine.begin() as conn:
+        with self._begin() as conn:
             empty.to_sql(name=table, con=conn, schema=schema, if_exists="fail", index=False)
             if pk:
-                fq = _fqtn(self.engine, schema, table)
-                cols = ", ".join(_quote(self.engine, c) for c in pk)
-                d = _dialect_name(self.engine)
+                fq = _fqtn(self.dialect, schema, table)
+                cols = ", ".join(_quote(self.dialect, c) for c in pk)
+                d = _dialect_name(self.dialect)
                 if d in ("mssql", "postgresql", "mysql"):
-                    conn.execute(text(f"ALTER TABLE {fq} ADD CONSTRAINT {_quote(self.engine, 'PK_'+table)} PRIMARY KEY ({cols});"))
+                    conn.execute(_text(f"ALTER TABLE {fq} ADD CONSTRAINT {_quote(self.dialect, 'PK_'+table)} PRIMARY KEY ({cols});"))
                 else:
                     raise NotImplementedError(f"PRIMARY KEY não implementado para {d}")
+        self.invalidate_metadata(schema, table)
         return True
 
-    def insert_df(self, df: pd.DataFrame, schema: str, table: str, chunksize: int = 10000) -> int:
+    def create_table_from_columns(self, schema: str, table: str, columns: list[dict],
+                                  pk: list[str] | None = None, if_not_exists: bool = True) -> bool:
+        """Cria a tabela a partir de colunas refletidas (formato de get_columns), em qualquer dialect."""
+        if if_not_exists and self.table_exists(schema, table):
+            return False
+        # autoincrement=False: PK inteira não vira IDENTITY/SERIAL (os valores vêm da carga)
+        cols = [Column(c["name"], _portable_type(c["type"], self.dialect),
+                       nullable=c.get("nullable", True) and c["name"] not in (pk or []), autoincrement=False)
+                for c in columns]
+        extra = [PrimaryKeyConstraint(*pk)] if pk else []
+        with self._begin() as conn:
+            Table(table, MetaData(), *cols, *extra, schema=schema or None).create(conn)
+        self.invalidate_metadata(schema, table)
+        return True
+
+    def insert_df(self, df: pd.DataFrame, schema: str, table: str, chunksize: int | str = 10000,
+                  strategy: str = "auto") -> int:
+        # strategy: "auto" (COPY/LOAD DATA/array binding conforme o dialect) ou "to_sql"
+        exists = self.table_exists(schema, table)
         with self.engine.begin() as conn:
-            conn = conn.execution_options(fast_executemany=True)
-            df.to_sql(name=table, con=conn, schema=schema, if_exists="append", index=False, chunksize=chunksize)
-            return len(df)
+            n = bulk_insert(conn, df, schema, table, chunksize=chunksize, strategy=strategy,
+                            table_exists=exists)
+        if not exists:
+            self.invalidate_metadata(schema, table)  # to_sql criou a tabela
+        return n
+
+    def upsert_df(self, df: pd.DataFrame, schema: str, table: str, key_columns: list[str],
+                  chunksize: int | str = 10000, strategy: str = "auto") -> tuple[int, int]:
+        # staging + comando set-based numa transação só: as linhas nunca ficam "sumidas"
+        with self._begin() as conn:
+            return upsert(conn, df, schema, table, key_columns, chunksize=chunksize, strategy=strategy)
 
     @contextmanager
     def transaction(self):
@@ -223,20 +453,61 @@ class _TxDb(SqlAlchemyDb):
         super().__init__(engine_provider=lambda: conn.engine)
         self._conn = conn
 
+    def _bind(self):
+        return self._conn
+
+    def _begin(self):
+        return nullcontext(self._conn)
+
     def execute(self, sql: str, params: Mapping[str, Any] | None = None) -> int:
-        res = self._conn.execute(text(sql), params or {})
+        res = self._conn.execute(_text(sql), params or {})
         return res.rowcount or 0
 
     def query_all(self, sql: str, params: Mapping[str, Any] | None = None):
-        res = self._conn.execute(text(sql), params or {})
+        res = self._conn.execute(_text(sql), params or {})
         return res.mappings().all()
 
-    def query_iter(self, sql: str, params: Mapping[str, Any] | None = None):
-        res = self._conn.execute(text(sql), params or {})
+    def query_iter(self, sql: str, params: Mapping[str, Any] | None = None, fetch_size: int = 1000):
+        res = self._conn.execute(_text(sql), params or {}, execution_options={"yield_per": fetch_size})
         for row in res.mappings():
             yield row
 
-    def insert_df(self, df: pd.DataFrame, schema: str, table: str, chunksize: int = 10000) -> int:
-        conn = self._conn.execution_options(fast_executemany=True)
-        df.to_sql(name=table, con=conn, schema=schema, if_exists="append", index=False, chunksize=chunksize)
-        return len(df)
+    def query_batches(self, sql: str, params: Mapping[str, Any] | None = None,
+                      fetch_size: int = 10000, as_frame: bool = False, keep_empty: bool = False):
+        res = self._conn.execute(_text(sql), params or {}, execution_options={"yield_per": fetch_size})
+        yield from _batches(res, fetch_size, as_frame, keep_empty)
+
+    def query_df(self, sql: str, params: Mapping[str, Any] | None = None,
+                 dtype: Mapping[str, Any] | None = None, chunksize: int | None = None):
+        if chunksize:
+            return (df.astype(dtype) if dtype else df
+                    for df in self.query_batches(sql, params, fetch_size=chunksize, as_frame=True))
+        return _frame(self._conn.execute(_text(sql), params or {}), dtype)
+
+    def query_arrow(self, sql: str, params: Mapping[str, Any] | None = None,
+                    schema=None, fetch_size: int = 100_000):
+        res = self._conn.execute(_text(sql), params or {}, execution_options={"yield_per": fetch_size})
+        return _arrow(res, fetch_size, schema)
+
+    def seek_page(self, schema: str, table: str, key_columns: list[str], page_size: int,
+                  after: list | tuple | None = None, columns: list[str] | None = None,
+                  where: str | None = None, params: Mapping[str, Any] | None = None,
+                  as_frame: bool = False):
+        stmt = _seek_stmt(schema, table, key_columns, page_size, after, columns, where)
+        res = self._conn.execute(stmt, params or {})
+        return _frame(res) if as_frame else res.mappings().all()
+
+    def select_table(self, schema: str, table: str, columns: list[str] | None = None,
+                     where: str | None = None, order_by: str | None = None, limit: int | None = None,
+                     params: Mapping[str, Any] | None = None, as_frame: bool = False):
+        res = self._conn.execute(_select_stmt(schema, table, columns, where, order_by, limit), params or {})
+        return _frame(res) if as_frame else res.mappings().all()
+
+    def insert_df(self, df: pd.DataFrame, schema: str, table: str, chunksize: int | str = 10000,
+                  strategy: str = "auto") -> int:
+        exists = self.table_exists(schema, table)
+        n = bulk_insert(self._conn, df, schema, table, chunksize=chunksize, strategy=strategy,
+                        table_exists=exists)
+        if not exists:
+            self.invalidate_metadata(schema, table)
+        return n
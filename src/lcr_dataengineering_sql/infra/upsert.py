@@ -0,0 +1,190 @@
+# src/lcr_dataengineering_sql/infra/upsert.py
+from __future__ import annotations
+import logging
+import uuid
+from typing import TYPE_CHECKING, Callable, Dict, Sequence
+from sqlalchemy.engine import Connection
+from .bulk_load import _LOADERS, _q, _fq, bulk_insert
+if TYPE_CHECKING:
+    import pandas as pd
+
+log = logging.getLogger(__name__)
+
+# (conn, alvo, staging, colunas, chaves) -> (inseridas, atualizadas)
+Merger = Callable[[Connection, str, str, list[str], list[str]], "tuple[int, int]"]
+
+def _on(conn: Connection, keys: Sequence[str], left: str = "t", right: str = "s") -> str:
+    return " AND ".join(f"{left}.{_q(conn, k)} = {right}.{_q(conn, k)}" for k in keys)
+
+def _changed(conn: Connection, cols: Sequence[str]) -> str:
+    # linha casada cujo conteúdo mudou (comparação que trata NULL = NULL)
+    d = conn.dialect.name
+    parts = []
+    for c in cols:
+        t, s = f"t.{_q(conn, c)}", f"s.{_q(conn, c)}"
+        if d == "mysql":
+            parts.append(f"NOT ({t} <=> {s})")
+        elif d == "sqlite":
+            parts.append(f"{t} IS NOT {s}")
+        else:
+            parts.append(f"{t} IS DISTINCT FROM {s}")
+    return " OR ".join(parts) or "1 = 0"
+
+def _precount(conn: Connection, target: str, stg: str, cols: list[str], keys: list[str]) -> tuple[int, int]:
+    # contagem antes do comando: casadas (existentes) e, delas, as que mudam
+    upd = [c for c in cols if c not in keys]
+    row = conn.exec_driver_sql(
+        f"SELECT COUNT(*), COUNT(t.{_q(conn, keys[0])}), "
+        f"COALESCE(SUM(CASE WHEN t.{_q(conn, keys[0])} IS NOT NULL AND ({_changed(conn, upd)}) "
+        f"THEN 1 ELSE 0 END), 0) "
+        f"FROM {stg} s LEFT JOIN {target} t ON {_on(conn, keys)}").one()
+    staged, matched, changed = (int(v or 0) for v in row)
+    return staged - matched, changed
+
+# ------------------- MSSQL: MERGE -------------------
+
+def mssql_merge(conn: Connection, target: str, stg: str, cols: list[str], keys: list[str]) -> tuple[int, int]:
+    upd = [c for c in cols if c not in keys]
+    collist = ", ".join(_q(conn, c) for c in cols)
+    sql = [
+        "SET NOCOUNT ON;",
+        "DECLARE @out TABLE (act NVARCHAR(10));",
+        f"MERGE {target} WITH (HOLDLOCK) AS t USING {stg} AS s ON {_on(conn, keys)}",
+    ]
+    if upd:
+        # EXCEPT compara com NULL-safety e pula linhas iguais (sem escrita/log à toa)
+        sets = ", ".join(f"t.{_q(conn, c)} = s.{_q(conn, c)}" for c in upd)
+        src = ", ".join(f"s.{_q(conn, c)}" for c in upd)
+        dst = ", ".join(f"t.{_q(conn, c)}" for c in upd)
+        sql.append(f"WHEN MATCHED AND EXISTS (SELECT {src} EXCEPT SELECT {dst}) THEN UPDATE SET {sets}")
+    sql += [
+        f"WHEN NOT MATCHED BY TARGET THEN INSERT ({collist}) "
+        f"VALUES ({', '.join('s.' + _q(conn, c) for c in cols)})",
+        "OUTPUT $action INTO @out;",
+        "SELECT COALESCE(SUM(CASE WHEN act = 'INSERT' THEN 1 ELSE 0 END), 0), "
+        "COALESCE(SUM(CASE WHEN act = 'UPDATE' THEN 1 ELSE 0 END), 0) FROM @out;",
+    ]
+    ins, upd_n = conn.exec_driver_sql("\n".join(sql)).one()
+    return int(ins), int(upd_n)
+
+# ------------------- PostgreSQL: INSERT ... ON CONFLICT -------------------
+
+def pg_on_conflict(conn: Connection, target: str, stg: str, cols: list[str], keys: list[str]) -> tuple[int, int]:
+    upd = [c for c in cols if c not in keys]
+    collist = ", ".join(_q(conn, c) for c in cols)
+    if upd:
+        sets = ", ".join(f"{_q(conn, c)} = EXCLUDED.{_q(conn, c)}" for c in upd)
+        dst = ", ".join(f"t.{_q(conn, c)}" for c in upd)
+        src = ", ".join(f"EXCLUDED.{_q(conn, c)}" for c in upd)
+        action = f"DO UPDATE SET {sets} WHERE ROW({dst}) IS DISTINCT FROM ROW({src})"
+    else:
+        action = "DO NOTHING"
+    # xmax = 0 só na linha recém-inserida; linhas iguais não voltam no RETURNING
+    ins, upd_n = conn.exec_driver_sql(
+        f"WITH up AS (INSERT INTO {target} AS t ({collist}) SELECT {collist} FROM {stg} "
+        f"ON CONFLICT ({', '.join(_q(conn, k) for k in keys)}) {action} "
+        "RETURNING (xmax = 0) AS inserted) "
+        "SELECT COUNT(*) FILTER (WHERE inserted), COUNT(*) FILTER (WHERE NOT inserted) FROM up").one()
+    return int(ins), int(upd_n)
+
+# ------------------- MySQL: ON DUPLICATE KEY UPDATE -------------------
+
+def mysql_on_duplicate(conn: Connection, target: str, stg: str, cols: list[str], keys: list[str]) -> tuple[int, int]:
+    # rowcount do MySQL depende de CLIENT_FOUND_ROWS; conta antes, no staging
+    counts = _precount(conn, target, stg, cols, keys)
+    upd = [c for c in cols if c not in keys] or keys[:1]
+    collist = ", ".join(_q(conn, c) for c in cols)
+    sets = ", ".join(f"{_q(conn, c)} = VALUES({_q(conn, c)})" for c in upd)
+    conn.exec_driver_sql(
+        f"INSERT INTO {target} ({collist}) SELECT {collist} FROM {stg} ON DUPLICATE KEY UPDATE {sets}")
+    return counts
+
+# ------------------- SQLite: ON CONFLICT (3.24+) -------------------
+
+def sqlite_on_conflict(conn: Connection, target: str, stg: str, cols: list[str], keys: list[str]) -> tuple[int, int]:
+    counts = _precount(conn, target, stg, cols, keys)
+    upd = [c for c in cols if c not in keys]
+    collist = ", ".join(_q(conn, c) for c in cols)
+    if upd:
+        sets = ", ".join(f"{_q(conn, c)} = excluded.{_q(conn, c)}" for c in upd)
+        changed = " OR ".join(f"{target}.{_q(conn, c)} IS NOT excluded.{_q(conn, c)}" for c in upd)
+        action = f"DO UPDATE SET {sets} WHERE {changed}"
+    else:
+        action = "DO NOTHING"
+    # "WHERE true" desfaz a ambiguidade do parser entre SELECT ... ON e ON CONFLICT
+    conn.exec_driver_sql(
+        f"INSERT INTO {target} ({collist}) SELECT {collist} FROM {stg} WHERE true "
+        f"ON CONFLICT ({', '.join(_q(conn, k) for k in keys)}) {action}")
+    return counts
+
+# ------------------- staging por dialect -------------------
+
+def _create_staging(conn: Connection, target: str, cols: list[str]) -> tuple[str, str]:
+    """Cria a tabela temporária (só as colunas do df, tipos do alvo). Retorna (schema, nome)."""
+    d = conn.dialect.name
+    name = f"stg_{uuid.uuid4().hex[:12]}"
+    collist = ", ".join(_q(conn, c) for c in cols)
+    if d == "mssql":
+        name = "#" + name
+        # UNION ALL tira a propriedade IDENTITY herdada pelo SELECT INTO
+        conn.exec_driver_sql(f"SELECT TOP 0 {collist} INTO {_q(conn, name)} FROM {target} "
+                             f"UNION ALL SELECT TOP 0 {collist} FROM {target}")
+        return "", name
+    if d == "sqlite":
+        conn.exec_driver_sql(f"CREATE TEMP TABLE {_q(conn, name)} AS SELECT {collist} FROM {target} WHERE 0")
+        return "temp", name
+    temp = "TEMPORARY" if d == "mysql" else "TEMP"
+    conn.exec_driver_sql(f"CREATE {temp} TABLE {_q(conn, name)} AS SELECT {collist} FROM {target} WHERE 1 = 0")
+    return "", name
+
+def _drop_staging(conn: Connection, schema: str, name: str) -> None:
+    temp = "TEMPORARY " if conn.dialect.name == "mysql" else ""
+    conn.exec_driver_sql(f"DROP {temp}TABLE {_fq(conn, schema, name)}")
+
+# ------------------- registro -------------------
+
+_MERGERS: Dict[str, Merger] = {
+    "mssql": mssql_merge,
+    "postgresql": pg_on_conflict,
+    "mysql": mysql_on_duplicate,
+    "sqlite": sqlite_on_conflict,
+}
+
+def register_merger(dialect: str, merger: Merger) -> None:
+    _MERGERS[dialect] = merger
+
+def upsert(conn: Connection, df: pd.DataFrame, schema: str, table: str,
+           key_columns: Sequence[str], chunksize: int | str = 10000, strategy: str = "auto") -> tuple[int, int]:
+    """
+    Upsert set-based: df -> staging temporária (mesmo bulk load do insert_df) ->
+    um MERGE / ON CONFLICT / ON DUPLICATE KEY keyed em key_columns.
+    Linhas com a mesma chave no df: vale a última. Retorna (inseridas, atualizadas);
+    linhas idênticas às do alvo não contam como atualizadas.
+    PostgreSQL/MySQL/SQLite exigem PK ou UNIQUE nas key_columns.
+    """
+    merger = _MERGERS.get(conn.dialect.name)
+    if merger is None:
+        raise NotImplementedError(f"upsert não implementado para {conn.dialect.name}")
+    keys = [str(k) for k in key_columns]
+    cols = [str(c) for c in df.columns]
+    missing = [k for k in keys if k not in cols]
+    if not keys or missing:
+        raise ValueError(f"key_columns ausentes no DataFrame: {missing or '(nenhuma informada)'}")
+    if not len(df):
+        return 0, 0
+    df = df.drop_duplicates(subset=keys, keep="last")
+    # to_sql não enxerga a staging temporária (tentaria criá-la): usa o INSERT genérico
+    if strategy == "to_sql" or (strategy == "auto" and conn.dialect.name not in _LOADERS):
+        strategy = "executemany"
+    target = _fq(conn, schema, table)
+    stg_schema, stg = _create_staging(conn, target, cols)
+    try:
+        bulk_insert(conn, df, stg_schema, stg, chunksize=chunksize, strategy=strategy, table_exists=True)
+        return merger(conn, target, _fq(conn, stg_schema, stg), cols, keys)
+    finally:
+        # temporárias de sessão sobreviveriam na conexão devolvida ao pool (no MySQL até ao rollback);
+        # após erro no PostgreSQL a transação abortada já descarta a staging e o DROP falha: só loga
+        try:
+            _drop_staging(conn, stg_schema, stg)
+        except Exception as e:
+            log.warning("staging %s não removida: %s", stg, e)
@@ -0,0 +1,113 @@
+# src/lcr_dataengineering_sql/utils/csv_ranges.py
+from __future__ import annotations
+import codecs
+import io
+import itertools
+import logging
+import mmap
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator
+import pandas as pd
+from .files import read_records
+
+log = logging.getLogger(__name__)
+
+RANGE_BYTES = 16 << 20   # bytes por faixa: cada uma vira um DataFrame (~1 chunk do pipeline)
+_SCAN_BYTES = 64 << 20   # bloco da contagem de aspas (cópia temporária do mmap)
+
+def _count(mm: mmap.mmap, quote: bytes, start: int, end: int) -> int:
+    n = 0
+    for a in range(start, end, _SCAN_BYTES):
+        n += mm[a:min(a + _SCAN_BYTES, end)].count(quote)
+    return n
+
+def _next_boundary(mm: mmap.mmap, pos: int, odd: int, quote: bytes) -> int:
+    # primeira quebra de linha depois de `pos` fora de aspas (odd = aspas abertas em `pos`)
+    while True:
+        nl = mm.find(b"\n", pos)
+        if nl < 0:
+            return len(mm)
+        odd = (odd + mm[pos:nl].count(quote)) % 2
+        if not odd:
+            return nl + 1
+        pos = nl + 1
+
+def record_ranges(path: str, range_bytes: int = RANGE_BYTES, start: int = 0,
+                  quotechar: str = '"') -> tuple[bytes, Iterator[tuple[int, int]]]:
+    """
+    Cabeçalho + faixas [início, fim) de ~range_bytes que começam e terminam em fronteira
+    de registro. A paridade das aspas é contada desde o início dos dados (passada sequencial
+    sobre o mmap, GB/s), então quebra de linha dentro de campo entre aspas nunca vira corte:
+    o resultado é determinístico e igual ao de um parse serial. start: retomar de um offset
+    que já é fronteira (ex.: checkpoint).
+    """
+    quote = quotechar.encode()
+    with open(path, "rb") as f:
+        header = read_records(f, 1, quote)
+    size = os.path.getsize(path)
+
+    def _ranges() -> Iterator[tuple[int, int]]:
+        pos = max(start, len(header))
+        if pos >= size:
+            return
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            while pos < size:
+                target = pos + max(int(range_bytes), 1)
+                end = size if target >= size else _next_boundary(mm, target, _count(mm, quote, pos, target) % 2,
+                                                                  quote)
+                yield pos, end
+                pos = end
+
+    return header, _ranges()
+
+def parse_range(path: str, start: int, end: int, header: bytes, read_options: dict) -> pd.DataFrame:
+    """Parse de uma faixa (roda no processo filho): cabeçalho + bytes da faixa via mmap."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = header + mm[start:end]
+    return pd.read_csv(io.BytesIO(data), **read_options)
+
+def parallel_frames(path: str, processes: int | None = None, range_bytes: int = RANGE_BYTES,
+                    start: int = 0, quotechar: str = '"', **read_options) -> Iterator[tuple[int, pd.DataFrame]]:
+    """
+    Parse do CSV em `processes` processos (padrão: os.cpu_count()), uma faixa de bytes por
+    tarefa. Devolve (offset do fim da faixa, DataFrame) na ordem do arquivo, com no máximo
+    2x processes faixas em voo (memória limitada). Processos "spawn": seguro com as threads
+    do pipeline e igual no Windows; a partida custa ~1 import do pandas por processo, então
+    compensa em arquivos grandes. O spawn reimporta o __main__ do chamador: script sem
+    `if __name__ == "__main__":` quebra o pool, e aí as faixas restantes seguem em parse
+    serial neste processo (mesma ordem e offsets; aviso no log).
+    """
+    encoding = read_options.get("encoding") or "utf-8"
+    if codecs.lookup(encoding).name.startswith(("utf-16", "utf-32")):
+        raise ValueError(f"Parse paralelo não suporta encoding {encoding} (faixas cortadas em bytes).")
+    read_options.setdefault("quotechar", quotechar)
+    processes = max(int(processes or os.cpu_count() or 1), 1)
+    header, ranges = record_ranges(path, range_bytes, start, quotechar)
+    pool = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+    pending: deque = deque()   # (início, fim) ainda não entregues, par a par com futures
+    futures: deque = deque()
+    broken = None
+    try:
+        for a, b in ranges:
+            pending.append((a, b))
+            futures.append(pool.submit(parse_range, path, a, b, header, read_options))
+            if len(pending) >= 2 * processes:
+                yield pending[0][1], futures[0].result()
+                pending.popleft(), futures.popleft()
+        while pending:
+            yield pending[0][1], futures[0].result()
+            pending.popleft(), futures.popleft()
+    except BrokenProcessPool as exc:
+        broken = exc
+    finally:
+        # consumidor parou no meio (erro/cancelamento): descarta o que ainda não começou
+        pool.shutdown(wait=True, cancel_futures=True)
+    if broken is not None:
+        log.warning("parse paralelo indisponível (%s); seguindo em parse serial. Com processos spawn, "
+                    "o script chamador precisa de `if __name__ == \"__main__\":`.", broken)
+        for a, b in itertools.chain(pending, ranges):
+            yield b, parse_range(path, a, b, header, read_options)
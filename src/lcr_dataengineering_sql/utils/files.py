@@ -0,0 +1,80 @@
+# src/lcr_dataengineering_sql/utils/files.py
+from __future__ import annotations
+import hashlib
+import itertools
+import os
+from typing import BinaryIO
+
+class CountingReader:
+    """
+    Envolve um arquivo binário e conta os bytes efetivamente lidos.
+    Aceito pelo pandas como file-like (read/__iter__).
+    """
+    def __init__(self, f: BinaryIO):
+        self._f = f
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        b = self._f.read(size)
+        self.bytes_read += len(b)
+        return b
+
+    def read1(self, size: int = -1) -> bytes:
+        b = self._f.read1(size)
+        self.bytes_read += len(b)
+        return b
+
+    def readinto(self, buf) -> int:
+        n = self._f.readinto(buf)
+        self.bytes_read += n or 0
+        return n
+
+    def readline(self, size: int = -1) -> bytes:
+        b = self._f.readline(size)
+        self.bytes_read += len(b)
+        return b
+
+    def __iter__(self):
+        return iter(self.readline, b"")
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._f.close()
+
+def file_fingerprint(path: str, sample_bytes: int = 1 << 20) -> str:
+    """
+    Identidade barata do arquivo: tamanho + hash do início e do fim (não lê o arquivo
+    inteiro; multi-GB em milissegundos). Append, truncamento ou troca do arquivo mudam o valor.
+    """
+    size = os.path.getsize(path)
+    h = hashlib.sha256(str(size).encode())
+    with open(path, "rb") as f:
+        h.update(f.read(sample_bytes))
+        if size > sample_bytes:
+            f.seek(max(size - sample_bytes, sample_bytes))
+            h.update(f.read(sample_bytes))
+    return f"{size}:{h.hexdigest()[:32]}"
+
+def read_records(f: BinaryIO, n: int, quotechar: bytes = b'"') -> bytes:
+    """
+    Lê `n` linhas do arquivo binário e continua até fechar as aspas: o bloco sempre
+    termina numa fronteira de registro CSV (quebra de linha dentro de campo entre aspas,
+    aspas escapadas como ""). Com quebras dentro de campos o bloco tem menos de `n` registros.
+    """
+    lines = list(itertools.islice(f, max(int(n), 1)))
+    if not lines:
+        return b""
+    block = b"".join(lines)
+    quotes = block.count(quotechar)
+    while quotes % 2:
+        line = f.readline()
+        if not line:
+            break
+        block += line
+        quotes += line.count(quotechar)
+    return block
@@ -2,7 +2,7 @@
 from __future__ import annotations
 import re
 import pandas as pd
-from typing import Dict, Iterable
+from typing import Callable, Dict, Iterable
 
 def _sanitize_identifier(name: str) -> str:
     """
@@ -38,3 +38,17 @@ def rename_df_columns(df: pd.DataFrame, prefix: str) -> pd.DataFrame:
     """
     mapping = build_column_mapping(df.columns, prefix)
     return df.rename(columns=mapping)
+
+def column_renamer(prefix: str) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    """
+    Para chunks do mesmo arquivo: mapping calculado uma vez (no primeiro chunk) e só os
+    rótulos trocados no próprio DF, sem a cópia do df.rename.
+    """
+    mapping: Dict[str, str] = {}
+
+    def _rename(df: pd.DataFrame) -> pd.DataFrame:
+        if not mapping:
+            mapping.update(build_column_mapping(df.columns, prefix))
+        df.columns = [mapping[str(c)] for c in df.columns]
+        return df
+    return _rename
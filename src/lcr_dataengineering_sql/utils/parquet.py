@@ -0,0 +1,143 @@
+# src/lcr_dataengineering_sql/utils/parquet.py
+from __future__ import annotations
+import glob
+import os
+from typing import Iterator, Sequence
+import pandas as pd
+
+def _dataset(path: str):
+    """Arquivo, diretório ou glob (ex.: 'data/*.parquet') como um único dataset."""
+    import pyarrow.dataset as ds  # requer pyarrow
+    if glob.has_magic(path):
+        files = sorted(glob.glob(path, recursive=True))
+        if not files:
+            raise FileNotFoundError(path)
+        return ds.dataset(files, format="parquet")
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    return ds.dataset(path, format="parquet")
+
+def empty_frame(path: str, columns: Sequence[str] | None = None) -> pd.DataFrame:
+    """DataFrame vazio com os tipos do schema Arrow (não lê nenhuma linha)."""
+    import pyarrow as pa
+    schema = _dataset(path).schema
+    if columns:
+        schema = pa.schema([schema.field(c) for c in columns])
+    return schema.empty_table().to_pandas()
+
+def iter_frames(path: str, columns: Sequence[str] | None = None,
+                batch_size: int = 100_000, skip_rows: int = 0) -> Iterator[pd.DataFrame]:
+    """
+    Lê row groups/record batches em sequência; só `columns` são lidas do disco.
+    skip_rows: pula as primeiras linhas (retomada); row groups inteiros são pulados
+    pelos metadados do footer, sem ler nem decodificar.
+    """
+    dataset = _dataset(path)
+    cols = list(columns) if columns else None
+    if skip_rows <= 0:
+        batches = dataset.to_batches(columns=cols, batch_size=batch_size)
+    else:
+        batches = _batches_after(dataset, cols, batch_size, skip_rows)
+    for batch in batches:
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+def _batches_after(dataset, columns: list[str] | None, batch_size: int, skip_rows: int):
+    for fragment in dataset.get_fragments():
+        for rg in fragment.split_by_row_group():
+            n = rg.row_groups[0].num_rows
+            if skip_rows >= n:
+                skip_rows -= n
+                continue
+            for batch in rg.to_batches(schema=dataset.schema, columns=columns, batch_size=batch_size):
+                if skip_rows:
+                    cut = min(skip_rows, batch.num_rows)
+                    batch, skip_rows = batch.slice(cut), skip_rows - cut
+                yield batch
+
+def fingerprint(path: str) -> str:
+    """file_fingerprint de cada arquivo do dataset (arquivo, diretório ou glob), combinado."""
+    import hashlib
+    from .files import file_fingerprint
+    files = _dataset(path).files
+    h = hashlib.sha256()
+    for f in files:
+        h.update(f"{os.path.basename(f)}={file_fingerprint(f, sample_bytes=64 << 10)};".encode())
+    return f"{len(files)}:{h.hexdigest()[:32]}"
+
+def _writer_schema(tables: list, fill_null: bool = True):
+    import pyarrow as pa
+    schema = pa.unify_schemas([t.schema for t in tables], promote_options="permissive")
+    if not fill_null:  # fim dos dados: coluna só com NULL continua tipo null
+        return schema
+    # coluna ainda sem nenhum valor: texto (qualquer tipo que apareça depois converte para string)
+    return pa.schema([f.with_type(pa.string()) if pa.types.is_null(f.type) else f for f in schema],
+                     metadata=schema.metadata)
+
+def write_frames(frames: Iterator[pd.DataFrame], path: str, hold_bytes: int = 256 << 20) -> int:
+    """
+    Grava os DataFrames em um único Parquet, um row group por frame. Retorna linhas.
+    O schema do arquivo é fixado na abertura: enquanto alguma coluna só teve NULL (tipo
+    null no Arrow, ex.: DateofTermination nos primeiros lotes) os lotes ficam retidos, até
+    `hold_bytes` (passando disso, a coluna vira texto); os tipos são unificados
+    (int + float -> float etc.) e os lotes seguintes convertidos para esse schema.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    writer = None
+    held: list = []
+    held_bytes = 0
+    total = 0
+
+    def _cast(tbl):
+        return tbl if tbl.schema.equals(writer.schema) else tbl.select(writer.schema.names).cast(writer.schema)
+
+    try:
+        for df in frames:
+            tbl = pa.Table.from_pandas(df, preserve_index=False)
+            total += len(df)
+            if writer is not None:
+                writer.write_table(_cast(tbl))
+                continue
+            held.append(tbl)
+            held_bytes += tbl.nbytes
+            unified = pa.unify_schemas([t.schema for t in held], promote_options="permissive")
+            if held_bytes < hold_bytes and any(pa.types.is_null(f.type) for f in unified):
+                continue
+            writer = pq.ParquetWriter(path, _writer_schema(held))
+            for t in held:
+                writer.write_table(_cast(t))
+            held = []
+        if held:
+            writer = pq.ParquetWriter(path, _writer_schema(held, fill_null=False))
+            for t in held:
+                writer.write_table(_cast(t))
+    finally:
+        if writer is not None:
+            writer.close()
+    return total
+
+def unify_files(files: Sequence[str]) -> None:
+    """
+    Deixa os arquivos de um diretório com o mesmo schema (pa.unify_schemas permissive):
+    ex.: partição onde a coluna só teve NULL (tipo null) ao lado de outra com timestamp.
+    Só os divergentes são reescritos, row group a row group.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    schemas = [pq.read_schema(f) for f in files]
+    if len(schemas) < 2:
+        return
+    target = pa.unify_schemas(schemas, promote_options="permissive")
+    for f, schema in zip(files, schemas):
+        if schema.equals(target):
+            continue
+        tmp = f + ".tmp"
+        pf = pq.ParquetFile(f)
+        try:
+            with pq.ParquetWriter(tmp, target) as writer:
+                for i in range(pf.num_row_groups):
+                    writer.write_table(pf.read_row_group(i).select(target.names).cast(target))
+        finally:
+            pf.close()
+        os.replace(tmp, f)
@@ -0,0 +1,7 @@
+# src/lcr_dataengineering_sql/utils/scalars.py
+from __future__ import annotations
+from typing import Any
+
+def to_python_scalar(v: Any) -> Any:
+    """numpy/pandas -> python (o que vai como parâmetro do seek e para o JSON)."""
+    return v.item() if hasattr(v, "item") and not isinstance(v, (str, bytes)) else v
@@ -0,0 +1,42 @@
+# tests/test_async_repo.py
+import asyncio
+import threading
+import pandas as pd
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from lcr_dataengineering_sql.features import async_repo
+from lcr_dataengineering_sql.features.async_repo import AsyncRepo
+from lcr_dataengineering_sql.infra.async_sqlalchemy_db import AsyncSqlAlchemyDb
+
+@pytest.fixture
+def hr_csv(tmp_path):
+    path = tmp_path / "hr.csv"
+    pd.DataFrame({"EmpID": range(250), "Employee_Name": [f"n{i}" for i in range(250)]}).to_csv(path, index=False)
+    return str(path)
+
+def test_csv_readers_are_built_off_the_event_loop(hr_csv, tmp_path, monkeypatch):
+    threads = []
+    real = pd.read_csv
+
+    def _read_csv(*args, **kwargs):
+        threads.append(threading.current_thread() is threading.main_thread())
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(async_repo.pd, "read_csv", _read_csv)
+
+    async def _run():
+        eng = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'a.db'}")
+        try:
+            repo = AsyncRepo(AsyncSqlAlchemyDb(lambda: eng))
+            await repo.create_table_from_csv(hr_csv, "", "hr", chunksize=100, sample_rows=100)
+            rows = await repo.insert_csv(hr_csv, "", "hr", chunksize=100)
+            await repo.create_table_from_csv_with_prefix(hr_csv, "", "hr_p", "X")
+            rows += await repo.insert_csv_with_prefix(hr_csv, "", "hr_p", "X", chunksize=100)
+            total = (await repo.db.query_all("SELECT COUNT(*) AS n FROM hr"))[0]["n"]
+            return rows, total
+        finally:
+            await eng.dispose()
+
+    rows, total = asyncio.run(_run())
+    assert rows == 500 and total == 500
+    assert threads and not any(threads)   # nenhum read_csv na thread do event loop
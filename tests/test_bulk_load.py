@@ -0,0 +1,114 @@
+# tests/test_bulk_load.py
+import csv
+import io
+import re
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from lcr_dataengineering_sql.infra import bulk_load
+from lcr_dataengineering_sql.infra.bulk_load import _mysql_frame, _pg_frame, bulk_insert
+from lcr_dataengineering_sql.infra.chunking import AdaptiveChunker
+
+_MYSQL_ESCAPES = {"0": "\0", "b": "\b", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a"}
+
+def _mysql_read(line: str) -> list:
+    # o que o LOAD DATA (ENCLOSED BY '"' ESCAPED BY '\\') faz com cada campo
+    fields = next(csv.reader([line], doublequote=True))
+    return [None if f == "\\N" else re.sub(r"\\(.)", lambda m: _MYSQL_ESCAPES.get(m.group(1), m.group(1)), f)
+            for f in fields]
+
+def test_mysql_frame_round_trips_backslashes():
+    values = ["C:\\x", "\\N", "a\\\\b", "sem barra"]
+    for dtype in ("str", object):
+        df = pd.DataFrame({"p": pd.Series(values, dtype=dtype), "n": range(len(values))})
+        buf = io.StringIO()
+        _mysql_frame(df).to_csv(buf, index=False, header=False, na_rep="\\N", lineterminator="\n")
+        back = [_mysql_read(line)[0] for line in buf.getvalue().splitlines()]
+        assert back == values, dtype
+
+def test_mysql_frame_keeps_nulls_and_casts_bool():
+    df = pd.DataFrame({"p": ["x", None], "b": [True, False]})
+    out = _mysql_frame(df)
+    assert out["b"].dtype == "int8" and out["b"].tolist() == [1, 0]
+    assert out["p"].isna().tolist() == [False, True]
+    assert df["b"].dtype == bool   # não altera o frame do chamador
+
+# ------------------- _pg_frame -------------------
+
+def test_pg_frame_casts_integral_floats_to_int64():
+    df = pd.DataFrame({"i": [1.0, None, 3.0], "f": [0.5, None, 1.0], "n": [np.nan] * 3,
+                       "inf": [np.inf, 1.0, 2.0], "big": [2.0 ** 60, 1.0, None], "s": ["a", "b", None]})
+    out = _pg_frame(df)
+    assert str(out["i"].dtype) == "Int64" and out["i"].tolist()[::2] == [1, 3] and out["i"].isna()[1]
+    for c in ("f", "n", "inf", "big"):
+        assert out[c].dtype == "float64", c
+    assert out["s"].dtype == df["s"].dtype
+    assert df["i"].dtype == "float64"   # não altera o frame do chamador
+
+def test_pg_frame_returns_same_frame_without_casts():
+    df = pd.DataFrame({"a": [1, 2], "f": [0.5, 1.5]})
+    assert _pg_frame(df) is df
+
+def test_pg_frame_copy_text_has_no_decimal_part():
+    buf = io.StringIO()
+    _pg_frame(pd.DataFrame({"a": [1, 2], "b": [None, 3.0]})).to_csv(
+        buf, index=False, header=False, na_rep="\\N", lineterminator="\n")
+    assert buf.getvalue() == "1,\\N\n2,3\n"
+
+# ------------------- bulk_insert (SQLite: caminhos genéricos) -------------------
+
+@pytest.fixture
+def conn():
+    with create_engine("sqlite://").begin() as c:
+        yield c
+
+def _frame(n: int = 1000) -> pd.DataFrame:
+    return pd.DataFrame({"id": range(n), "v": np.linspace(0, 1, n), "s": [f"x{i}" for i in range(n)],
+                         "ts": pd.Timestamp("2024-01-01") + pd.to_timedelta(range(n), "min"),
+                         "opt": [None if i % 3 else i for i in range(n)]})
+
+def _spy(monkeypatch, name: str) -> list:
+    calls, real = [], getattr(bulk_load, name)
+    monkeypatch.setattr(bulk_load, name, lambda *a, **k: calls.append(len(a[1])) or real(*a, **k))
+    return calls
+
+def _count(conn, table: str = "t") -> int:
+    return conn.exec_driver_sql(f"SELECT COUNT(*) FROM {table}").scalar()
+
+def test_auto_without_native_loader_uses_executemany(conn, monkeypatch):
+    conn.exec_driver_sql("CREATE TABLE t (id INTEGER, v REAL, s TEXT, ts TIMESTAMP, opt INTEGER)")
+    executemany, to_sql = _spy(monkeypatch, "executemany_loader"), _spy(monkeypatch, "to_sql_loader")
+    assert bulk_insert(conn, _frame(), "", "t", chunksize=300) == 1000
+    assert executemany == [1000] and to_sql == []
+    assert _count(conn) == 1000
+    assert conn.exec_driver_sql("SELECT COUNT(*) FROM t WHERE opt IS NULL").scalar() == 666
+
+def test_missing_table_falls_back_to_to_sql(conn, monkeypatch):
+    executemany, to_sql = _spy(monkeypatch, "executemany_loader"), _spy(monkeypatch, "to_sql_loader")
+    assert bulk_insert(conn, _frame(10), "", "novo", table_exists=False) == 10
+    assert to_sql == [10] and executemany == []
+    assert _count(conn, "novo") == 10
+
+def test_table_exists_none_checks_catalog(conn, monkeypatch):
+    to_sql = _spy(monkeypatch, "to_sql_loader")
+    bulk_insert(conn, _frame(5), "", "novo")            # não existe: to_sql cria
+    bulk_insert(conn, _frame(5), "", "novo")            # existe: executemany
+    assert to_sql == [5] and _count(conn, "novo") == 10
+
+def test_explicit_strategies(conn):
+    conn.exec_driver_sql("CREATE TABLE t (id INTEGER, v REAL, s TEXT, ts TIMESTAMP, opt INTEGER)")
+    for strategy in ("executemany", "multirow", "to_sql"):
+        bulk_insert(conn, _frame(100), "", "t", chunksize=40, strategy=strategy, table_exists=True)
+    assert _count(conn) == 300
+    with pytest.raises(ValueError):
+        bulk_insert(conn, _frame(1), "", "t", strategy="nao_existe")
+
+def test_chunksize_auto_adapts_and_loads_everything(conn):
+    conn.exec_driver_sql("CREATE TABLE t (id INTEGER, v REAL, s TEXT, ts TIMESTAMP, opt INTEGER)")
+    chunker = AdaptiveChunker(initial=100, min_rows=50, max_rows=2000)
+    assert bulk_insert(conn, _frame(5000), "", "t", chunker=chunker) == 5000
+    # a cauda (lote bem menor que o pedido) não entra no relatório
+    assert len(chunker.report.sizes) > 1 and chunker.report.increases > 0
+    assert bulk_insert(conn, _frame(5000), "", "t", chunksize="auto") == 5000
+    assert _count(conn) == 10000
@@ -0,0 +1,76 @@
+# tests/test_csv_ranges.py
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+import pandas as pd
+import pytest
+from lcr_dataengineering_sql.utils import csv_ranges
+from lcr_dataengineering_sql.utils.csv_ranges import parallel_frames, parse_range, record_ranges
+
+RANGE_BYTES = 256   # faixas pequenas: vários cortes caem perto/dentro de campos entre aspas
+
+@pytest.fixture(scope="module")
+def hr_csv(tmp_path_factory):
+    # Employee_Name com vírgula, aspas escapadas e quebras de linha dentro das aspas
+    names = ["Adinolfi, Wilson  K", 'Ait Sidi, Karthikeyan\n"KK"', "Akinkuolie,\nSarah\r\nJr.", "Alagbe,Trina"]
+    df = pd.DataFrame({
+        "Employee_Name": [f"{names[i % len(names)]} {i}" for i in range(400)],
+        "EmpID": range(10000, 10400),
+        "Notes": ["linha 1\nlinha 2, \"citada\"" if i % 7 == 0 else "ok" for i in range(400)],
+    })
+    path = tmp_path_factory.mktemp("csv") / "hr.csv"
+    df.to_csv(path, index=False)
+    return str(path)
+
+def _concat(frames) -> pd.DataFrame:
+    return pd.concat([df for _, df in frames], ignore_index=True)
+
+def test_ranges_cover_file_on_record_boundaries(hr_csv):
+    header, ranges = record_ranges(hr_csv, RANGE_BYTES)
+    ranges = list(ranges)
+    assert len(ranges) > 10 and ranges[0][0] == len(header)
+    assert all(b == a2 for (_, b), (a2, _) in zip(ranges, ranges[1:]))
+    frames = [(b, parse_range(hr_csv, a, b, header, {})) for a, b in ranges]
+    pd.testing.assert_frame_equal(_concat(frames), pd.read_csv(hr_csv))
+
+def test_parallel_matches_serial_parse(hr_csv):
+    frames = list(parallel_frames(hr_csv, 2, range_bytes=RANGE_BYTES))
+    pd.testing.assert_frame_equal(_concat(frames), pd.read_csv(hr_csv))
+
+def test_resume_from_offset(hr_csv):
+    full = list(parallel_frames(hr_csv, 2, range_bytes=RANGE_BYTES))
+    cut = len(full) // 2
+    start, skipped = full[cut - 1][0], sum(len(df) for _, df in full[:cut])
+    tail = list(parallel_frames(hr_csv, 2, range_bytes=RANGE_BYTES, start=start))
+    assert [b for b, _ in tail] == [b for b, _ in full[cut:]]
+    expected = pd.read_csv(hr_csv).iloc[skipped:].reset_index(drop=True)
+    pd.testing.assert_frame_equal(_concat(tail), expected)
+
+class _BreakingPool:
+    """Pool que entrega `ok` faixas e depois quebra como um spawn sem guarda de __main__."""
+    ok = 3
+
+    def __init__(self, *args, **kwargs):
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        fut: Future = Future()
+        self.submitted += 1
+        if self.submitted <= self.ok:
+            fut.set_result(fn(*args))
+        else:
+            fut.set_exception(BrokenProcessPool("processo filho morreu"))
+        return fut
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+def test_broken_pool_falls_back_to_serial(hr_csv, monkeypatch, caplog):
+    monkeypatch.setattr(csv_ranges, "ProcessPoolExecutor", _BreakingPool)
+    full = list(parallel_frames(hr_csv, 2, range_bytes=RANGE_BYTES))
+    pd.testing.assert_frame_equal(_concat(full), pd.read_csv(hr_csv))
+    assert "parse serial" in caplog.text
+    # retomada pelo fallback também respeita o offset
+    start, skipped = full[4][0], sum(len(df) for _, df in full[:5])
+    tail = list(parallel_frames(hr_csv, 2, range_bytes=RANGE_BYTES, start=start))
+    assert [b for b, _ in tail] == [b for b, _ in full[5:]]
+    pd.testing.assert_frame_equal(_concat(tail), pd.read_csv(hr_csv).iloc[skipped:].reset_index(drop=True))
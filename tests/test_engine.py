@@ -0,0 +1,32 @@
+# tests/test_engine.py
+from sqlalchemy import text
+from lcr_dataengineering_sql import engine
+from lcr_dataengineering_sql.infra import engine_registry, instrumentation
+
+def _sqlite_provider(monkeypatch, tmp_path):
+    url = f"sqlite:///{tmp_path / 'default.db'}"
+    monkeypatch.setattr(engine.DbConfig, "sqlalchemy_url", lambda self: url)
+    # fast_executemany é só do pyodbc
+    monkeypatch.setattr(engine, "get_engine", lambda u, pool, **kw: engine_registry.get_engine(u, pool=pool))
+    monkeypatch.setattr(engine, "_cached", None)
+
+def test_provider_caches_until_dispose_all(monkeypatch, tmp_path):
+    _sqlite_provider(monkeypatch, tmp_path)
+    first = engine.default_engine_provider()
+    assert engine.default_engine_provider() is first
+    engine_registry.dispose_all()
+    again = engine.default_engine_provider()
+    assert again is not first and engine.default_engine_provider() is again
+
+def test_enable_after_first_use_instruments_default_engine(monkeypatch, tmp_path):
+    _sqlite_provider(monkeypatch, tmp_path)
+    with engine.default_engine_provider().connect() as c:
+        c.execute(text("SELECT 1"))
+    instrumentation.enable()
+    try:
+        with engine.default_engine_provider().connect() as c:
+            c.execute(text("SELECT 1"))
+        assert 'alias="default"' in instrumentation.registry.to_prometheus()
+    finally:
+        instrumentation.disable()
+        engine_registry.dispose_all()
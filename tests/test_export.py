@@ -0,0 +1,28 @@
+# tests/test_export.py
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from lcr_dataengineering_sql.features.repo import Repo
+from lcr_dataengineering_sql.infra.sqlalchemy_db import SqlAlchemyDb
+
+@pytest.fixture
+def repo(tmp_path):
+    eng = create_engine(f"sqlite:///{tmp_path / 'export.db'}")
+    db = SqlAlchemyDb(lambda: eng)
+    db.execute("CREATE TABLE t (id INTEGER, nome TEXT, term TIMESTAMP)")
+    db.execute("INSERT INTO t VALUES (1, 'a', NULL), (2, 'b', NULL), (3, 'c', '2024-01-02 00:00:00')")
+    yield Repo(db)
+    eng.dispose()
+
+def test_csv_export_in_batches(repo, tmp_path):
+    path = str(tmp_path / "t.csv")
+    assert repo.export_query("SELECT * FROM t ORDER BY id", path, format="csv", fetch_size=2) == 3
+    df = pd.read_csv(path)
+    assert list(df.columns) == ["id", "nome", "term"] and df["id"].tolist() == [1, 2, 3]
+
+def test_csv_export_without_rows_keeps_header(repo, tmp_path):
+    path = str(tmp_path / "vazio.csv")
+    assert repo.export_query("SELECT id, nome FROM t WHERE id > 99", path, format="csv") == 0
+    with open(path, encoding="utf-8") as f:
+        assert f.read().strip() == "id,nome"
+    assert list(pd.read_csv(path).columns) == ["id", "nome"]
@@ -0,0 +1,14 @@
+# tests/test_import_time.py
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+import check_import_time  # noqa: E402
+
+def test_import_budget_without_heavy_modules():
+    for module in check_import_time.MODULES:
+        results = [check_import_time._measure(module) for _ in range(3)]
+        heavy = set(check_import_time.FORBIDDEN) & results[0][1]
+        assert not heavy, f"{module} importou {sorted(heavy)}"
+        best_ms = min(ms for ms, _ in results)
+        assert best_ms <= 600.0, f"{module}: {best_ms:.0f} ms (orçamento 600 ms)"
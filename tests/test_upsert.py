@@ -0,0 +1,26 @@
+# tests/test_upsert.py
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from lcr_dataengineering_sql.infra.upsert import upsert
+
+def _temp_tables(conn) -> list:
+    return [r[0] for r in conn.exec_driver_sql("SELECT name FROM sqlite_temp_master WHERE type = 'table'")]
+
+def test_upsert_inserts_and_updates_and_drops_staging():
+    eng = create_engine("sqlite://")
+    with eng.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+        conn.exec_driver_sql("INSERT INTO t VALUES (1, 'a'), (2, 'b')")
+        counts = upsert(conn, pd.DataFrame({"id": [2, 3], "v": ["B", "c"]}), "", "t", ["id"])
+        assert counts == (1, 1)
+        assert conn.exec_driver_sql("SELECT id, v FROM t ORDER BY id").all() == [(1, "a"), (2, "B"), (3, "c")]
+        assert _temp_tables(conn) == []
+
+def test_failed_upsert_drops_staging():
+    eng = create_engine("sqlite://")
+    with eng.connect() as conn:
+        conn.exec_driver_sql("CREATE TABLE t (id INTEGER, v TEXT)")   # sem PK: o ON CONFLICT falha
+        with pytest.raises(Exception):
+            upsert(conn, pd.DataFrame({"id": [1], "v": ["a"]}), "", "t", ["id"])
+        assert _temp_tables(conn) == []